@@ -0,0 +1,78 @@
+"""Parser benchmark on a synthetic 50k-line .model.md document.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_parser.py [--lines N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from meta_compiler.compiler.paper import generate_paper
+from meta_compiler.compiler.parser import coverage_metric, extract_section_blocks, parse_document
+
+
+def synthetic_document(n_lines: int) -> str:
+    """Build a document of roughly ``n_lines`` lines cycling through all block types."""
+    section = [
+        "## Section {k}",
+        "",
+        "<!-- depth:technical -->",
+        "Prose describing the quantity $x_{k}$ in some detail.",
+        "More prose, with a second sentence for realism.",
+        "",
+        "$$x_{k} = \\sum_i a_i$$",
+        "",
+        "$$",
+        "y_{k} \\le x_{k}",
+        "$$",
+        "",
+        "```python:validate",
+        'Parameter("p{k}", units="hours", description="Param {k}")',
+        "```",
+        "",
+    ]
+    lines = ["# Synthetic Model", ""]
+    k = 0
+    while len(lines) < n_lines:
+        lines.extend(line.replace("{k}", str(k)) for line in section)
+        k += 1
+    return "\n".join(lines) + "\n"
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=50_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    source = synthetic_document(args.lines)
+    blocks = parse_document(source)
+    last_section = f"Section {(args.lines // 16) - 1}"
+
+    timings = {
+        "parse_document": _best(lambda: parse_document(source), args.repeat),
+        "coverage_metric": _best(lambda: coverage_metric(blocks), args.repeat),
+        "extract_section_blocks": _best(
+            lambda: extract_section_blocks(blocks, last_section), args.repeat),
+        "generate_paper(depth)": _best(
+            lambda: generate_paper(blocks, depth="executive"), args.repeat),
+    }
+
+    print(f"{len(source.splitlines())} lines, {len(blocks)} blocks (best of {args.repeat})")
+    for name, seconds in timings.items():
+        print(f"  {name:24s} {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
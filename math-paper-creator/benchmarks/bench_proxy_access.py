@@ -0,0 +1,106 @@
+"""Constraint evaluation throughput: per-read access logging vs log-once proxies.
+
+Validates a synthetic model whose constraints read three parameters per
+member, then times the numeric evaluation stage alone (fixture setup and
+structural checks excluded) and reports member evaluations per second for:
+
+- "log every read": the previous proxy, which added its name to the access
+  log on every ``__getitem__`` (reproduced by patching ``SymbolProxy``)
+- "log once": the current proxy, which logs its first read and then switches
+  to ``UnloggedSymbolProxy``
+- "no access log": ``orphans=False``, proxies created unlogged
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_proxy_access.py [--members N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from contextlib import contextmanager
+
+from meta_compiler.compiler.executor import _evaluate_numeric, _NumericOptions, execute_blocks
+from meta_compiler.compiler.parser import parse_document
+from meta_compiler.proxy import SymbolProxy
+from meta_compiler.registry import registry
+
+_CONSTRAINTS = 4
+
+
+def model(members: int) -> str:
+    constraints = "\n".join(
+        f'Constraint("c{k}", over="W", '
+        f"expr=lambda i: hours[i] * rate[i] <= cap[i] * {k + 2})"
+        for k in range(_CONSTRAINTS)
+    )
+    return f'''# Benchmark
+
+```python:fixture
+W = [f"w{{i}}" for i in range({members})]
+cap = {{w: 100.0 for w in W}}
+hours = {{w: 40.0 for w in W}}
+rate = {{w: 1.5 for w in W}}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Parameter("hours", index="W", units="hours", description="Hours")
+Parameter("rate", index="W", units="dimensionless", description="Rate")
+{constraints}
+```
+'''
+
+
+@contextmanager
+def log_every_read():
+    def __getitem__(self, key):
+        self._access_log.add(self.name)
+        return self._lookup(key)
+
+    original = SymbolProxy.__getitem__
+    SymbolProxy.__getitem__ = __getitem__
+    try:
+        yield
+    finally:
+        SymbolProxy.__getitem__ = original
+
+
+def best_time(repeat: int, *, logging: bool) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        registry.access_log.clear()
+        registry.set_access_logging(logging)  # re-arm (or disarm) every proxy
+        start = time.perf_counter()
+        errors = _evaluate_numeric(registry, _NumericOptions())
+        best = min(best, time.perf_counter() - start)
+        assert not errors, errors
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--members", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    result = execute_blocks(parse_document(model(args.members)))
+    assert result.passed, result.errors
+    evaluations = args.members * _CONSTRAINTS
+    with log_every_read():
+        legacy = best_time(args.repeat, logging=True)
+    rows = [
+        ("log every read", legacy),
+        ("log once", best_time(args.repeat, logging=True)),
+        ("no access log", best_time(args.repeat, logging=False)),
+    ]
+    print(f"{args.members} members x {_CONSTRAINTS} constraints "
+          f"(3 parameter reads per evaluation), best of {args.repeat}")
+    for label, seconds in rows:
+        print(f"  {label:15s}: {seconds:6.3f}s  {evaluations / seconds / 1e6:5.2f} M evals/s"
+              f"  ({legacy / seconds:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Registry memory benchmark: legacy symbol layout vs slotted, shared layout.
+
+Registers N indexed parameters (plus a handful of sets) into a registry-like
+store and reports the bytes retained, as measured by tracemalloc.
+
+The "legacy" layout reproduces the previous storage: plain frozen
+dataclasses with a per-instance ``__dict__``, a fresh index tuple and unit
+string per symbol, and a separate registration-order list. The "current"
+layout goes through ``Registry.register_parameter``.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_registry_memory.py [--symbols N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+
+from meta_compiler.registry import Registry
+
+_SETS = ("W", "P", "T")
+_UNITS = ("hours", "hours/headcount", "dollars", "dimensionless")
+
+
+@dataclass(frozen=True)
+class _LegacyParameterSymbol:
+    name: str
+    index: tuple[str, ...] | None
+    domain: str
+    units: str
+    description: str
+
+
+def _spec(k: int) -> tuple[str, list[str], str]:
+    # Index lists and unit strings are rebuilt per symbol, as a generator
+    # emitting Parameter(...) calls would produce them.
+    index = list(_SETS[: 1 + k % len(_SETS)])
+    units = "".join(_UNITS[k % len(_UNITS)])
+    return f"p{k}", index, units
+
+
+def legacy_layout(n: int) -> tuple[dict, list]:
+    symbols: dict = {}
+    order: list = []
+    for k in range(n):
+        name, index, units = _spec(k)
+        symbols[name] = _LegacyParameterSymbol(
+            name=name, index=tuple(index), domain="real", units=units, description="",
+        )
+        order.append(name)
+    return symbols, order
+
+
+def current_layout(n: int) -> Registry:
+    reg = Registry()
+    for set_name in _SETS:
+        reg.register_set(set_name, description="")
+    for k in range(n):
+        name, index, units = _spec(k)
+        reg.register_parameter(name, index=index, units=units, description="")
+    return reg
+
+
+def _retained(build, n: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(n)  # noqa: F841 — keep alive while measuring
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--symbols", type=int, default=200_000)
+    args = parser.parse_args()
+
+    legacy = _retained(legacy_layout, args.symbols)
+    current = _retained(current_layout, args.symbols)
+    per = args.symbols or 1
+    print(f"{args.symbols} indexed parameters")
+    print(f"  legacy layout : {legacy / 2**20:8.1f} MiB  ({legacy / per:6.1f} B/symbol)")
+    print(f"  current layout: {current / 2**20:8.1f} MiB  ({current / per:6.1f} B/symbol)")
+    print(f"  saved         : {1 - current / legacy:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
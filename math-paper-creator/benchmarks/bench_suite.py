@@ -0,0 +1,182 @@
+"""Pipeline benchmark suite over synthetic models, with a regression baseline.
+
+Times parse_document, execute_blocks, run_all_checks, check_property and
+generate_report on documents from ``generators.synthetic_model`` for each
+case in ``CASES`` (set size x symbol count x block count x axiom count).
+Each stage reports the best of ``--repeat`` runs. ``PARSER_CASES`` time
+parse_document and parse + coverage_metric (the hook's path) alone on the
+large prose document from ``bench_parser``.
+
+Results are written as JSON (``--output``). ``--check BASELINE`` compares
+against a saved run and exits 1 when a stage is slower than the baseline
+by more than ``--tolerance``. Timings are divided by a fixed pure-Python
+calibration loop timed in the same run, so a baseline recorded on one
+machine stays meaningful on another; stages faster than ``--min-time`` in
+the baseline are too noisy to compare and are skipped. Cases with axioms
+need z3-solver and are skipped without it.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_suite.py [--repeat R] [--case NAME ...]
+    PYTHONPATH=src python3 benchmarks/bench_suite.py --output benchmarks/baseline.json
+    PYTHONPATH=src python3 benchmarks/bench_suite.py --check benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from bench_parser import synthetic_document
+from generators import synthetic_model
+
+from meta_compiler.compiler.executor import execute_blocks
+from meta_compiler.compiler.parser import coverage_metric, parse_document
+from meta_compiler.compiler.report import generate_report
+from meta_compiler.checks import run_all_checks
+from meta_compiler.symbols import AxiomSymbol, PropertySymbol
+from meta_compiler.verification import check_property, z3_available
+
+# name -> synthetic_model parameters
+CASES = {
+    "hook": dict(members=50, symbols=20, blocks=4, axioms=5),
+    "wide-set": dict(members=20_000, symbols=10, blocks=2, axioms=0),
+    "many-symbols": dict(members=20, symbols=500, blocks=50, axioms=0),
+    "many-blocks": dict(members=20, symbols=200, blocks=200, axioms=0),
+    "axioms": dict(members=10, symbols=5, blocks=2, axioms=40),
+}
+
+# name -> bench_parser.synthetic_document line count
+PARSER_CASES = {
+    "parser-50k": 50_000,
+}
+
+STAGES = ("parse_document", "execute_blocks", "run_all_checks",
+          "check_property", "generate_report")
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Best time of a fixed pure-Python workload, the unit for comparisons."""
+    return _best(lambda: sum(i * i % 7 for i in range(200_000)), repeat)
+
+
+def run_case(params: dict, repeat: int) -> dict[str, float]:
+    """Best-of-``repeat`` seconds per stage for one synthetic model."""
+    source = synthetic_model(**params)
+    best = dict.fromkeys(STAGES, float("inf"))
+
+    def lap(stage, fn):
+        start = time.perf_counter()
+        value = fn()
+        best[stage] = min(best[stage], time.perf_counter() - start)
+        return value
+
+    for _ in range(repeat):
+        blocks = lap("parse_document", lambda: parse_document(source))
+        result = lap("execute_blocks", lambda: execute_blocks(blocks, proof_cache=False))
+        if not result.passed:
+            raise SystemExit(f"synthetic model failed validation: {result.errors[:3]}")
+        symbols = result.registry.symbols
+        lap("run_all_checks", lambda: run_all_checks(result.registry))
+        axioms = {n: s.z3_expr for n, s in symbols.items() if isinstance(s, AxiomSymbol)}
+        properties = [s for s in symbols.values() if isinstance(s, PropertySymbol)]
+        lap("check_property", lambda: [
+            check_property({a: axioms[a] for a in p.given}, p.z3_expr) for p in properties
+        ])
+        lap("generate_report", lambda: generate_report(
+            blocks, registry=result.registry, test_result=result))
+    if not params["axioms"]:
+        del best["check_property"]
+    return best
+
+
+def run_parser_case(lines: int, repeat: int) -> dict[str, float]:
+    """Best-of-``repeat`` seconds for parsing (and covering) a large document."""
+    source = synthetic_document(lines)
+    return {
+        "parse_document": _best(lambda: parse_document(source), repeat),
+        "parse+coverage": _best(lambda: coverage_metric(parse_document(source)), repeat),
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_time: float) -> list[str]:
+    """Stages slower than ``baseline`` by more than ``tolerance`` (calibrated)."""
+    regressions = []
+    for case, entry in baseline["cases"].items():
+        if case not in current["cases"]:
+            continue
+        for stage, base_s in entry["stages"].items():
+            now_s = current["cases"][case]["stages"].get(stage)
+            if now_s is None or base_s < min_time:
+                continue
+            ratio = (now_s / current["calibration_s"]) / (base_s / baseline["calibration_s"])
+            if ratio > tolerance:
+                regressions.append(
+                    f"{case}/{stage}: {now_s * 1000:.2f} ms vs {base_s * 1000:.2f} ms "
+                    f"baseline ({ratio:.2f}x calibrated)")
+    return regressions
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--case", action="append", choices=sorted({*CASES, *PARSER_CASES}),
+                    help="Run only this case (repeatable; default: all)")
+    ap.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    ap.add_argument("--check", type=Path, metavar="BASELINE",
+                    help="Exit 1 if any stage regressed against this baseline")
+    ap.add_argument("--tolerance", type=float, default=1.5,
+                    help="Allowed slowdown ratio against the baseline (default: 1.5)")
+    ap.add_argument("--min-time", type=float, default=0.002,
+                    help="Skip baseline stages faster than this many seconds (default: 0.002)")
+    args = ap.parse_args()
+
+    results = {
+        "version": 1,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "calibration_s": calibrate(),
+        "cases": {},
+    }
+    for name in args.case or [*CASES, *PARSER_CASES]:
+        if name in PARSER_CASES:
+            params = {"lines": PARSER_CASES[name]}
+            stages = run_parser_case(params["lines"], args.repeat)
+        else:
+            params = CASES[name]
+            if params["axioms"] and not z3_available():
+                print(f"{name}: skipped (z3-solver not installed)")
+                continue
+            stages = run_case(params, args.repeat)
+        results["cases"][name] = {"params": params, "stages": stages}
+        print(f"{name} ({', '.join(f'{k}={v}' for k, v in params.items())})")
+        for stage, seconds in stages.items():
+            print(f"  {stage:16s} {seconds * 1000:9.2f} ms")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.check:
+        baseline = json.loads(args.check.read_text())
+        regressions = compare(results, baseline, args.tolerance, args.min_time)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.check} (tolerance {args.tolerance:g}x)")
+
+
+if __name__ == "__main__":
+    main()
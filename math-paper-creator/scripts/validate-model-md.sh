@@ -4,6 +4,10 @@
 # Reads PostToolUse JSON from stdin.
 # If the edited file is .model.md, runs the meta-compiler check pipeline.
 # Returns structured JSON feedback to Claude Code.
+#
+# If a validation daemon is running (python -m meta_compiler.cli daemon),
+# the check is delegated to it over a Unix socket; otherwise validation
+# runs in-process if the hook's time budget still allows a full check.
 
 # Find the meta-compiler package relative to this script
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -44,21 +48,28 @@ if not file_path_obj.is_file():
 # Add meta-compiler src to path
 sys.path.insert(0, str(project_dir / "src"))
 
-from meta_compiler.compiler import check_document
-from meta_compiler.compiler.parser import parse_document, coverage_metric
-
-source = file_path_obj.read_text()
+from meta_compiler.daemon import check_within
 
-# Run validation in authoring mode (orphans are warnings, not errors)
-result = check_document(source, strict=False)
-
-# Check coverage
-blocks = parse_document(source)
-cov = coverage_metric(blocks)
+# Run validation in authoring mode (orphans are warnings, not errors).
+# Prefer the warm daemon; fall back to in-process validation if the hook's
+# time budget still allows a full check.
+result = check_within(file_path_obj, strict=False)
+if result is None:
+    print(json.dumps({
+        "hookSpecificOutput": {
+            "hookEventName": "PostToolUse",
+            "additionalContext": (
+                f"WARNING: validation of {file_path} was skipped: the check did not "
+                "finish within the hook's time limit. Run /check to validate it."
+            ),
+        }
+    }))
+    sys.exit(0)
+cov = result["coverage"]
 
-if not result.passed:
+if not result["passed"]:
     # Validation failed — block with error details
-    errors = "; ".join(result.errors)
+    errors = "; ".join(result["errors"])
     output = {
         "decision": "block",
         "reason": f"Validation failed for {file_path}: {errors}",
@@ -72,16 +83,20 @@ else:
     # Validation passed — collect warnings and coverage info
     context_parts = []
 
-    if cov.total_math > 0 and cov.covered_math < cov.total_math:
-        uncovered = cov.total_math - cov.covered_math
-        sections = ", ".join(cov.uncovered_sections) if cov.uncovered_sections else "unknown"
+    if cov["total_math"] > 0 and cov["covered_math"] < cov["total_math"]:
+        uncovered = cov["total_math"] - cov["covered_math"]
+        sections = ", ".join(
+            f'{sc["section"] or "untitled"} ({sc["covered_math"]}/{sc["total_math"]} covered)'
+            for sc in cov["sections"]
+            if sc["covered_math"] < sc["total_math"]
+        ) or "unknown"
         context_parts.append(
             f"WARNING: {uncovered} math blocks have no validation block. "
             f"Unvalidated sections: {sections}"
         )
 
-    if result.warnings:
-        context_parts.extend(result.warnings)
+    if result["warnings"]:
+        context_parts.extend(result["warnings"])
 
     if context_parts:
         output = {
@@ -1,11 +1,11 @@
 """Meta-compiler: Symbol registry and validation engine for mathematical models."""
 
-from meta_compiler.registry import registry
+from meta_compiler.registry import current_registry, registry, use_registry  # noqa: F401
 
 
 def Set(name: str, *, description: str = "") -> "SymbolProxy":
     """Declare an index set."""
-    return registry.register_set(name, description=description)
+    return current_registry().register_set(name, description=description)
 
 
 def Parameter(
@@ -17,7 +17,7 @@ def Parameter(
     description: str = "",
 ) -> "SymbolProxy":
     """Declare a parameter."""
-    return registry.register_parameter(name, index=index, domain=domain, units=units, description=description)
+    return current_registry().register_parameter(name, index=index, domain=domain, units=units, description=description)
 
 
 def Variable(
@@ -30,7 +30,7 @@ def Variable(
     description: str = "",
 ) -> "SymbolProxy":
     """Declare a decision variable."""
-    return registry.register_variable(name, index=index, domain=domain, bounds=bounds, units=units, description=description)
+    return current_registry().register_variable(name, index=index, domain=domain, bounds=bounds, units=units, description=description)
 
 
 def Expression(
@@ -42,7 +42,7 @@ def Expression(
     description: str = "",
 ) -> "SymbolProxy":
     """Declare a derived expression."""
-    return registry.register_expression(name, definition=definition, index=index, units=units, description=description)
+    return current_registry().register_expression(name, definition=definition, index=index, units=units, description=description)
 
 
 def Constraint(
@@ -54,7 +54,7 @@ def Constraint(
     description: str = "",
 ) -> None:
     """Declare a constraint."""
-    registry.register_constraint(name, expr=expr, over=over, constraint_type=type, description=description)
+    current_registry().register_constraint(name, expr=expr, over=over, constraint_type=type, description=description)
 
 
 def Objective(
@@ -65,7 +65,7 @@ def Objective(
     description: str = "",
 ) -> None:
     """Declare an objective."""
-    registry.register_objective(name, expr=expr, sense=sense, description=description)
+    current_registry().register_objective(name, expr=expr, sense=sense, description=description)
 
 
 def Axiom(
@@ -76,7 +76,7 @@ def Axiom(
     description: str = "",
 ) -> None:
     """Declare a foundational axiom."""
-    registry.register_axiom(name, statement=statement, z3_expr=z3_expr, description=description)
+    current_registry().register_axiom(name, statement=statement, z3_expr=z3_expr, description=description)
 
 
 def Property(
@@ -88,9 +88,9 @@ def Property(
     description: str = "",
 ) -> None:
     """Declare a derived property."""
-    registry.register_property(name, claim=claim, z3_expr=z3_expr, given=given, description=description)
+    current_registry().register_property(name, claim=claim, z3_expr=z3_expr, given=given, description=description)
 
 
 def S(name: str):
     """Return the members of a registered set for iteration."""
-    return registry.s(name)
+    return current_registry().s(name)
@@ -0,0 +1,200 @@
+"""Per-run cache of source text, name tokens, and parsed ASTs for callables.
+
+Phantom/orphan detection, cycle detection, unit-boundary checks, tolerance
+checks and the report's dependency graph all need the source of the same
+expression callables. Without a cache every check re-tokenizes and re-parses
+that source once per symbol.
+
+``SourceAnalysis`` resolves each callable's source once (keyed by callable
+identity) and tokenizes/parses each distinct source text once (keyed by the
+text), so callables sharing a block share the work. One instance lives on
+the registry and is cleared by ``Registry.reset()``.
+
+``BlockSource`` compiles a validate block from its AST under a unique
+filename so that callables defined in it can be mapped back to their own
+``Lambda``/``FunctionDef`` node. The registry records that node (and its
+source segment) on each callable, so checks see only the names the
+callable itself uses rather than every name in its block. Names of helper
+functions defined in the same block are followed, so a constraint that
+calls ``used(i)`` also references whatever ``used`` reads.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import io
+import itertools
+import textwrap
+import tokenize
+from typing import Any, Callable
+
+_block_ids = itertools.count(1)
+_FUNCTION_NODES = (ast.Lambda, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class BlockSource:
+    """A validate block parsed once and compiled under a unique filename."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.filename = f"<validate-block-{next(_block_ids)}>"
+        # Parse under exec()'s default name so syntax errors read as before
+        self.tree = ast.parse(text, "<string>")
+        self._by_line: dict[int, list[ast.AST]] | None = None
+        self._functions: dict[str, list[ast.AST]] | None = None
+
+    def compile(self):
+        return compile(self.tree, self.filename, "exec")
+
+    def locate(self, fn: Callable) -> ast.AST | None:
+        """The Lambda/FunctionDef node that defined ``fn``, if it came from this block.
+
+        Candidates start on ``co_firstlineno``; when several do (nested or
+        side-by-side lambdas), the innermost one whose span covers every
+        source position of ``fn``'s bytecode is chosen.
+        """
+        code = getattr(fn, "__code__", None)
+        if code is None or code.co_filename != self.filename:
+            return None
+        if self._by_line is None:
+            self._by_line = {}
+            for node in ast.walk(self.tree):
+                if isinstance(node, _FUNCTION_NODES):
+                    first = min([node.lineno] + [d.lineno for d in getattr(
+                        node, "decorator_list", [])])
+                    self._by_line.setdefault(first, []).append(node)
+        candidates = self._by_line.get(code.co_firstlineno, [])
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        bounds = _code_bounds(code)
+        if bounds is None:
+            return None
+        start, end = bounds
+        covering = [
+            node for node in candidates
+            if (node.lineno, node.col_offset) <= start
+            and (node.end_lineno, node.end_col_offset) >= end
+        ]
+        if not covering:
+            return None
+        return max(covering, key=lambda node: (node.lineno, node.col_offset))
+
+    def names(self, node: ast.AST) -> frozenset[str]:
+        """Name ids in ``node`` and, transitively, in the block's functions it names."""
+        if self._functions is None:
+            self._functions = {}
+            for fn_node in ast.walk(self.tree):
+                if isinstance(fn_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    self._functions.setdefault(fn_node.name, []).append(fn_node)
+        found: set[str] = set()
+        pending, seen = [node], set()
+        while pending:
+            current = pending.pop()
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            own = {n.id for n in ast.walk(current) if isinstance(n, ast.Name)}
+            found |= own
+            for name in own:
+                pending.extend(self._functions.get(name, ()))
+        return frozenset(found)
+
+    def segment(self, node: ast.AST) -> str:
+        return ast.get_source_segment(self.text, node, padded=True) or ""
+
+
+def _code_bounds(code) -> tuple[tuple[int, int], tuple[int, int]] | None:
+    """(start, end) source positions spanned by ``code``'s instructions."""
+    positions = getattr(code, "co_positions", None)  # Python 3.11+
+    if positions is None:
+        return None
+    spans = [
+        ((line, col), (end_line, end_col))
+        for line, end_line, col, end_col in positions()
+        if None not in (line, end_line, col, end_col)
+        and (line, col) != (end_line, end_col)
+    ]
+    if not spans:
+        return None
+    return min(s for s, _ in spans), max(e for _, e in spans)
+
+
+class SourceAnalysis:
+    """Memoized source lookups shared by every check in one validation run."""
+
+    def __init__(self) -> None:
+        # id(fn) -> (fn, source); fn is kept alive so its id is not reused
+        self._sources: dict[int, tuple[Callable, str]] = {}
+        self._names: dict[str, frozenset[str]] = {}
+        self._trees: dict[str, ast.Module | None] = {}
+        self._node_names: dict[int, tuple[ast.AST, frozenset[str]]] = {}
+
+    def clear(self) -> None:
+        self._sources.clear()
+        self._names.clear()
+        self._trees.clear()
+        self._node_names.clear()
+
+    def source(self, fn: Callable) -> str:
+        """Source text of ``fn``: ``_source_text`` if recorded, else ``inspect.getsource``."""
+        entry = self._sources.get(id(fn))
+        if entry is not None and entry[0] is fn:
+            return entry[1]
+        text = getattr(fn, "_source_text", None)
+        if text is None:
+            try:
+                text = inspect.getsource(fn)
+            except (OSError, TypeError):
+                text = ""
+        self._sources[id(fn)] = (fn, text)
+        return text
+
+    def names(self, fn: Callable) -> frozenset[str]:
+        """Names used by ``fn``: its node's (and helpers') Name ids, else every NAME token."""
+        node = getattr(fn, "_source_node", None)
+        if node is None:
+            return self.text_names(self.source(fn))
+        entry = self._node_names.get(id(node))
+        if entry is None or entry[0] is not node:
+            entry = self._node_names[id(node)] = (node, fn._source_block.names(node))
+        return entry[1]
+
+    def text_names(self, text: str) -> frozenset[str]:
+        """Every NAME token in ``text``, up to the first tokenize error."""
+        names = self._names.get(text)
+        if names is None:
+            names = self._names[text] = _tokenize_names(text)
+        return names
+
+    def tree(self, fn: Callable) -> ast.AST | None:
+        """AST of ``fn``: its own node, else its parsed source (None if unparseable)."""
+        node = getattr(fn, "_source_node", None)
+        if node is not None:
+            return node
+        return self.text_tree(self.source(fn))
+
+    def text_tree(self, text: str) -> ast.Module | None:
+        if text in self._trees:
+            return self._trees[text]
+        tree: Any = None
+        if text:
+            try:
+                tree = ast.parse(textwrap.dedent(text))
+            except SyntaxError:
+                tree = None
+        self._trees[text] = tree
+        return tree
+
+
+def _tokenize_names(text: str) -> frozenset[str]:
+    found: set[str] = set()
+    if not text:
+        return frozenset()
+    try:
+        for tok_type, tok_string, *_ in tokenize.generate_tokens(io.StringIO(text).readline):
+            if tok_type == tokenize.NAME:
+                found.add(tok_string)
+    except (tokenize.TokenError, SyntaxError):
+        pass  # partial source is OK — best-effort
+    return frozenset(found)
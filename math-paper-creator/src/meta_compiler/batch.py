@@ -0,0 +1,156 @@
+"""Batch validation of many .model.md files in one warm interpreter.
+
+``check`` used to take one file per invocation, so validating a directory
+of models paid interpreter start-up and the meta_compiler/numpy/z3 import
+cost once per file. ``check_files`` validates a list of files over a pool
+of forked worker processes. Workers inherit the already-imported modules
+and are reused across files. Each file is validated in a fresh registry
+bound with ``use_registry()``, so documents never see each other's symbols.
+Results come back in input order as plain ``FileResult`` records.
+
+``expand_paths`` turns the command line into a file list: directories are
+searched recursively for ``*.model.md`` and quoted glob patterns are
+expanded (``**`` matches across directories). ``write_junit`` and
+``write_json`` render the results for CI.
+
+Usage:
+    python -m meta_compiler.cli check a.model.md b.model.md [--workers N]
+    python -m meta_compiler.cli check models/ --junit report.xml --json report.json
+    python -m meta_compiler.cli check "models/**/*.model.md"
+"""
+
+from __future__ import annotations
+
+import functools
+import glob
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from xml.etree import ElementTree
+
+
+@dataclass
+class FileResult:
+    """Outcome of validating one file."""
+    path: str
+    passed: bool
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    duration_s: float = 0.0
+
+
+def expand_paths(patterns: list[str | Path]) -> list[Path]:
+    """Files named by ``patterns``: paths, directories and globs, deduplicated.
+
+    Paths that don't exist are kept, so reading them reports an error for
+    that file instead of silently dropping it.
+    """
+    paths: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(path.rglob("*.model.md")))
+        elif any(c in str(pattern) for c in "*?["):
+            paths.extend(Path(p) for p in sorted(glob.glob(str(pattern), recursive=True)))
+        else:
+            paths.append(path)
+    return list(dict.fromkeys(paths))
+
+
+def check_files(paths: list[Path], *, workers: int = 1, **options) -> list[FileResult]:
+    """Validate each file with ``check_document(**options)``, in input order.
+
+    With ``workers > 1`` files are spread over that many forked processes
+    (serially where ``fork`` is unavailable). ``options`` are passed to every
+    ``check_document`` call, so ``jobs > 1`` still parallelizes constraints
+    within each file.
+    """
+    # Import before forking so every worker starts warm
+    import meta_compiler.compiler  # noqa: F401
+    from meta_compiler.verification import z3_available
+    z3_available()
+
+    check = functools.partial(_check_one, options=options)
+    if workers <= 1 or len(paths) < 2 or not _can_fork():
+        return [check(path) for path in paths]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(paths)),
+        mp_context=multiprocessing.get_context("fork"),
+    ) as pool:
+        return list(pool.map(check, paths))
+
+
+def _can_fork() -> bool:
+    import multiprocessing
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _check_one(path: Path, *, options: dict) -> FileResult:
+    """Validate one file; read failures and crashes become errors for that file."""
+    from meta_compiler.compiler import check_document
+    from meta_compiler.fixtures import use_data_dir
+    from meta_compiler.registry import use_registry
+
+    start = time.perf_counter()
+    try:
+        with use_registry(), use_data_dir(Path(path).parent):
+            result = check_document(Path(path).read_text(), **options)
+    except Exception as e:
+        return FileResult(str(path), False, errors=[f"{type(e).__name__}: {e}"],
+                          duration_s=time.perf_counter() - start)
+    return FileResult(str(path), result.passed, errors=list(result.errors),
+                      warnings=list(result.warnings),
+                      duration_s=time.perf_counter() - start)
+
+
+def summarize(results: list[FileResult]) -> dict:
+    """Counts and total time over a batch."""
+    passed = sum(r.passed for r in results)
+    return {
+        "files": len(results),
+        "passed": passed,
+        "failed": len(results) - passed,
+        "errors": sum(len(r.errors) for r in results),
+        "warnings": sum(len(r.warnings) for r in results),
+        "duration_s": sum(r.duration_s for r in results),
+    }
+
+
+def write_json(results: list[FileResult], path: Path) -> None:
+    report = {"summary": summarize(results), "files": [asdict(r) for r in results]}
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+def write_junit(results: list[FileResult], path: Path) -> None:
+    """One ``<testcase>`` per file; errors become its ``<failure>``, warnings its output."""
+    summary = summarize(results)
+    suites = ElementTree.Element("testsuites")
+    suite = ElementTree.SubElement(suites, "testsuite", {
+        "name": "meta-compiler check",
+        "tests": str(summary["files"]),
+        "failures": str(summary["failed"]),
+        "errors": "0",
+        "time": f"{summary['duration_s']:.3f}",
+    })
+    for r in results:
+        case = ElementTree.SubElement(suite, "testcase", {
+            "classname": "meta-compiler.check",
+            "name": r.path,
+            "time": f"{r.duration_s:.3f}",
+        })
+        if not r.passed:
+            failure = ElementTree.SubElement(case, "failure", {
+                "message": r.errors[0] if r.errors else "failed",
+            })
+            failure.text = "\n".join(r.errors)
+        if r.warnings:
+            ElementTree.SubElement(case, "system-out").text = "\n".join(
+                f"WARNING: {w}" for w in r.warnings)
+    tree = ElementTree.ElementTree(suites)
+    ElementTree.indent(tree)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,166 @@
+"""Content-addressed cache of compile outputs.
+
+``compile`` and ``paper --output`` used to re-execute the whole document on
+every run. ``BuildCache`` keeps what a successful build produced in a
+``.build-cache`` directory next to the outputs:
+
+- ``objects/<sha256>`` holds artifact contents, stored once per content;
+- ``<key>.json`` maps each artifact name to its object. It also records
+  the size and modification time of every data file the fixture loaded
+  (``load_npy``, ``load_npz``, ``load_csv``).
+
+The key hashes the source text, the build target and the options that
+change its outputs (depth, strict, whether validation ran), together with
+the meta_compiler version, a fingerprint of its installed modules and the
+installed z3-solver version (proof results and warnings depend on whether
+z3 is available). A change to any of these misses the cache. So does an edit to a recorded data
+file. Fixture code that reads files by other means is not tracked; pass
+``--no-build-cache`` for such documents.
+
+Only successful builds are cached, so a hit also means validation passed.
+The cache is best-effort: an unreadable or unwritable cache directory
+just means a rebuild.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Manifests kept per cache directory; older ones and their objects are pruned
+_MAX_MANIFESTS = 16
+
+
+class BuildCache:
+    """Artifacts of previous builds, keyed by ``BuildCache.key``."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(source: str, *, target: str, **options) -> str:
+        """Hash of everything a build's outputs depend on, data files aside."""
+        payload = json.dumps({
+            "source": hashlib.sha256(source.encode()).hexdigest(),
+            "target": target,
+            "options": options,
+            "meta_compiler": _code_version(),
+            "z3": _z3_version(),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, str] | None:
+        """Artifact name -> contents for ``key``, or None if stale or missing."""
+        try:
+            manifest = json.loads((self.directory / f"{key}.json").read_text())
+            if any(_stat(Path(path)) != stat for path, stat in manifest["inputs"].items()):
+                return None
+            return {
+                name: (self.directory / "objects" / digest).read_text()
+                for name, digest in manifest["artifacts"].items()
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, artifacts: dict[str, str],
+            data_files: list[Path] | None = None) -> None:
+        """Store ``artifacts`` under ``key`` with the data files they were built from."""
+        objects = self.directory / "objects"
+        manifest = {"artifacts": {}, "inputs": {}}
+        try:
+            objects.mkdir(parents=True, exist_ok=True)
+            for name, text in artifacts.items():
+                digest = hashlib.sha256(text.encode()).hexdigest()
+                if not (objects / digest).exists():
+                    _write_atomic(objects / digest, text)
+                manifest["artifacts"][name] = digest
+            for path in data_files or ():
+                manifest["inputs"][str(path)] = _stat(Path(path))
+            _write_atomic(self.directory / f"{key}.json", json.dumps(manifest, indent=2))
+            self._prune()
+        except OSError:
+            pass  # an unwritable cache only costs the rebuild
+
+    def _prune(self) -> None:
+        """Keep the newest manifests and the objects they reference."""
+        manifests = sorted(self.directory.glob("*.json"),
+                           key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in manifests[_MAX_MANIFESTS:]:
+            stale.unlink(missing_ok=True)
+        live = set()
+        for path in manifests[:_MAX_MANIFESTS]:
+            try:
+                live.update(json.loads(path.read_text())["artifacts"].values())
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+        for obj in (self.directory / "objects").iterdir():
+            if obj.name not in live:
+                obj.unlink(missing_ok=True)
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` to ``path`` unless it already holds it; True if written.
+
+    Leaving identical files untouched keeps their modification times, so
+    tools that watch the outputs see no change on a cache hit.
+    """
+    try:
+        if path.read_text() == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(text)
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _code_version() -> str:
+    """The package version plus a fingerprint of meta_compiler's modules.
+
+    The fingerprint (module paths, sizes and modification times) catches
+    edits to an uninstalled or editable checkout, where the version alone
+    would not change.
+    """
+    from importlib import metadata
+
+    try:
+        version = metadata.version("meta-compiler")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    root = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        st = path.stat()
+        digest.update(f"{path.relative_to(root)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+
+@functools.lru_cache(maxsize=1)
+def _z3_version() -> str | None:
+    """The installed z3-solver version, or None without z3."""
+    import importlib.util
+    from importlib import metadata
+
+    if importlib.util.find_spec("z3") is None:
+        return None
+    try:
+        return metadata.version("z3-solver")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
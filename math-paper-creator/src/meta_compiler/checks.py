@@ -3,7 +3,7 @@
 v2 checks use:
 - Access logs (numeric mode) or tokenized source scanning (structural mode)
   for orphan/phantom detection
-- Registration-order dependency graph for cycle detection
+- The registry's DependencyGraph (Tarjan SCC) for cycle detection
 - Declared unit comparison at constraint boundaries for unit checks
 """
 
@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import ast
 import io
-import inspect
 import re
 import textwrap
 import tokenize
@@ -20,6 +19,7 @@ from typing import TYPE_CHECKING
 from meta_compiler.compiler.parser import Block, ProseBlock
 
 from meta_compiler.symbols import (
+    unit_of,
     AxiomSymbol,
     ConstraintSymbol, ExpressionSymbol, ObjectiveSymbol,
     PropertySymbol,
@@ -27,13 +27,18 @@ from meta_compiler.symbols import (
 )
 
 if TYPE_CHECKING:
+    from meta_compiler.analysis import SourceAnalysis
     from meta_compiler.registry import Registry
 
 
 def run_all_checks(
-    registry: "Registry", *, strict: bool = False
+    registry: "Registry", *, strict: bool = False, orphans: bool = True
 ) -> "TestResult":
-    """Run all integrity checks. Returns TestResult."""
+    """Run all integrity checks. Returns TestResult.
+
+    ``orphans=False`` skips orphan detection (callers that turned off
+    access logging have no log to check against).
+    """
     from meta_compiler.registry import TestResult
 
     errors: list[str] = []
@@ -49,7 +54,7 @@ def run_all_checks(
     # checking entirely — scalar models have no indexed cross-references,
     # so every symbol would be flagged as an orphan (pure noise).
     has_sets = any(isinstance(s, SetSymbol) for s in registry.symbols.values())
-    if has_sets:
+    if has_sets and orphans:
         _check_orphans(registry, all_accessed, errors, warnings, strict)
     _check_cycles(registry, errors)
     _check_unit_boundaries(registry, errors)
@@ -117,7 +122,7 @@ def _check_orphans(
 
 
 def _check_cycles(registry: "Registry", errors: list[str]):
-    """Circular dependencies in expression definitions via DFS."""
+    """Circular dependencies among expression definitions (Tarjan SCC)."""
     expr_names = {
         name for name, sym in registry.symbols.items()
         if isinstance(sym, ExpressionSymbol)
@@ -125,70 +130,32 @@ def _check_cycles(registry: "Registry", errors: list[str]):
     if not expr_names:
         return
 
-    adj: dict[str, set[str]] = {name: set() for name in expr_names}
-    for name in expr_names:
-        sym = registry.symbols[name]
-        if sym.expr is not None:
-            refs = _extract_names_from_source(sym.expr, registry)
-            adj[name] = (refs & expr_names) - {name}  # exclude self-references
-
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color = {name: WHITE for name in expr_names}
-    path: list[str] = []
-
-    def dfs(node: str) -> bool:
-        color[node] = GRAY
-        path.append(node)
-        for neighbor in adj[node]:
-            if color[neighbor] == GRAY:
-                cycle = path[path.index(neighbor):]
-                errors.append(
-                    f"Cycle detected: {' -> '.join(cycle)} -> {neighbor}"
-                )
-                return True
-            if color[neighbor] == WHITE and dfs(neighbor):
-                return True
-        path.pop()
-        color[node] = BLACK
-        return False
-
-    for name in expr_names:
-        if color[name] == WHITE:
-            dfs(name)
+    for cycle in registry.dependency_graph.cycles(within=expr_names):
+        errors.append(f"Cycle detected: {' -> '.join(cycle)}")
 
 
 def _extract_names_from_source(fn, registry: "Registry") -> set[str]:
-    """Extract symbol names from a callable's source using tokenize."""
-    try:
-        source = inspect.getsource(fn)
-    except (OSError, TypeError):
-        source = getattr(fn, "_source_text", "")
-        if not source:
-            return set()
-
-    registered = set(registry.symbols.keys())
-    found: set[str] = set()
-
-    try:
-        tokens = tokenize.generate_tokens(io.StringIO(source).readline)
-        for tok_type, tok_string, _, _, _ in tokens:
-            if tok_type == tokenize.NAME and tok_string in registered:
-                found.add(tok_string)
-    except tokenize.TokenizeError:
-        pass
-
-    return found
+    """Extract registered symbol names from a callable's source using tokenize."""
+    return set(registry.analysis.names(fn) & registry.symbols.keys())
 
 
 def collect_scalar_refs(
-    block_source: str, scalar_names: set[str], access_log: set[str]
+    block_source: str,
+    scalar_names: set[str],
+    access_log: set[str],
+    *,
+    analysis: "SourceAnalysis | None" = None,
 ) -> None:
     """Add scalar symbol names found in block_source to access_log.
 
-    Uses Python's tokenizer to avoid substring false positives.
+    Uses Python's tokenizer to avoid substring false positives. With an
+    ``analysis`` cache the block's tokens are shared with later checks.
     """
     if not scalar_names:
         return
+    if analysis is not None:
+        access_log |= analysis.text_names(block_source) & scalar_names
+        return
     try:
         tokens = tokenize.generate_tokens(io.StringIO(block_source).readline)
         for tok_type, tok_string, *_ in tokens:
@@ -198,6 +165,16 @@ def collect_scalar_refs(
         pass  # partial source is OK — best-effort
 
 
+def _int_constant(node: ast.expr) -> int | None:
+    """Value of an integer literal such as ``2`` or ``-1``, else None."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _int_constant(node.operand)
+        return None if value is None else -value
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    return None
+
+
 def _check_unit_boundaries(registry: "Registry", errors: list[str]):
     """Check unit compatibility at constraint boundaries using AST-based dimensional analysis.
 
@@ -207,7 +184,7 @@ def _check_unit_boundaries(registry: "Registry", errors: list[str]):
     and division combine units algebraically.
     """
     from meta_compiler.units import (
-        parse_unit, units_compatible, units_multiply, units_divide,
+        parse_unit, units_compatible, units_multiply, units_divide, units_power,
     )
 
     dimensionless = parse_unit("dimensionless")
@@ -218,17 +195,9 @@ def _check_unit_boundaries(registry: "Registry", errors: list[str]):
         if sym.expr is None:
             continue
 
-        # --- obtain source & parse AST ---
-        try:
-            source = inspect.getsource(sym.expr)
-        except (OSError, TypeError):
-            source = getattr(sym.expr, "_source_text", "")
-            if not source:
-                continue
-
-        try:
-            tree = ast.parse(textwrap.dedent(source))
-        except SyntaxError:
+        # --- obtain parsed AST (shared per run) ---
+        tree = registry.analysis.tree(sym.expr)
+        if tree is None:
             continue
 
         # --- build name -> Unit map ---
@@ -238,7 +207,7 @@ def _check_unit_boundaries(registry: "Registry", errors: list[str]):
             if ref_sym is None:
                 continue
             if isinstance(ref_sym, (ParameterSymbol, VariableSymbol)):
-                unit_map[ref_name] = parse_unit(ref_sym.units)
+                unit_map[ref_name] = unit_of(ref_sym.units)
 
         # --- recursive unit inference ---
         local_errors: list[str] = []
@@ -272,7 +241,11 @@ def _check_unit_boundaries(registry: "Registry", errors: list[str]):
                     return units_multiply(left, right)
                 if isinstance(node.op, (ast.Div, ast.FloorDiv)):
                     return units_divide(left, right)
-                # Pow, Mod, etc. — conservative
+                if isinstance(node.op, ast.Pow):
+                    exponent = _int_constant(node.right)
+                    if exponent is not None:
+                        return units_power(left, exponent)
+                # Mod, non-integer powers, etc. — conservative
                 return dimensionless
 
             if isinstance(node, ast.Compare):
@@ -393,14 +366,11 @@ def check_constraint_tolerance(registry: "Registry") -> list[str]:
         if sym.expr is None:
             continue
 
-        try:
-            source = inspect.getsource(sym.expr)
-        except (OSError, TypeError):
-            source = getattr(sym.expr, "_source_text", "")
-            if not source:
-                continue
+        tree = registry.analysis.tree(sym.expr)
+        if tree is None:
+            continue
 
-        offsets = _find_arithmetic_offsets(source)
+        offsets = _arithmetic_offsets_in_tree(tree)
         for offset_val in offsets:
             if abs(offset_val) > _TOLERANCE_THRESHOLD:
                 warnings.append(
@@ -413,12 +383,15 @@ def check_constraint_tolerance(registry: "Registry") -> list[str]:
 
 def _find_arithmetic_offsets(source: str) -> list[float]:
     """Find numeric literals used as +/- offsets in comparison expressions."""
-    offsets: list[float] = []
     try:
         tree = ast.parse(textwrap.dedent(source))
     except SyntaxError:
-        return offsets
+        return []
+    return _arithmetic_offsets_in_tree(tree)
 
+
+def _arithmetic_offsets_in_tree(tree: ast.AST) -> list[float]:
+    offsets: list[float] = []
     for node in ast.walk(tree):
         if not isinstance(node, ast.Compare):
             continue
@@ -1,21 +1,64 @@
 """CLI entry point for the meta-compiler.
 
 Usage:
-    python -m meta_compiler.cli check <file.model.md>
+    python -m meta_compiler.cli check <file.model.md> [--vectorize] [--jobs N]
+        [--max-violations K] [--sample N [--seed S]]
+        [--proof-timeout SECONDS] [--proof-deadline SECONDS]
+    python -m meta_compiler.cli check <file|dir|glob>... [--workers N]
+        [--junit <report.xml>] [--json <report.json>]
     python -m meta_compiler.cli paper <file.model.md> [--depth executive|technical|appendix]
+        [--output <file>] [--no-build-cache]
     python -m meta_compiler.cli report <file.model.md>
-    python -m meta_compiler.cli compile <file.model.md> [--output <dir>]
+    python -m meta_compiler.cli compile <file.model.md> [--output <dir>] [--jobs N]
+        [--no-build-cache]
     python -m meta_compiler.cli reconcile <file.model.md> [--section "<heading>"]
-    python -m meta_compiler.cli verify <file.model.md>
+    python -m meta_compiler.cli verify <file.model.md> [--jobs N]
+        [--proof-timeout SECONDS] [--proof-deadline SECONDS]
+    python -m meta_compiler.cli daemon [--socket <path>] [--idle-timeout <seconds>]
+
+Every subcommand accepts ``--profile <trace.json>`` (per-phase, per-block
+and per-constraint wall/CPU time and peak memory; see
+``meta_compiler.profiling``) and ``--cprofile <out.pstats>``.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return n
+
+
+def _positive_float(value: str) -> float:
+    x = float(value)
+    if not x > 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value}")
+    return x
+
+
+def _add_proof_limits(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument("--proof-timeout", type=_positive_float, default=None,
+                           metavar="SECONDS",
+                           help="Give up on a single Z3 check after SECONDS")
+    subparser.add_argument("--proof-deadline", type=_positive_float, default=None,
+                           metavar="SECONDS",
+                           help="Stop all Z3 checks after SECONDS; unfinished "
+                                "ones are reported as timed out")
+
+
+def _add_build_cache(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument("--no-build-cache", action="store_true",
+                           help="Rebuild even if the source and options are unchanged "
+                                "since the last build")
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         prog="meta-compiler",
@@ -23,14 +66,54 @@ def main(argv: list[str] | None = None) -> int:
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
+    # Options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", type=Path, default=None, metavar="PATH",
+                        help="Write a JSON timing trace (phases, blocks, "
+                             "constraints, proofs) to PATH")
+    common.add_argument("--cprofile", type=Path, default=None, metavar="PATH",
+                        help="Write cProfile statistics to PATH (pstats format)")
+
     # check
-    check_parser = subparsers.add_parser("check", help="Validate a .model.md document")
-    check_parser.add_argument("file", type=Path, help="Path to .model.md file")
+    check_parser = subparsers.add_parser("check", parents=[common],
+                                         help="Validate .model.md documents")
+    check_parser.add_argument("files", type=Path, nargs="+", metavar="file",
+                              help="Path to a .model.md file, a directory to search "
+                                   "recursively, or a quoted glob pattern")
     check_parser.add_argument("--strict", action="store_true",
                               help="Treat orphans as errors")
+    check_parser.add_argument("--vectorize", action="store_true",
+                              help="Evaluate per-member constraints with NumPy arrays")
+    check_parser.add_argument("--jobs", type=_positive_int, default=1, metavar="N",
+                              help="Evaluate constraints in N worker processes")
+    check_parser.add_argument("--max-violations", type=_positive_int, default=None,
+                              metavar="K",
+                              help="List at most K violations per constraint, "
+                                   "then report the total")
+    check_parser.add_argument("--sample", type=_positive_int, default=None, metavar="N",
+                              help="Check per-member constraints on a stratified "
+                                   "sample of N members per set")
+    check_parser.add_argument("--seed", type=int, default=0,
+                              help="Seed for --sample (default: 0)")
+    check_parser.add_argument("--no-orphans", action="store_true",
+                              help="Skip orphan detection and symbol access logging")
+    check_parser.add_argument("--optimize", action="store_true",
+                              help="Solve each objective as an LP/MILP (needs scipy) "
+                                   "and report the fixture's gap to the optimum")
+    check_parser.add_argument("--no-proof-cache", action="store_true",
+                              help="Re-run every Z3 proof instead of reusing cached results")
+    _add_proof_limits(check_parser)
+    check_parser.add_argument("--workers", type=_positive_int, default=os.cpu_count() or 1,
+                              metavar="N",
+                              help="Validate up to N files at once (default: CPU count)")
+    check_parser.add_argument("--junit", type=Path, default=None, metavar="PATH",
+                              help="Write a JUnit XML report with one test case per file")
+    check_parser.add_argument("--json", type=Path, default=None, metavar="PATH",
+                              help="Write a JSON report with per-file results")
 
     # paper
-    paper_parser = subparsers.add_parser("paper", help="Generate paper artifact")
+    paper_parser = subparsers.add_parser("paper", parents=[common],
+                                         help="Generate paper artifact")
     paper_parser.add_argument("file", type=Path, help="Path to .model.md file")
     paper_parser.add_argument("--depth", choices=["executive", "technical", "appendix"],
                               help="Depth filter for paper output")
@@ -43,9 +126,11 @@ def main(argv: list[str] | None = None) -> int:
         "--skip-validation", action="store_true",
         help="Generate paper without running validation",
     )
+    _add_build_cache(paper_parser)
 
     # report
-    report_parser = subparsers.add_parser("report", help="Generate validation report")
+    report_parser = subparsers.add_parser("report", parents=[common],
+                                          help="Generate validation report")
     report_parser.add_argument("file", type=Path, help="Path to .model.md file")
     report_parser.add_argument("--output", type=Path, help="Output file path")
     report_parser.add_argument(
@@ -54,7 +139,8 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     # compile
-    compile_parser = subparsers.add_parser("compile", help="Generate all artifacts")
+    compile_parser = subparsers.add_parser("compile", parents=[common],
+                                           help="Generate all artifacts")
     compile_parser.add_argument("file", type=Path, help="Path to .model.md file")
     compile_parser.add_argument("--output", type=Path, default=Path("output"),
                                 help="Output directory (default: output/)")
@@ -64,10 +150,17 @@ def main(argv: list[str] | None = None) -> int:
         "--no-strict", action="store_true",
         help="Treat orphan symbols as warnings instead of errors",
     )
+    compile_parser.add_argument("--vectorize", action="store_true",
+                                help="Evaluate per-member constraints with NumPy arrays")
+    compile_parser.add_argument("--jobs", type=_positive_int, default=1, metavar="N",
+                                help="Evaluate constraints in N worker processes")
+    compile_parser.add_argument("--no-proof-cache", action="store_true",
+                                help="Re-run every Z3 proof instead of reusing cached results")
+    _add_build_cache(compile_parser)
 
     # reconcile
     reconcile_parser = subparsers.add_parser(
-        "reconcile", help="Run prose-math reconciliation checks"
+        "reconcile", parents=[common], help="Run prose-math reconciliation checks"
     )
     reconcile_parser.add_argument("file", type=Path, help="Path to .model.md file")
     reconcile_parser.add_argument(
@@ -76,63 +169,187 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     # verify
-    verify_parser = subparsers.add_parser("verify", help="Run Z3 axiom verification")
+    verify_parser = subparsers.add_parser("verify", parents=[common],
+                                          help="Run Z3 axiom verification")
     verify_parser.add_argument("file", type=Path, help="Path to .model.md file")
+    verify_parser.add_argument("--no-proof-cache", action="store_true",
+                               help="Re-run every Z3 proof instead of reusing cached results")
+    verify_parser.add_argument("--jobs", type=_positive_int, default=1, metavar="N",
+                               help="Run Z3 checks in N worker processes")
+    _add_proof_limits(verify_parser)
+
+    # daemon
+    daemon_parser = subparsers.add_parser(
+        "daemon", parents=[common],
+        help="Run a warm validation server for the PostToolUse hook",
+    )
+    daemon_parser.add_argument("--socket", type=Path, default=None,
+                               help="Unix socket path (default: $META_COMPILER_SOCKET "
+                                    "or a per-user runtime path)")
+    daemon_parser.add_argument("--idle-timeout", type=float, default=None,
+                               help="Exit after this many seconds without requests")
 
     args = parser.parse_args(argv)
-    source = args.file.read_text()
+    if args.profile is None and args.cprofile is None:
+        return _dispatch(args)
+    return _profiled(args)
 
+
+def _profiled(args: argparse.Namespace) -> int:
+    """Run the subcommand under the profiler and/or cProfile, then write the traces."""
+    from meta_compiler.profiling import profile
+
+    with profile(args.command) as profiler:
+        if args.cprofile is None:
+            code = _dispatch(args)
+        else:
+            import cProfile
+
+            stats = cProfile.Profile()
+            try:
+                code = stats.runcall(_dispatch, args)
+            finally:
+                stats.dump_stats(str(args.cprofile))
+    if args.profile is not None:
+        profiler.write(args.profile)
+    return code
+
+
+def _dispatch(args: argparse.Namespace) -> int:
+    from meta_compiler.fixtures import use_data_dir
+
+    if args.command == "daemon":
+        return _cmd_daemon(socket_path=args.socket, idle_timeout=args.idle_timeout)
     if args.command == "check":
-        return _cmd_check(source, strict=args.strict)
-    elif args.command == "paper":
+        options = dict(strict=args.strict, vectorize=args.vectorize,
+                       jobs=args.jobs, max_violations=args.max_violations,
+                       sample=args.sample, seed=args.seed,
+                       orphans=not args.no_orphans, optimize=args.optimize,
+                       proof_cache=not args.no_proof_cache,
+                       proof_timeout=args.proof_timeout,
+                       proof_deadline=args.proof_deadline)
+        # One plain file keeps the single-document output
+        if (len(args.files) == 1 and args.files[0].is_file()
+                and args.junit is None and args.json is None):
+            with use_data_dir(args.files[0].parent):
+                return _cmd_check(args.files[0].read_text(), **options)
+        return _cmd_check_files(args.files, workers=args.workers, junit=args.junit,
+                                json_path=args.json, **options)
+    source = args.file.read_text()
+    with use_data_dir(args.file.parent):
+        return _dispatch_file(args, source)
+
+
+def _dispatch_file(args: argparse.Namespace, source: str) -> int:
+    if args.command == "paper":
         return _cmd_paper(source, depth=args.depth, output=args.output,
                           strict=not args.no_strict,
-                          skip_validation=args.skip_validation)
+                          skip_validation=args.skip_validation,
+                          build_cache=not args.no_build_cache)
     elif args.command == "report":
         return _cmd_report(source, output=args.output, strict=not args.no_strict)
     elif args.command == "compile":
         return _cmd_compile(source, output=args.output, depth=args.depth,
-                            strict=not args.no_strict)
+                            strict=not args.no_strict, vectorize=args.vectorize,
+                            jobs=args.jobs, proof_cache=not args.no_proof_cache,
+                            build_cache=not args.no_build_cache)
     elif args.command == "reconcile":
         return _cmd_reconcile(source, section=args.section)
     elif args.command == "verify":
-        return _cmd_verify(source)
+        return _cmd_verify(source, proof_cache=not args.no_proof_cache, jobs=args.jobs,
+                           proof_timeout=args.proof_timeout,
+                           proof_deadline=args.proof_deadline)
     return 1
 
 
-def _cmd_check(source: str, *, strict: bool = False) -> int:
+def _cmd_check(source: str, *, strict: bool = False, vectorize: bool = False,
+               jobs: int = 1, max_violations: int | None = None,
+               sample: int | None = None, seed: int = 0, orphans: bool = True,
+               optimize: bool = False, proof_cache: bool = True,
+               proof_timeout: float | None = None,
+               proof_deadline: float | None = None) -> int:
     from meta_compiler.compiler import check_document
 
-    result = check_document(source, strict=strict)
+    result = check_document(source, strict=strict, vectorize=vectorize, jobs=jobs,
+                            max_violations=max_violations, sample=sample, seed=seed,
+                            orphans=orphans, optimize=optimize, proof_cache=proof_cache,
+                            proof_timeout=proof_timeout, proof_deadline=proof_deadline)
     if result.passed:
         print("PASSED")
         for w in result.warnings:
             print(f"  WARNING: {w}")
-        return 0
     else:
         print("FAILED")
         for e in result.errors:
             print(f"  ERROR: {e}")
         for w in result.warnings:
             print(f"  WARNING: {w}")
+    for r in result.optimization:
+        if r.optimum is None:
+            continue
+        line = f'  OPTIMUM: {r.sense} "{r.objective}" = {r.optimum:.6g}'
+        if r.status == "limit":
+            line += " (solver limit reached)"
+        if r.gap is not None:
+            line += f" — fixture {r.fixture_value:.6g}, gap {r.gap:.2%}"
+        print(line)
+    return 0 if result.passed else 1
+
+
+def _cmd_check_files(patterns: list[Path], *, workers: int, junit: Path | None,
+                     json_path: Path | None, **options) -> int:
+    from meta_compiler.batch import check_files, expand_paths, summarize, write_json, write_junit
+
+    paths = expand_paths(patterns)
+    if not paths:
+        print("No .model.md files found", file=sys.stderr)
         return 1
+    results = check_files(paths, workers=workers, **options)
+    for r in results:
+        print(f"{'PASSED' if r.passed else 'FAILED'} {r.path} ({r.duration_s:.2f}s)")
+        for e in r.errors:
+            print(f"  ERROR: {e}")
+        for w in r.warnings:
+            print(f"  WARNING: {w}")
+    summary = summarize(results)
+    print(f"{summary['files']} files: {summary['passed']} passed, "
+          f"{summary['failed']} failed")
+    if junit is not None:
+        write_junit(results, junit)
+    if json_path is not None:
+        write_json(results, json_path)
+    return 0 if summary["failed"] == 0 else 1
 
 
 def _cmd_paper(source: str, *, depth: str | None, output: Path | None,
-               strict: bool = True, skip_validation: bool = False) -> int:
-    from meta_compiler.compiler import compile_document
-
-    try:
-        artifacts = compile_document(source, depth=depth, strict=strict,
-                                     skip_validation=skip_validation)
-    except (ValueError, RuntimeError) as e:
-        print(str(e), file=sys.stderr)
-        return 1
+               strict: bool = True, skip_validation: bool = False,
+               build_cache: bool = True) -> int:
+    from meta_compiler.build_cache import BuildCache, write_if_changed
+
+    # Cached only when written to a file, beside it
+    cache = BuildCache(output.parent / ".build-cache") if output and build_cache else None
+    key = BuildCache.key(source, target="paper", depth=depth,
+                         strict=None if skip_validation else strict,
+                         validated=not skip_validation)
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        paper = cached["paper.md"]
+    else:
+        from meta_compiler.compiler import compile_document
+
+        try:
+            artifacts = compile_document(source, depth=depth, strict=strict,
+                                         skip_validation=skip_validation)
+        except (ValueError, RuntimeError) as e:
+            print(str(e), file=sys.stderr)
+            return 1
+        paper = artifacts["paper"]
+        if cache:
+            cache.put(key, {"paper.md": paper}, artifacts["data_files"])
 
-    paper = artifacts["paper"]
     if output:
-        output.write_text(paper)
-        print(f"Paper written to {output}")
+        write_if_changed(output, paper)
+        print(f"Paper written to {output}" + (" (from build cache)" if cached else ""))
     else:
         print(paper)
     return 0
@@ -157,21 +374,36 @@ def _cmd_report(source: str, *, output: Path | None, strict: bool = True) -> int
 
 
 def _cmd_compile(source: str, *, output: Path, depth: str | None,
-                 strict: bool = True) -> int:
-    from meta_compiler.compiler import compile_document
-
-    try:
-        artifacts = compile_document(source, depth=depth, strict=strict)
-    except (ValueError, RuntimeError) as e:
-        print(str(e), file=sys.stderr)
-        return 1
+                 strict: bool = True, vectorize: bool = False, jobs: int = 1,
+                 proof_cache: bool = True, build_cache: bool = True) -> int:
+    from meta_compiler.build_cache import BuildCache, write_if_changed
+
+    cache = BuildCache(output / ".build-cache") if build_cache else None
+    key = BuildCache.key(source, target="compile", depth=depth, strict=strict)
+    files = cached = cache.get(key) if cache else None
+    if files is None:
+        from meta_compiler.compiler import compile_document
+
+        try:
+            artifacts = compile_document(source, depth=depth, strict=strict,
+                                         vectorize=vectorize, jobs=jobs,
+                                         proof_cache=proof_cache)
+        except (ValueError, RuntimeError) as e:
+            print(str(e), file=sys.stderr)
+            return 1
+        files = {
+            "paper.md": artifacts["paper"],
+            "runner.py": artifacts["runner"],
+            "report.txt": artifacts["report_text"],
+        }
+        if cache:
+            cache.put(key, files, artifacts["data_files"])
 
     output.mkdir(parents=True, exist_ok=True)
-    (output / "paper.md").write_text(artifacts["paper"])
-    (output / "runner.py").write_text(artifacts["runner"])
-    (output / "report.txt").write_text(artifacts["report_text"])
+    for name, text in files.items():
+        write_if_changed(output / name, text)
 
-    print(f"Artifacts written to {output}/")
+    print(f"Artifacts written to {output}/" + (" (from build cache)" if cached else ""))
     print("  paper.md")
     print("  runner.py")
     print("  report.txt")
@@ -192,7 +424,10 @@ def _cmd_reconcile(source: str, *, section: str | None) -> int:
         return 0
 
 
-def _cmd_verify(source: str) -> int:
+def _cmd_verify(source: str, *, proof_cache: bool = True, jobs: int = 1,
+                proof_timeout: float | None = None,
+                proof_deadline: float | None = None) -> int:
+    from meta_compiler import profiling
     from meta_compiler.compiler.parser import parse_document
     from meta_compiler.compiler.executor import execute_blocks
     from meta_compiler.verification import z3_available
@@ -202,8 +437,10 @@ def _cmd_verify(source: str) -> int:
               file=sys.stderr)
         return 1
 
-    blocks = parse_document(source)
-    result = execute_blocks(blocks)
+    with profiling.span("phase", "parse"):
+        blocks = parse_document(source)
+    result = execute_blocks(blocks, proof_cache=proof_cache, jobs=jobs,
+                            proof_timeout=proof_timeout, proof_deadline=proof_deadline)
 
     # Extract axiom/property info from registry
     from meta_compiler.symbols import AxiomSymbol, PropertySymbol
@@ -222,6 +459,8 @@ def _cmd_verify(source: str) -> int:
 
     print(f"Axiom verification (Z3):")
     print(f"  Axioms: {len(z3_axioms)}, Properties: {len(properties)}")
+    if result.verification is not None and result.verification.properties:
+        _print_property_table(result.verification.properties)
 
     if result.passed:
         print(f"  PASSED")
@@ -235,5 +474,29 @@ def _cmd_verify(source: str) -> int:
         return 1
 
 
+def _print_property_table(results: dict) -> None:
+    """One row per checked property: status, solve time and the axioms it needed."""
+    width = max(len("Property"), *(len(name) for name in results))
+    print(f"  {'Property':<{width}}  {'Status':<9}  {'Time':>9}  Needs")
+    for name, r in results.items():
+        duration = "-" if r.duration_s is None else f"{r.duration_s:.3f}s"
+        needs = "-" if r.core is None else ", ".join(r.core) or "(no axioms)"
+        note = "  (cached)" if r.cached else ""
+        print(f"  {name:<{width}}  {r.status:<9}  {duration:>9}  {needs}{note}")
+
+
+def _cmd_daemon(*, socket_path: Path | None, idle_timeout: float | None) -> int:
+    from meta_compiler.daemon import default_socket_path, serve
+
+    path = socket_path or default_socket_path()
+    print(f"Validation daemon listening on {path}", flush=True)
+    try:
+        serve(path, idle_timeout=idle_timeout)
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,18 +2,50 @@
 
 from __future__ import annotations
 
+from meta_compiler import profiling
 from meta_compiler.compiler.parser import parse_document, extract_section_blocks
 from meta_compiler.compiler.executor import execute_blocks, ExecutionResult
+from meta_compiler.compiler.incremental import IncrementalExecutor
 from meta_compiler.compiler.paper import generate_paper
 from meta_compiler.compiler.report import generate_report
 from meta_compiler.compiler.runner import generate_runner
-from meta_compiler.checks import run_reconciliation_checks
 
 
-def check_document(source: str, *, strict: bool = False) -> ExecutionResult:
-    """Parse and validate a .model.md document."""
-    blocks = parse_document(source)
-    return execute_blocks(blocks, strict=strict)
+def check_document(
+    source: str,
+    *,
+    strict: bool = False,
+    executor: IncrementalExecutor | None = None,
+    vectorize: bool = False,
+    jobs: int = 1,
+    max_violations: int | None = None,
+    sample: int | None = None,
+    seed: int = 0,
+    orphans: bool = True,
+    optimize: bool = False,
+    proof_cache: bool = True,
+    proof_timeout: float | None = None,
+    proof_deadline: float | None = None,
+) -> ExecutionResult:
+    """Parse and validate a .model.md document.
+
+    Pass an ``IncrementalExecutor`` to re-use state from the previous check
+    of the same document; only blocks after the first edit are re-executed.
+    ``max_violations``/``sample``/``seed`` trade completeness for speed while
+    authoring, as does ``orphans=False`` (no orphan check or access logging;
+    see ``execute_blocks``); ``compile_document`` is always exhaustive.
+    ``optimize=True`` adds the solver stage (``ExecutionResult.optimization``).
+    ``proof_timeout``/``proof_deadline`` bound the Z3 checks (seconds).
+    """
+    with profiling.span("phase", "parse"):
+        blocks = parse_document(source)
+    options = dict(strict=strict, vectorize=vectorize, jobs=jobs,
+                   max_violations=max_violations, sample=sample, seed=seed,
+                   orphans=orphans, optimize=optimize, proof_cache=proof_cache,
+                   proof_timeout=proof_timeout, proof_deadline=proof_deadline)
+    if executor is not None:
+        return executor.execute(blocks, **options)
+    return execute_blocks(blocks, **options)
 
 
 def compile_document(
@@ -23,29 +55,46 @@ def compile_document(
     filename: str = "model.model.md",
     strict: bool = True,
     skip_validation: bool = False,
+    vectorize: bool = False,
+    jobs: int = 1,
+    proof_cache: bool = True,
 ) -> dict:
-    """Full compilation pipeline: validate, then generate artifacts."""
-    blocks = parse_document(source)
+    """Full compilation pipeline: validate, then generate artifacts.
+
+    ``data_files`` in the result lists the data files the fixture loaded,
+    which ``meta_compiler.build_cache`` checks alongside the source.
+    """
+    with profiling.span("phase", "parse"):
+        blocks = parse_document(source)
 
     if skip_validation:
-        paper = generate_paper(blocks, depth=depth)
-        return {"paper": paper, "report": None, "report_text": None, "runner": None}
+        with profiling.span("phase", "paper"):
+            paper = generate_paper(blocks, depth=depth)
+        return {"paper": paper, "report": None, "report_text": None, "runner": None,
+                "data_files": []}
 
-    result = execute_blocks(blocks, strict=strict)
+    result = execute_blocks(blocks, strict=strict, vectorize=vectorize, jobs=jobs,
+                            proof_cache=proof_cache)
     if not result.passed:
         raise RuntimeError(
             "Validation failed in strict mode:\n"
             + "\n".join(f"  - {e}" for e in result.errors)
         )
 
-    paper = generate_paper(blocks, depth=depth)
-    report = generate_report(blocks, registry=result.registry, test_result=result)
+    with profiling.span("phase", "paper"):
+        paper = generate_paper(blocks, depth=depth)
+    with profiling.span("phase", "report"):
+        report = generate_report(blocks, registry=result.registry, test_result=result)
+        report_text = report.to_text()
+    with profiling.span("phase", "runner"):
+        runner = generate_runner(blocks, model_path=filename)
 
     return {
         "paper": paper,
         "report": report,
-        "report_text": report.to_text(),
-        "runner": generate_runner(blocks, model_path=filename),
+        "report_text": report_text,
+        "runner": runner,
+        "data_files": list(result.registry.data_files),
     }
 
 
@@ -58,7 +107,11 @@ def reconcile_document(
     populate the registry, then scopes reconciliation checks to the named
     section (if provided).
     """
-    blocks = parse_document(source)
+    # checks imports this package, so import it here to avoid a cycle
+    from meta_compiler.checks import run_reconciliation_checks
+
+    with profiling.span("phase", "parse"):
+        blocks = parse_document(source)
     result = execute_blocks(blocks, strict=strict)
 
     if section:
@@ -66,5 +119,6 @@ def reconcile_document(
     else:
         scoped_blocks = blocks
 
-    warnings = run_reconciliation_checks(scoped_blocks, result.registry)
+    with profiling.span("phase", "reconcile"):
+        warnings = run_reconciliation_checks(scoped_blocks, result.registry)
     return warnings, result.passed
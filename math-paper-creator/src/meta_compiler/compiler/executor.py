@@ -10,12 +10,21 @@ against real values, checks constraints numerically, then runs structural checks
 from __future__ import annotations
 
 import inspect
+import random
+import threading
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from meta_compiler.checks import collect_scalar_refs
+from meta_compiler import profiling
+from meta_compiler.analysis import BlockSource
 from meta_compiler.compiler.parser import Block, FixtureBlock, ResultsBlock, ValidationBlock
-from meta_compiler.registry import Registry, registry
+from meta_compiler.proxy import VectorIndex
+from meta_compiler.registry import Registry, current_registry
 from meta_compiler.symbols import AxiomSymbol, ConstraintSymbol, ObjectiveSymbol, PropertySymbol
+from meta_compiler.verification import z3_lock
+
+if TYPE_CHECKING:
+    from meta_compiler.verification import ModelVerification
 
 
 def _coerce_bool(value) -> bool:
@@ -34,68 +43,115 @@ def _is_numeric(value) -> bool:
     return isinstance(value, (np.integer, np.floating))
 
 
+# Serializes stdout capture of results blocks across threads
+_STDOUT_LOCK = threading.Lock()
+
+
 @dataclass
 class ExecutionResult:
     passed: bool
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     registry: Registry | None = None
+    optimization: list = field(default_factory=list)  # OptimizationResult per objective
+    verification: ModelVerification | None = None  # when Z3 checks ran
+
+
+@dataclass(frozen=True)
+class _NumericOptions:
+    """How per-member constraints are evaluated in numeric mode."""
+    vectorize: bool = False
+    max_violations: int | None = None  # messages per constraint before summarizing
+    sample: int | None = None  # members checked per set, stratified by position
+    seed: int = 0
+    _samples: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def members_to_check(self, set_name: str, members: list) -> list:
+        """All of ``members``, or a stratified sample of them in set order.
+
+        The set is split into ``sample`` equal runs by position and one
+        member is drawn from each run, so every region of a large set is
+        represented. The draw depends only on ``seed`` and the set name,
+        so every constraint over a set sees the same members.
+        """
+        if self.sample is None or len(members) <= self.sample:
+            return members
+        cached = self._samples.get(set_name)
+        if cached is None or cached[0] is not members:
+            rng = random.Random(f"{self.seed}:{set_name}")
+            n, k = len(members), self.sample
+            picked = [members[rng.randrange(s * n // k, (s + 1) * n // k)] for s in range(k)]
+            cached = self._samples[set_name] = (members, picked)
+        return cached[1]
 
 
 def execute_blocks(
-    blocks: list[Block], *, strict: bool = False
+    blocks: list[Block],
+    *,
+    strict: bool = False,
+    vectorize: bool = False,
+    jobs: int = 1,
+    max_violations: int | None = None,
+    sample: int | None = None,
+    seed: int = 0,
+    orphans: bool = True,
+    optimize: bool = False,
+    proof_cache: bool = True,
+    proof_timeout: float | None = None,
+    proof_deadline: float | None = None,
 ) -> ExecutionResult:
-    """Execute fixture + validation blocks and run checks."""
+    """Execute fixture + validation blocks and run checks.
+
+    With ``vectorize=True``, per-member constraints are first evaluated once
+    against NumPy arrays aligned to the set order (see ``VectorIndex``),
+    falling back to the per-member loop when the expression can't be
+    vectorized. Reported errors are identical either way.
+
+    ``jobs > 1`` evaluates constraints and objectives in that many forked
+    worker processes (serially where ``fork`` is unavailable); errors keep
+    registry order and match a serial run.
+
+    ``max_violations`` caps the messages reported per constraint; further
+    violations are still counted and summarized in one extra error.
+    ``sample`` checks each per-member constraint on at most that many
+    members of its set, drawn deterministically from ``seed`` (a warning
+    records that the check was partial). Both default to exhaustive.
+
+    ``orphans=False`` skips orphan detection, and with it the proxies'
+    access logging.
+
+    ``optimize=True`` also lowers the model to a sparse LP/MILP, solves each
+    objective with SciPy and records the results in
+    ``ExecutionResult.optimization`` (see ``meta_compiler.optimization``).
+
+    Z3 results are read from and written to the on-disk ``ProofCache``
+    unless ``proof_cache=False``. ``proof_timeout`` bounds each Z3 check and
+    ``proof_deadline`` all of them (seconds); with either set, or with
+    ``jobs > 1``, the checks run in forked workers and a check that runs
+    out of time is reported as a warning instead of blocking.
+
+    Symbols are registered into ``current_registry()``, which is reset
+    first; run under ``use_registry()`` to validate documents concurrently.
+    """
+    registry = current_registry()
     registry.reset()
+    registry.set_access_logging(orphans)
     errors: list[str] = []
     warnings: list[str] = []
 
     fixture_blocks = [b for b in blocks if isinstance(b, FixtureBlock)]
+    results_blocks = [b for b in blocks if isinstance(b, ResultsBlock)]
     validate_blocks = [b for b in blocks if isinstance(b, ValidationBlock)]
 
     has_fixtures = len(fixture_blocks) > 0
 
-    # Step 1: Execute fixture blocks to build data store
-    if has_fixtures:
-        fixture_ns: dict = {}
-        for fb in fixture_blocks:
-            try:
-                exec(fb.code, fixture_ns)
-            except Exception as e:
-                errors.append(f"Fixture error (line {fb.line_number}): {e}")
-                return ExecutionResult(passed=False, errors=errors,
-                                       warnings=warnings, registry=None)
-
-        # Build data_store: every name in fixture namespace that isn't a dunder
-        for name, value in fixture_ns.items():
-            if not name.startswith("_"):
-                registry.data_store[name] = value
-
-    # Step 1b: Execute results blocks in fixture namespace, capture stdout
-    results_blocks = [b for b in blocks if isinstance(b, ResultsBlock)]
-    if results_blocks:
-        import io
-        import contextlib
-
-        for rb in results_blocks:
-            buf = io.StringIO()
-            try:
-                with contextlib.redirect_stdout(buf):
-                    exec(rb.code, fixture_ns if has_fixtures else {})
-            except Exception as e:
-                errors.append(f"Results error (line {rb.line_number}): {e}")
-                return ExecutionResult(passed=False, errors=errors,
-                                       warnings=warnings, registry=None)
-            rb.output = buf.getvalue()
+    # Steps 1 and 1b: fixture data store and results output
+    if not _run_setup_blocks(fixture_blocks, results_blocks, errors):
+        return ExecutionResult(passed=False, errors=errors,
+                               warnings=warnings, registry=None)
 
     # Step 2: Build validation namespace
-    from meta_compiler import Set, Parameter, Variable, Expression, Constraint, Objective, S, Axiom, Property
-    ns = {
-        "Set": Set, "Parameter": Parameter, "Variable": Variable,
-        "Expression": Expression, "Constraint": Constraint,
-        "Objective": Objective, "S": S, "Axiom": Axiom,
-        "Property": Property, "registry": registry,
-    }
+    ns = _validation_namespace()
 
     # Step 3: Execute validation blocks
     # The DSL surface (Set, Parameter, etc.) does NOT require users to
@@ -109,84 +165,209 @@ def execute_blocks(
     # symbols are registered via registry._exec_namespace.
     registry._exec_namespace = ns
 
-    for vb in validate_blocks:
-        try:
-            registry._current_block_source = vb.code
-            exec(vb.code, ns)
-            collect_scalar_refs(vb.code, registry.scalar_names, registry.access_log)
-        except Exception as e:
-            errors.append(f"Validation error (line {vb.line_number}): {e}")
-            return ExecutionResult(passed=False, errors=errors,
-                                   warnings=warnings, registry=registry)
+    with profiling.span("phase", "validate"):
+        for vb in validate_blocks:
+            if not _run_validate_block(vb, ns, errors):
+                return ExecutionResult(passed=False, errors=errors,
+                                       warnings=warnings, registry=registry)
 
     registry._exec_namespace = None
-    registry._current_block_source = None
+    registry._current_block = None
+
+    numeric = _NumericOptions(vectorize=vectorize, max_violations=max_violations,
+                              sample=sample, seed=seed)
+    return _finish_execution(has_fixtures, errors, warnings, strict=strict,
+                             numeric=numeric, jobs=jobs, orphans=orphans,
+                             optimize=optimize, proof_cache=proof_cache,
+                             proof_timeout=proof_timeout, proof_deadline=proof_deadline)
+
+
+def _run_setup_blocks(
+    fixture_blocks: list[FixtureBlock],
+    results_blocks: list[ResultsBlock],
+    errors: list[str],
+) -> bool:
+    """Execute fixture blocks into the data store, then capture results output.
+
+    Returns False (with the error appended) on the first failing block.
+    """
+    registry = current_registry()
+    has_fixtures = len(fixture_blocks) > 0
 
-    # Step 4: In numeric mode, evaluate constraints and objectives
+    # Step 1: Execute fixture blocks to build data store
     if has_fixtures:
-        for name, sym in registry.symbols.items():
-            if isinstance(sym, ConstraintSymbol) and sym.expr is not None:
+        fixture_ns: dict = {}
+        with profiling.span("phase", "fixtures"):
+            for fb in fixture_blocks:
                 try:
-                    _check_constraint(sym, registry, errors)
+                    with profiling.span("block", f"fixture (line {fb.line_number})"):
+                        exec(fb.code, fixture_ns)
                 except Exception as e:
-                    errors.append(f"Error in constraint \"{sym.name}\": {e}")
+                    errors.append(f"Fixture error (line {fb.line_number}): {e}")
+                    return False
+
+            # Build data_store: every name in fixture namespace that isn't a dunder
+            for name, value in fixture_ns.items():
+                if not name.startswith("_"):
+                    registry.data_store[name] = value
 
-            elif isinstance(sym, ObjectiveSymbol) and sym.expr is not None:
+            from meta_compiler.fixtures import bind_columns
+            try:
+                registry.data_files = bind_columns(registry.data_store)
+            except (ValueError, OSError) as e:
+                errors.append(f"Fixture error: {e}")
+                return False
+
+    # Step 1b: Execute results blocks in fixture namespace, capture stdout
+    if results_blocks:
+        import io
+        import contextlib
+
+        with profiling.span("phase", "results"):
+            for rb in results_blocks:
+                buf = io.StringIO()
                 try:
-                    result = sym.expr() if _arity(sym.expr) == 0 else None
-                    if result is not None and not _is_numeric(result):
-                        errors.append(
-                            f"Objective \"{sym.name}\" returned {type(result).__name__}, "
-                            f"expected numeric value"
-                        )
+                    # sys.stdout is process-wide: one capture at a time
+                    with _STDOUT_LOCK, contextlib.redirect_stdout(buf), \
+                            profiling.span("block", f"results (line {rb.line_number})"):
+                        exec(rb.code, fixture_ns if has_fixtures else {})
                 except Exception as e:
-                    errors.append(f"Error in objective \"{sym.name}\": {e}")
+                    errors.append(f"Results error (line {rb.line_number}): {e}")
+                    return False
+                rb.output = buf.getvalue()
+
+    return True
+
+
+def _validation_namespace() -> dict:
+    """Build the namespace validate blocks are executed in."""
+    from meta_compiler import Set, Parameter, Variable, Expression, Constraint, Objective, S, Axiom, Property
+    registry = current_registry()
+    return {
+        "Set": Set, "Parameter": Parameter, "Variable": Variable,
+        "Expression": Expression, "Constraint": Constraint,
+        "Objective": Objective, "S": S, "Axiom": Axiom,
+        "Property": Property, "registry": registry,
+    }
+
+
+def _run_validate_block(vb: ValidationBlock, ns: dict, errors: list[str]) -> bool:
+    """Execute one validate block in ``ns``. Returns False on error."""
+    # checks imports the compiler package, so import it here to avoid a cycle
+    from meta_compiler.checks import collect_scalar_refs
+
+    registry = current_registry()
+    try:
+        # Blocks may build z3 terms, which is not thread-safe
+        with profiling.span("block", f"validate (line {vb.line_number})"), z3_lock:
+            block = BlockSource(vb.code)
+            registry._current_block = block
+            exec(block.compile(), ns)
+            collect_scalar_refs(vb.code, registry.scalar_names, registry.access_log,
+                                analysis=registry.analysis)
+    except Exception as e:
+        errors.append(f"Validation error (line {vb.line_number}): {e}")
+        return False
+    return True
+
+
+def _finish_execution(
+    has_fixtures: bool,
+    errors: list[str],
+    warnings: list[str],
+    *,
+    strict: bool,
+    numeric: _NumericOptions | None = None,
+    jobs: int = 1,
+    orphans: bool = True,
+    optimize: bool = False,
+    proof_cache: bool = True,
+    proof_timeout: float | None = None,
+    proof_deadline: float | None = None,
+) -> ExecutionResult:
+    """Run steps 4-5 (numeric evaluation, verification, structural checks)."""
+    registry = current_registry()
+    numeric = numeric or _NumericOptions()
+
+    # Step 4: In numeric mode, evaluate constraints and objectives
+    if has_fixtures:
+        with profiling.span("phase", "evaluate", jobs=jobs):
+            errors.extend(_evaluate_numeric(registry, numeric, jobs=jobs))
+        warnings.extend(_sampling_warnings(registry, numeric))
+
+    # Step 4a: Optionally solve the lowered model for each objective
+    optimization = []
+    if optimize and has_fixtures:
+        from meta_compiler.optimization import optimization_warnings, optimize_model
+        with profiling.span("phase", "optimize"):
+            optimization = optimize_model(registry)
+        warnings.extend(optimization_warnings(optimization))
 
     # Step 4b: Verify axioms and properties (if Z3 expressions present)
     axiom_syms = [
         sym for sym in registry.symbols.values()
         if isinstance(sym, AxiomSymbol) and sym.z3_expr is not None
     ]
+    verification = None
     if axiom_syms:
-        from meta_compiler.verification import check_axiom_consistency, check_property, z3_available
+        from meta_compiler.verification import ProofCache, verify_model, z3_available
         if z3_available():
-            # Consistency check
-            consistency = check_axiom_consistency([s.z3_expr for s in axiom_syms])
+            cache = ProofCache() if proof_cache else None
+            # Consistency and property checks share solvers per given-set
+            with profiling.span("phase", "verify"):
+                verification = verify_model(
+                    {s.name: s.z3_expr for s in axiom_syms},
+                    {
+                        name: (sym.given, sym.z3_expr)
+                        for name, sym in registry.symbols.items()
+                        if isinstance(sym, PropertySymbol)
+                    },
+                    cache=cache,
+                    timeout_ms=None if proof_timeout is None else int(proof_timeout * 1000),
+                    deadline_s=proof_deadline,
+                    jobs=jobs,
+                )
+                # Proofs may have run in workers: record their reported times
+                for name, r in [("consistency", verification.consistency),
+                                *verification.properties.items()]:
+                    profiling.record("proof", name, r.duration_s, status=r.status,
+                                     cached=r.cached, timings=r.timings)
+            consistency = verification.consistency
             if consistency.status == "contradictory":
-                axiom_names = ", ".join(s.name for s in axiom_syms)
+                # The minimized unsat core: no proper subset conflicts
+                axiom_names = ", ".join(consistency.core or [s.name for s in axiom_syms])
                 errors.append(
                     f"Axioms are contradictory: {axiom_names} cannot all hold simultaneously"
                 )
             elif consistency.status == "error":
                 errors.append(f"Axiom consistency check error: {consistency.error}")
+            elif consistency.status == "timeout":
+                warnings.append(f"Axiom consistency check timed out: {consistency.error}")
 
             # Property implication checks
-            for name, sym in registry.symbols.items():
-                if isinstance(sym, PropertySymbol):
-                    given_exprs = [
-                        registry.symbols[ax_name].z3_expr
-                        for ax_name in sym.given
-                        if isinstance(registry.symbols.get(ax_name), AxiomSymbol)
-                        and registry.symbols[ax_name].z3_expr is not None
-                    ]
-                    if given_exprs:
-                        prop_result = check_property(given_exprs, sym.z3_expr)
-                        if prop_result.status == "failed":
-                            ce = prop_result.counterexample or {}
-                            ce_str = ", ".join(f"{k}={v}" for k, v in ce.items())
-                            errors.append(
-                                f'Property "{sym.name}" does NOT follow from '
-                                f'{", ".join(sym.given)}'
-                                f'{" — counterexample: " + ce_str if ce_str else ""}'
-                            )
-                        elif prop_result.status == "error":
-                            errors.append(
-                                f'Property "{sym.name}" verification error: {prop_result.error}'
-                            )
+            for name, prop_result in verification.properties.items():
+                sym = registry.symbols[name]
+                if prop_result.status == "failed":
+                    ce = prop_result.counterexample or {}
+                    ce_str = ", ".join(f"{k}={v}" for k, v in ce.items())
+                    errors.append(
+                        f'Property "{sym.name}" does NOT follow from '
+                        f'{", ".join(sym.given)}'
+                        f'{" — counterexample: " + ce_str if ce_str else ""}'
+                    )
+                elif prop_result.status == "error":
+                    errors.append(
+                        f'Property "{sym.name}" verification error: {prop_result.error}'
+                    )
+                elif prop_result.status == "timeout":
+                    warnings.append(
+                        f'Property "{sym.name}" was not verified: {prop_result.error}'
+                    )
 
     # Step 5: Run structural checks
     from meta_compiler.checks import run_all_checks
-    check_result = run_all_checks(registry, strict=strict)
+    with profiling.span("phase", "checks"):
+        check_result = run_all_checks(registry, strict=strict, orphans=orphans)
     errors.extend(check_result.errors)
     warnings.extend(check_result.warnings)
 
@@ -195,10 +376,132 @@ def execute_blocks(
         errors=errors,
         warnings=warnings,
         registry=registry,
+        optimization=optimization,
+        verification=verification,
     )
 
 
-def _check_constraint(sym: ConstraintSymbol, reg: Registry, errors: list[str]):
+def _evaluate_numeric(reg: Registry, options: _NumericOptions, *, jobs: int = 1) -> list[str]:
+    """Evaluate every constraint and objective, returning errors in registry order.
+
+    With ``jobs > 1`` the symbols are spread over a pool of forked workers.
+    Forking shares the fixture data and the compiled lambdas with every
+    worker without pickling them; each worker sends back its error strings
+    and the symbols its evaluations accessed, which are merged here so the
+    result and ``access_log`` match a serial run.
+    """
+    names = [
+        name for name, sym in reg.symbols.items()
+        if isinstance(sym, (ConstraintSymbol, ObjectiveSymbol)) and sym.expr is not None
+    ]
+    if jobs <= 1 or len(names) < 2 or not _can_fork():
+        errors: list[str] = []
+        for name in names:
+            errors.extend(_evaluate_symbol(reg.symbols[name], reg, options))
+        return errors
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The registry reaches the workers as initializer arguments, which fork
+    # hands over without pickling; parent-side globals would be shared with
+    # pools started concurrently by other threads' registries
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(names)),
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(reg, options),
+    ) as pool:
+        chunksize = max(1, len(names) // (jobs * 4))
+        outcomes = list(pool.map(_evaluate_in_worker, names, chunksize=chunksize))
+
+    errors = []
+    for symbol_errors, accessed in outcomes:
+        errors.extend(symbol_errors)
+        reg.access_log.update(accessed)
+    return errors
+
+
+def _can_fork() -> bool:
+    import multiprocessing
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+# Set in each forked worker by ``_init_worker``
+_worker_registry: Registry | None = None
+_worker_options = None
+
+
+def _init_worker(reg: Registry, options: _NumericOptions) -> None:
+    global _worker_registry, _worker_options
+    _worker_registry, _worker_options = reg, options
+
+
+def _evaluate_in_worker(name: str) -> tuple[list[str], set[str]]:
+    """Pool task: evaluate one symbol in a forked worker."""
+    reg = _worker_registry
+    # Worker-local copy. Proxies that already logged in the parent stay quiet,
+    # but their names are in the parent's log, so the merged union is complete.
+    reg.access_log.clear()
+    symbol_errors = _evaluate_symbol(reg.symbols[name], reg, _worker_options)
+    return symbol_errors, set(reg.access_log)
+
+
+def _evaluate_symbol(sym, reg: Registry, options: _NumericOptions) -> list[str]:
+    """Evaluate one constraint or objective against fixture data."""
+    if not profiling.active():
+        return _evaluate_symbol_untimed(sym, reg, options)
+    kind = "constraint" if isinstance(sym, ConstraintSymbol) else "objective"
+    with profiling.span(kind, sym.name) as timed:
+        errors = _evaluate_symbol_untimed(sym, reg, options)
+        timed.attrs["errors"] = len(errors)
+    return errors
+
+
+def _evaluate_symbol_untimed(sym, reg: Registry, options: _NumericOptions) -> list[str]:
+    errors: list[str] = []
+    if isinstance(sym, ConstraintSymbol):
+        try:
+            _check_constraint(sym, reg, errors, options)
+        except Exception as e:
+            errors.append(f"Error in constraint \"{sym.name}\": {e}")
+    else:
+        try:
+            result = sym.expr() if _arity(sym.expr) == 0 else None
+            if result is not None and not _is_numeric(result):
+                errors.append(
+                    f"Objective \"{sym.name}\" returned {type(result).__name__}, "
+                    f"expected numeric value"
+                )
+        except Exception as e:
+            errors.append(f"Error in objective \"{sym.name}\": {e}")
+    return errors
+
+
+def _sampling_warnings(reg: Registry, options: _NumericOptions) -> list[str]:
+    """One warning per set whose per-member constraints were only sampled."""
+    if options.sample is None:
+        return []
+    warnings = []
+    for set_name in dict.fromkeys(
+        sym.over for sym in reg.symbols.values()
+        if isinstance(sym, ConstraintSymbol) and sym.expr is not None and sym.over
+    ):
+        members = reg.data_store.get(set_name)
+        if isinstance(members, list) and len(members) > options.sample:
+            warnings.append(
+                f'Constraints over "{set_name}" checked on a sample of '
+                f"{options.sample} of {len(members)} members (seed {options.seed})"
+            )
+    return warnings
+
+
+def _check_constraint(
+    sym: ConstraintSymbol,
+    reg: Registry,
+    errors: list[str],
+    options: _NumericOptions | None = None,
+):
     """Evaluate a constraint against fixture data."""
     arity = _arity(sym.expr)
 
@@ -241,6 +544,15 @@ def _check_constraint(sym: ConstraintSymbol, reg: Registry, errors: list[str]):
             )
             return
 
+        options = options or _NumericOptions()
+        members = options.members_to_check(sym.over, members)
+        limit = options.max_violations
+        if options.vectorize and members and _check_constraint_vectorized(
+            sym, reg, members, errors, limit
+        ):
+            return
+
+        violations = 0
         for member in members:
             try:
                 result = sym.expr(member)
@@ -256,10 +568,74 @@ def _check_constraint(sym: ConstraintSymbol, reg: Registry, errors: list[str]):
                     errors.append(f'Error in constraint "{sym.name}": {e}')
                 return
             if not _coerce_bool(result):
-                errors.append(
-                    f"Constraint \"{sym.name}\" violated for "
-                    f"{sym.over}=\"{member}\": result is {result!r}"
-                )
+                violations += 1
+                if limit is None or violations <= limit:
+                    errors.append(
+                        f"Constraint \"{sym.name}\" violated for "
+                        f"{sym.over}=\"{member}\": result is {result!r}"
+                    )
+        _summarize_violations(sym, violations, len(members), limit, errors)
+
+
+def _summarize_violations(
+    sym: ConstraintSymbol, violations: int, checked: int, limit: int | None, errors: list[str]
+) -> None:
+    """Report how many violations were counted but not listed."""
+    if limit is not None and violations > limit:
+        errors.append(
+            f"Constraint \"{sym.name}\" violated for {violations} of {checked} "
+            f"checked members of {sym.over} ({violations - limit} not shown)"
+        )
+
+
+def _check_constraint_vectorized(
+    sym: ConstraintSymbol,
+    reg: Registry,
+    members: list,
+    errors: list[str],
+    limit: int | None = None,
+) -> bool:
+    """Evaluate a per-member constraint once over the whole set.
+
+    Returns False (without touching ``errors``) when the result cannot be
+    trusted to match the per-member loop: the lambda raised, returned
+    something other than one bool per member, or a violating member
+    re-evaluated as satisfied. Violations are re-evaluated individually
+    so their messages are exactly those of the per-member loop; with a
+    ``limit`` only the first ``limit`` of them are.
+    """
+    import numpy as np
+
+    vi = reg._vector_indices.get(sym.over)
+    if vi is None or vi.members is not members:
+        vi = reg._vector_indices[sym.over] = VectorIndex(sym.over, members)
+    try:
+        # Floating-point faults must not become inf/nan where Python raises
+        with np.errstate(all="raise"):
+            mask = sym.expr(vi)
+    except Exception:
+        return False
+    if not (isinstance(mask, np.ndarray) and mask.dtype == np.bool_
+            and mask.shape == (len(members),)):
+        return False
+
+    failing = np.flatnonzero(~mask)
+    violations: list[str] = []
+    for pos in failing[:limit]:
+        member = members[pos]
+        try:
+            result = sym.expr(member)
+        except Exception:
+            return False
+        if _coerce_bool(result):
+            return False
+        violations.append(
+            f"Constraint \"{sym.name}\" violated for "
+            f"{sym.over}=\"{member}\": result is {result!r}"
+        )
+    errors.extend(violations)
+    _summarize_violations(sym, len(failing), len(members), limit, errors)
+    return True
 
 
 def _arity(fn) -> int:
@@ -0,0 +1,252 @@
+"""Incremental re-validation of successive revisions of one .model.md document.
+
+``execute_blocks`` always starts from an empty registry and re-executes every
+fixture, results, and validate block. While a document is being edited, most
+of those blocks are unchanged between runs. ``IncrementalExecutor`` keeps a
+fingerprint of every executed block plus a registry snapshot after each
+validate block, so a re-run restores the snapshot for the longest unchanged
+prefix and only re-executes the blocks downstream of the first edit.
+
+Fixture and results blocks are treated as a single setup stage: any change to
+one of them, or to a data file they loaded (``load_npy``, ``load_npz``,
+``load_csv``; compared by size and modification time), invalidates the whole
+cache, because every proxy closes over the fixture data. Numeric evaluation, verification, and structural checks always
+run on the final registry, so errors and warnings match a full run exactly.
+
+Snapshots copy the namespace dict, not the objects in it, so a block that
+mutates an object bound by an earlier block (``items.append(1)``) would leak
+the mutation into the restored state. A snapshot is therefore only reused
+when every name the blocks bound holds an immutable value (numbers, strings,
+tuples of those, functions, modules, symbol proxies, Z3 terms); the first
+block that binds anything else, and every block after it, is re-executed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from meta_compiler.compiler.executor import (
+    ExecutionResult,
+    _NumericOptions,
+    _finish_execution,
+    _run_setup_blocks,
+    _run_validate_block,
+    _validation_namespace,
+)
+from meta_compiler.compiler.parser import Block, FixtureBlock, ResultsBlock, ValidationBlock
+from meta_compiler.proxy import SymbolProxy
+from meta_compiler.registry import Registry, current_registry
+
+# Values a later block cannot mutate in place
+_IMMUTABLE_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, range,
+    types.FunctionType, types.BuiltinFunctionType, types.ModuleType, type,
+    SymbolProxy, Registry,
+)
+
+
+def block_fingerprint(block: FixtureBlock | ResultsBlock | ValidationBlock) -> str:
+    """Content hash of an executable block (independent of its line number)."""
+    h = hashlib.sha256()
+    h.update(type(block).__name__.encode())
+    h.update(b"\0")
+    h.update(block.code.encode())
+    return h.hexdigest()
+
+
+@dataclass
+class _Snapshot:
+    """Registry and namespace state captured after a validate block."""
+    fingerprint: str
+    symbols: dict[str, Any]
+    access_log: set[str]
+    scalar_names: set[str]
+    namespace: dict[str, Any]
+    proxies: list[Any]
+    reusable: bool = True  # namespace holds only immutable values
+
+
+@dataclass
+class _CachedRun:
+    """State retained from the previous successful setup stage."""
+    setup_key: tuple[str, ...]
+    data_store: dict[str, Any]
+    data_files: list[Path]
+    data_stats: list[tuple[int, int] | None]  # size and mtime of each data file
+    results_output: list[str | None]
+    namespace: dict[str, Any]
+    base: _Snapshot
+    snapshots: list[_Snapshot] = field(default_factory=list)
+
+
+class IncrementalExecutor:
+    """Execute successive revisions of a document, reusing unchanged prefixes.
+
+    One instance tracks one document. ``execute`` has the same contract as
+    ``execute_blocks``: it leaves ``current_registry()`` populated and
+    returns an equivalent ``ExecutionResult``. Cached proxies belong to the
+    registry they were created in, so a run under a different registry
+    starts over.
+    """
+
+    def __init__(self) -> None:
+        self._cache: _CachedRun | None = None
+        self._registry: Registry | None = None  # registry the cache was built in
+        self.reused_blocks = 0  # validate blocks restored on the last run
+        self.executed_blocks = 0  # validate blocks executed on the last run
+
+    def invalidate(self) -> None:
+        """Drop all cached state; the next run executes every block."""
+        self._cache = None
+
+    def execute(
+        self,
+        blocks: list[Block],
+        *,
+        strict: bool = False,
+        vectorize: bool = False,
+        jobs: int = 1,
+        max_violations: int | None = None,
+        sample: int | None = None,
+        seed: int = 0,
+        orphans: bool = True,
+        optimize: bool = False,
+        proof_cache: bool = True,
+        proof_timeout: float | None = None,
+        proof_deadline: float | None = None,
+    ) -> ExecutionResult:
+        """Validate ``blocks``, re-executing only what changed since the last run."""
+        registry = current_registry()
+        if registry is not self._registry:
+            self._cache, self._registry = None, registry
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        fixture_blocks = [b for b in blocks if isinstance(b, FixtureBlock)]
+        results_blocks = [b for b in blocks if isinstance(b, ResultsBlock)]
+        validate_blocks = [b for b in blocks if isinstance(b, ValidationBlock)]
+        has_fixtures = len(fixture_blocks) > 0
+
+        setup_key = tuple(block_fingerprint(b) for b in fixture_blocks + results_blocks)
+        validate_keys = [block_fingerprint(b) for b in validate_blocks]
+
+        cache = self._cache
+        if (cache is not None and cache.setup_key == setup_key
+                and _data_stats(cache.data_files) == cache.data_stats):
+            # Unchanged setup: reuse the fixture data store and results output
+            for rb, output in zip(results_blocks, cache.results_output):
+                rb.output = output
+            reuse = 0
+            while (
+                reuse < len(cache.snapshots)
+                and reuse < len(validate_keys)
+                and cache.snapshots[reuse].fingerprint == validate_keys[reuse]
+                and cache.snapshots[reuse].reusable
+            ):
+                reuse += 1
+            del cache.snapshots[reuse:]
+            self._restore(cache, cache.snapshots[reuse - 1] if reuse else cache.base)
+        else:
+            self._cache = None
+            registry.reset()
+            if not _run_setup_blocks(fixture_blocks, results_blocks, errors):
+                self.reused_blocks = self.executed_blocks = 0
+                return ExecutionResult(passed=False, errors=errors,
+                                       warnings=warnings, registry=None)
+            ns = _validation_namespace()
+            cache = self._cache = _CachedRun(
+                setup_key=setup_key,
+                data_store=dict(registry.data_store),
+                data_files=list(registry.data_files),
+                data_stats=_data_stats(registry.data_files),
+                results_output=[rb.output for rb in results_blocks],
+                namespace=ns,
+                base=self._snapshot("", dict(ns)),
+            )
+            reuse = 0
+        registry.set_access_logging(orphans)  # re-arms restored proxies
+
+        self.reused_blocks = reuse
+        self.executed_blocks = 0
+
+        ns = cache.namespace
+        registry._exec_namespace = ns
+        for vb, key in zip(validate_blocks[reuse:], validate_keys[reuse:]):
+            self.executed_blocks += 1
+            if not _run_validate_block(vb, ns, errors):
+                return ExecutionResult(passed=False, errors=errors,
+                                       warnings=warnings, registry=registry)
+            cache.snapshots.append(self._snapshot(key, dict(ns)))
+
+        registry._exec_namespace = None
+        registry._current_block = None
+
+        numeric = _NumericOptions(vectorize=vectorize, max_violations=max_violations,
+                                  sample=sample, seed=seed)
+        return _finish_execution(has_fixtures, errors, warnings, strict=strict,
+                                 numeric=numeric, jobs=jobs, orphans=orphans,
+                                 optimize=optimize, proof_cache=proof_cache,
+                                 proof_timeout=proof_timeout,
+                                 proof_deadline=proof_deadline)
+
+    @staticmethod
+    def _snapshot(fingerprint: str, namespace: dict[str, Any]) -> _Snapshot:
+        registry = current_registry()
+        return _Snapshot(
+            fingerprint=fingerprint,
+            symbols=dict(registry.symbols),
+            access_log=set(registry.access_log),
+            scalar_names=set(registry.scalar_names),
+            namespace=namespace,
+            proxies=list(registry._proxies),
+            reusable=all(_immutable(value) for name, value in namespace.items()
+                         if not name.startswith("__")),
+        )
+
+    @staticmethod
+    def _restore(cache: _CachedRun, snap: _Snapshot) -> None:
+        """Reset the registry to ``snap``, keeping object identities intact.
+
+        Proxies hold a reference to ``registry.access_log`` and callables
+        defined in earlier blocks hold the namespace dict as their globals,
+        so both are refilled in place rather than replaced. The restored
+        proxies are re-armed by ``execute``: they may have logged into the
+        previous run's access log and switched to their unlogged class.
+        """
+        registry = current_registry()
+        registry.reset()
+        registry.data_store.update(cache.data_store)
+        registry.data_files = list(cache.data_files)
+        registry.symbols.update(snap.symbols)
+        registry.access_log.update(snap.access_log)
+        registry.scalar_names = set(snap.scalar_names)
+        registry._proxies.extend(snap.proxies)
+        cache.namespace.clear()
+        cache.namespace.update(snap.namespace)
+
+
+def _data_stats(paths: list[Path]) -> list[tuple[int, int] | None]:
+    """Size and modification time of each file (None if it is gone)."""
+    stats = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((st.st_size, st.st_mtime_ns))
+    return stats
+
+
+def _immutable(value: Any) -> bool:
+    """True if ``value`` cannot be changed in place by later blocks."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_immutable(item) for item in value)
+    # Z3 terms are immutable ASTs
+    return type(value).__module__.partition(".")[0] == "z3"
@@ -52,30 +52,21 @@ def _filter_by_depth(blocks: list[Block], target_depth: str) -> list[Block]:
 
     # First, split prose blocks at depth markers so each segment can be
     # filtered independently.
-    expanded: list[Block] = []
+    expanded: list[tuple[Block, str | None]] = []
     for block in blocks:
         if isinstance(block, ProseBlock):
             expanded.extend(_split_prose_at_depth_markers(block, depth_order))
         else:
-            expanded.append(block)
+            expanded.append((block, None))
 
     result: list[Block] = []
     current_level = 0  # Start with executive (always included)
     include = True
 
-    for block in expanded:
-        if isinstance(block, ProseBlock):
-            # Check if the first non-empty line is a depth marker
-            for line in block.content.split("\n"):
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                if stripped.startswith("<!-- depth:") and stripped.endswith("-->"):
-                    marker = stripped[len("<!-- depth:"):-len("-->")].strip()
-                    if marker in depth_order:
-                        current_level = depth_order[marker]
-                        include = current_level <= target_level
-                break  # Only examine the leading marker line
+    for block, depth in expanded:
+        if depth is not None:
+            current_level = depth_order[depth]
+            include = current_level <= target_level
 
         if include:
             result.append(block)
@@ -86,34 +77,25 @@ def _filter_by_depth(blocks: list[Block], target_depth: str) -> list[Block]:
 def _split_prose_at_depth_markers(
     block: ProseBlock,
     depth_order: dict[str, int],
-) -> list[ProseBlock]:
-    """Split a ProseBlock into sub-blocks at each depth marker boundary."""
-    lines = block.content.split("\n")
-    segments: list[ProseBlock] = []
-    current: list[str] = []
-
-    for line in lines:
-        stripped = line.strip()
-        if (
-            stripped.startswith("<!-- depth:")
-            and stripped.endswith("-->")
-            and stripped[len("<!-- depth:"):-len("-->")].strip() in depth_order
-        ):
-            # Flush accumulated lines as a segment (even if empty — the marker
-            # itself will start the new segment)
-            if current:
-                text = "\n".join(current)
-                if text.strip():
-                    segments.append(ProseBlock(content=text + "\n"))
-                current = []
-            # Start new segment with the marker line
-            current.append(line)
-        else:
-            current.append(line)
+) -> list[tuple[ProseBlock, str | None]]:
+    """Split a ProseBlock into sub-blocks at each depth marker boundary.
 
-    if current:
-        text = "\n".join(current)
-        if text.strip():
-            segments.append(ProseBlock(content=text + "\n"))
+    Returns (segment, depth) pairs, where depth is the marker that opens
+    the segment (None for text before the first marker). Uses the parser's
+    depth-marker outline, so blocks without markers are not re-scanned.
+    """
+    cuts = [m for m in block.depth_markers if m.depth in depth_order]
+    if not cuts:
+        if not block.content.strip():
+            return []
+        return [(ProseBlock(content=block.content + "\n"), None)]
 
+    lines = block.content.split("\n")
+    bounds = ([(0, None)] if cuts[0].line > 0 else []) + [(m.line, m.depth) for m in cuts]
+    bounds.append((len(lines), None))
+    segments: list[tuple[ProseBlock, str | None]] = []
+    for (lo, depth), (hi, _) in zip(bounds, bounds[1:]):
+        text = "\n".join(lines[lo:hi])
+        if text.strip():
+            segments.append((ProseBlock(content=text + "\n"), depth))
     return segments
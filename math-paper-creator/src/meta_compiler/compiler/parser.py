@@ -7,14 +7,101 @@ depend on it.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+
+class SourceSpan(NamedTuple):
+    """Location of a block in the source: character offsets and line range.
+
+    ``start``/``end`` are offsets into the source string (end exclusive);
+    ``first_line``/``last_line`` are 0-indexed and inclusive. Index records
+    are NamedTuples because one is built per block or heading and frozen
+    dataclass construction dominates parse time on large documents.
+    """
+
+    start: int
+    end: int
+    first_line: int
+    last_line: int
+
+
+class Heading(NamedTuple):
+    """A markdown heading inside a ProseBlock."""
+
+    level: int  # number of leading '#'
+    title: str
+    line: int  # line index within the ProseBlock content
+
+
+class DepthMarker(NamedTuple):
+    """A ``<!-- depth:NAME -->`` marker inside a ProseBlock."""
+
+    depth: str
+    line: int  # line index within the ProseBlock content
+
+
+class ProseOutline(NamedTuple):
+    """Headings and depth markers of one ProseBlock."""
+
+    headings: tuple[Heading, ...]
+    depth_markers: tuple[DepthMarker, ...]
 
 
 @dataclass
 class ProseBlock:
-    """Normal markdown text — narrative, explanations."""
+    """Normal markdown text — narrative, explanations.
+
+    Headings and depth markers are indexed from ``content`` on first access
+    and kept in ``outline``.
+    """
 
     content: str
+    span: SourceSpan | None = field(default=None, compare=False, repr=False)
+    outline: ProseOutline | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def headings(self) -> tuple[Heading, ...]:
+        return self._outline().headings
+
+    @property
+    def depth_markers(self) -> tuple[DepthMarker, ...]:
+        return self._outline().depth_markers
+
+    def section_title(self) -> str | None:
+        """Title of the last heading, or None; skips building the outline."""
+        if self.outline is not None:
+            headings = self.outline.headings
+            return headings[-1].title if headings else None
+        content = self.content
+        at = content.rfind("#")
+        while at >= 0:
+            start = content.rfind("\n", 0, at) + 1
+            if start == at or content[start:at].isspace():
+                end = content.find("\n", at)
+                return content[start:end if end >= 0 else None].strip().lstrip("#").strip()
+            at = content.rfind("#", 0, at)
+        return None
+
+    def _outline(self) -> ProseOutline:
+        if self.outline is None:
+            headings: list[Heading] = []
+            markers: list[DepthMarker] = []
+            content = self.content
+            pos = li = 0
+            for m in _OUTLINE_LINE.finditer(content):
+                li += content.count("\n", pos, m.start())
+                pos = m.start()
+                hashes, title, depth = m.groups()
+                if hashes is not None:
+                    headings.append(Heading(len(hashes), title.strip(), li))
+                else:
+                    markers.append(DepthMarker(depth.strip(), li))
+            self.outline = ProseOutline(tuple(headings), tuple(markers))
+        return self.outline
 
 
 @dataclass
@@ -23,6 +110,7 @@ class MathBlock:
 
     content: str
     raw: str  # Original with delimiters for paper output
+    span: SourceSpan | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -31,6 +119,7 @@ class ValidationBlock:
 
     code: str
     line_number: int  # For error reporting
+    span: SourceSpan | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -38,6 +127,7 @@ class FixtureBlock:
     """A python:fixture fenced code block containing test data."""
     code: str
     line_number: int
+    span: SourceSpan | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -46,107 +136,116 @@ class ResultsBlock:
     code: str
     line_number: int
     output: str | None = None  # Populated by executor
+    span: SourceSpan | None = field(default=None, compare=False, repr=False)
 
 
 Block = ProseBlock | MathBlock | ValidationBlock | FixtureBlock | ResultsBlock
 
+# ```python:<kind> fence -> block type
+_FENCES: dict[str, type] = {
+    "fixture": FixtureBlock,
+    "results": ResultsBlock,
+    "validate": ValidationBlock,
+}
+# A whole line whose stripped text opens a fence or a $$ block, and the
+# lines that close them. [^\S\n] is str.strip()'s whitespace without
+# crossing lines.
+_OPENER = re.compile(r"^[^\S\n]*(?:```python:(fixture|results|validate)|\$\$)[^\n]*",
+                     re.MULTILINE)
+_FENCE_CLOSE = re.compile(r"^[^\S\n]*```", re.MULTILINE)
+_MATH_CLOSE = re.compile(r"^[^\S\n]*\$\$", re.MULTILINE)
+# Lines holding a heading (its '#'s and title) or a depth marker (its name)
+_OUTLINE_LINE = re.compile(
+    r"^[^\S\n]*(?:(#+)([^\n]*)|<!-- depth:([^\n]*)-->[^\S\n]*$)", re.MULTILINE)
+# SourceSpan from a 4-tuple without the Python-level NamedTuple __new__
+_span = functools.partial(tuple.__new__, SourceSpan)
+
+
+def iter_blocks(source: str) -> Iterator[Block]:
+    """Tokenize a .math.md document in one pass, yielding blocks lazily.
+
+    Block openers and closers are found with compiled regexes, so prose
+    lines are never visited one by one in Python: each prose run, code body
+    and ``$$`` block is a single slice of ``source``, which also gives its
+    ``SourceSpan`` offsets. Line numbers are kept by counting newlines
+    between blocks. Prose outlines are left for ``ProseBlock`` to build on
+    first access.
+    """
+    size = len(source)
+    pos = 0  # offset of the first line not yet consumed
+    line = 0  # its line index
+
+    while True:
+        m = _OPENER.search(source, pos)
+        if m is None:
+            # The prose run (if any) goes to the end of the document
+            start, i = size + 1, line + source.count("\n", pos) + 1
+        else:
+            start, eol = m.span()
+            i = line + source.count("\n", pos, start)
+        if pos < start:
+            text = source[pos:start - 1]
+            if text.strip():
+                yield ProseBlock(text if text.endswith("\n") else text + "\n",
+                                 _span((pos, start - 1, line, i - 1)))
+        if m is None:
+            return
+
+        kind = m.group(1)
+        if kind is None:
+            stripped = m.group().strip()
+            if stripped.endswith("$$") and len(stripped) > 2:
+                # Single-line $$...$$ block
+                yield MathBlock(stripped[2:-2].strip(), m.group(), _span((start, eol, i, i)))
+                pos, line = eol + 1, i + 1
+                continue
+            closer = _MATH_CLOSE
+        else:
+            closer = _FENCE_CLOSE
+
+        body = eol + 1
+        c = closer.search(source, body) if body <= size else None
+        if c is None:
+            # Unterminated blocks run to end of document
+            close_start = source.rfind("\n") + 1 if kind is None else size + 1
+            end, last = size, i + source.count("\n", eol)
+        else:
+            close_start = c.start()
+            end = source.find("\n", close_start)
+            if end < 0:
+                end = size
+            last = i + 1 + source.count("\n", body, close_start)
+        span = _span((start, end, i, last))
+        if kind is None:
+            inner = source[body:close_start - 1] if last - i >= 2 else ""
+            yield MathBlock(inner.strip(), source[start:end], span)
+        else:
+            yield _FENCES[kind](code=source[body:close_start - 1], line_number=i + 1, span=span)
+        pos, line = end + 1, last + 1
+
 
 def parse_document(source: str) -> list[Block]:
     """Parse a .math.md document into a sequence of blocks."""
-    blocks: list[Block] = []
-    lines = source.split("\n")
-    i = 0
-    current_prose: list[str] = []
-
-    def flush_prose() -> None:
-        if current_prose:
-            text = "\n".join(current_prose)
-            if text.strip():
-                blocks.append(ProseBlock(content=text + "\n" if not text.endswith("\n") else text))
-            current_prose.clear()
-
-    while i < len(lines):
-        line = lines[i]
-
-        # Check for fixture block: ```python:fixture
-        if line.strip().startswith("```python:fixture"):
-            flush_prose()
-            code_lines: list[str] = []
-            start_line = i + 1
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            blocks.append(FixtureBlock(
-                code="\n".join(code_lines),
-                line_number=start_line,
-            ))
-            i += 1  # Skip closing ```
-            continue
-
-        # Check for results block: ```python:results
-        if line.strip().startswith("```python:results"):
-            flush_prose()
-            code_lines: list[str] = []
-            start_line = i + 1
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            blocks.append(ResultsBlock(
-                code="\n".join(code_lines),
-                line_number=start_line,
-            ))
-            i += 1  # Skip closing ```
-            continue
-
-        # Check for validation block: ```python:validate
-        if line.strip().startswith("```python:validate"):
-            flush_prose()
-            code_lines: list[str] = []
-            start_line = i + 1
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            blocks.append(ValidationBlock(
-                code="\n".join(code_lines),
-                line_number=start_line,
-            ))
-            i += 1  # Skip closing ```
-            continue
-
-        # Check for display math block: $$...$$
-        if line.strip().startswith("$$"):
-            flush_prose()
-            if line.strip().endswith("$$") and len(line.strip()) > 2:
-                # Single-line $$...$$ block
-                blocks.append(MathBlock(
-                    content=line.strip()[2:-2].strip(),
-                    raw=line,
-                ))
-                i += 1
-            else:
-                # Multi-line $$...$$ block
-                math_lines = [line]
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith("$$"):
-                    math_lines.append(lines[i])
-                    i += 1
-                if i < len(lines):
-                    math_lines.append(lines[i])
-                    i += 1
-                raw = "\n".join(math_lines)
-                inner = "\n".join(math_lines[1:-1]) if len(math_lines) > 2 else ""
-                blocks.append(MathBlock(content=inner.strip(), raw=raw))
-            continue
-
-        # Regular prose line
-        current_prose.append(line)
-        i += 1
-
-    flush_prose()
-    return blocks
+    return list(iter_blocks(source))
+
+
+def heading_index(blocks: list[Block]) -> list[tuple[int, Heading]]:
+    """Return (block index, heading) for every heading, in document order."""
+    return [
+        (i, h)
+        for i, block in enumerate(blocks)
+        if isinstance(block, ProseBlock)
+        for h in block.headings
+    ]
+
+
+@dataclass
+class SectionCoverage:
+    """Math block coverage within one section (the text under a heading)."""
+
+    section: str  # heading title, "" for math before the first heading
+    total_math: int
+    covered_math: int
 
 
 @dataclass
@@ -156,6 +255,7 @@ class CoverageResult:
     total_math: int
     covered_math: int
     uncovered_sections: list[str]  # Section headings with uncovered math
+    sections: list[SectionCoverage] = field(default_factory=list)  # sections with math, in order
 
     @property
     def ratio(self) -> float:
@@ -164,47 +264,73 @@ class CoverageResult:
         return self.covered_math / self.total_math
 
 
+def next_block_index(blocks: list[Block], kind: type) -> list[int]:
+    """For each position i, the index of the first ``kind`` block after i.
+
+    Built by one reverse sweep; ``len(blocks)`` means "none after i".
+    """
+    n = len(blocks)
+    nxt = [n] * n
+    following = n
+    for i in range(n - 1, -1, -1):
+        nxt[i] = following
+        if isinstance(blocks[i], kind):
+            following = i
+    return nxt
+
+
 def coverage_metric(blocks: list[Block]) -> CoverageResult:
     """Check how many math blocks have a following validation block.
 
     A math block is 'covered' if a ValidationBlock appears before the next
     MathBlock or end of document (possibly with prose in between).
+    Runs in O(blocks): one reverse sweep decides which math blocks are
+    covered, one forward pass assigns them to sections by each prose
+    block's last heading.
     """
+    math_covered: list[bool] = []
+    validated = False  # a validation block follows, before the next math block
+    for block in reversed(blocks):
+        if isinstance(block, ValidationBlock):
+            validated = True
+        elif isinstance(block, MathBlock):
+            math_covered.append(validated)
+            validated = False
+    math_covered.reverse()
+    covered_iter = iter(math_covered)
+
     total = 0
     covered = 0
     uncovered_sections: list[str] = []
+    sections: list[SectionCoverage] = []
     current_section = ""
+    current: SectionCoverage | None = None
 
-    i = 0
-    while i < len(blocks):
-        block = blocks[i]
-
+    for block in blocks:
         # Track current section heading
         if isinstance(block, ProseBlock):
-            for line in block.content.split("\n"):
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    current_section = stripped.lstrip("#").strip()
-
-        if isinstance(block, MathBlock):
+            title = block.section_title()
+            if title is not None:
+                current_section = title
+                current = None
+
+        elif isinstance(block, MathBlock):
+            if current is None:
+                current = SectionCoverage(section=current_section, total_math=0, covered_math=0)
+                sections.append(current)
             total += 1
-            found_validation = False
-            for j in range(i + 1, len(blocks)):
-                if isinstance(blocks[j], ValidationBlock):
-                    found_validation = True
-                    break
-                if isinstance(blocks[j], MathBlock):
-                    break
-            if found_validation:
+            current.total_math += 1
+            if next(covered_iter):
                 covered += 1
+                current.covered_math += 1
             else:
                 uncovered_sections.append(current_section)
-        i += 1
 
     return CoverageResult(
         total_math=total,
         covered_math=covered,
         uncovered_sections=uncovered_sections,
+        sections=sections,
     )
 
 
@@ -217,75 +343,43 @@ def extract_section_blocks(blocks: list[Block], heading: str) -> list[Block]:
     Because the parser may group multiple headings into one ProseBlock,
     this function also trims prose content at section boundaries.
     """
-    target_level = 0
-    start_idx = None
-    heading_line_idx = None  # line index within the ProseBlock
-
-    for i, block in enumerate(blocks):
-        if not isinstance(block, ProseBlock):
-            continue
-        for li, line in enumerate(block.content.split("\n")):
-            stripped = line.strip()
-            if not stripped.startswith("#"):
-                continue
-            hashes = len(stripped) - len(stripped.lstrip("#"))
-            title = stripped.lstrip("#").strip()
-            if title == heading:
-                target_level = hashes
-                start_idx = i
-                heading_line_idx = li
-                break
-        if start_idx is not None:
-            break
-
-    if start_idx is None:
+    start = next(((i, h) for i, h in heading_index(blocks) if h.title == heading), None)
+    if start is None:
         return []
+    start_idx, start_heading = start
+    target_level = start_heading.level
 
-    def _trim_prose_at_boundary(text: str, level: int, *, skip_first_heading: bool = False) -> tuple[str, bool]:
-        """Return (trimmed_text, hit_boundary).
-
-        If skip_first_heading is True, the first heading matching the target
-        heading is skipped (used for the starting block).
-        """
-        lines = text.split("\n")
-        skipped = False
-        out: list[str] = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                hashes = len(stripped) - len(stripped.lstrip("#"))
-                if hashes <= level:
-                    if skip_first_heading and not skipped:
-                        skipped = True
-                    else:
-                        # Hit a boundary — return what we have so far
-                        trimmed = "\n".join(out)
-                        return trimmed, True
-            out.append(line)
-        return "\n".join(out), False
-
-    # Build the starting ProseBlock content: lines from heading onward,
+    def _boundary(block: ProseBlock, after_line: int) -> int | None:
+        """Line of the first same-or-higher heading after ``after_line``."""
+        for h in block.headings:
+            if h.line > after_line and h.level <= target_level:
+                return h.line
+        return None
+
+    # The starting ProseBlock contributes lines from the heading onward,
     # trimmed at the next same-or-higher heading.
     start_block = blocks[start_idx]
-    start_lines = start_block.content.split("\n")
-    section_text = "\n".join(start_lines[heading_line_idx:])
-    trimmed_text, hit = _trim_prose_at_boundary(section_text, target_level, skip_first_heading=True)
+    hit = _boundary(start_block, start_heading.line)
+    lines = start_block.content.split("\n")
+    trimmed_text = "\n".join(lines[start_heading.line:hit])
 
     result: list[Block] = []
     if trimmed_text.strip():
         result.append(ProseBlock(content=trimmed_text))
 
-    if hit:
+    if hit is not None:
         return result
 
     for block in blocks[start_idx + 1:]:
         if isinstance(block, ProseBlock):
-            trimmed, hit = _trim_prose_at_boundary(block.content, target_level, skip_first_heading=False)
+            hit = _boundary(block, -1)
+            if hit is None:
+                result.append(block)
+                continue
+            trimmed = "\n".join(block.content.split("\n")[:hit])
             if trimmed.strip():
                 result.append(ProseBlock(content=trimmed))
-            if hit:
-                return result
-        else:
-            result.append(block)
+            return result
+        result.append(block)
 
     return result
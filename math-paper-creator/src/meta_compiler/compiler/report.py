@@ -27,6 +27,8 @@ class Report:
     test_errors: list[str]
     test_warnings: list[str]
     coverage: dict
+    # Z3 outcome per property: name, status and the given axioms it needed
+    proofs: list[dict] = field(default_factory=list)
 
     def to_text(self) -> str:
         """Render report as human-readable text."""
@@ -74,6 +76,11 @@ class Report:
             lines.append("")
             lines.append(f"  Axioms declared: {len(axioms)}")
             lines.append(f"  Properties declared: {len(properties)}")
+            for proof in self.proofs:
+                line = f"  {proof['name']}: {proof['status']}"
+                if proof["needs"] is not None:
+                    line += f" (needs {', '.join(proof['needs']) or 'no axioms'})"
+                lines.append(line)
             lines.append("")
 
         # Test results
@@ -117,6 +124,7 @@ def generate_report(
             "covered_math": cov.covered_math,
             "uncovered_sections": cov.uncovered_sections,
         },
+        proofs=_build_proofs(getattr(test_result, "verification", None)),
     )
 
 
@@ -165,24 +173,16 @@ def _build_symbol_table(registry: Registry) -> list[dict]:
     return table
 
 
-def _build_dependency_graph(registry: Registry) -> list[dict]:
-    """Build dependency edges from over/index fields and expr source."""
-    from meta_compiler.checks import _extract_names_from_source
+def _build_proofs(verification) -> list[dict]:
+    """Per-property Z3 outcomes from an ``ExecutionResult.verification``."""
+    if verification is None:
+        return []
+    return [
+        {"name": name, "status": r.status, "needs": r.core}
+        for name, r in verification.properties.items()
+    ]
 
-    edges: list[dict] = []
-    for name in registry._registration_order:
-        sym = registry.symbols[name]
-        refs: set[str] = set()
-        if hasattr(sym, "over") and sym.over:
-            refs.add(sym.over)
-        if hasattr(sym, "index") and sym.index:
-            for idx in (sym.index if isinstance(sym.index, tuple) else (sym.index,)):
-                refs.add(idx)
-        # Trace references from expr source (covers scalar models)
-        expr_fn = getattr(sym, "expr", None)
-        if expr_fn is not None:
-            refs |= _extract_names_from_source(expr_fn, registry)
-        refs.discard(name)  # no self-edges
-        for ref in sorted(refs):
-            edges.append({"from": name, "to": ref})
-    return edges
+
+def _build_dependency_graph(registry: Registry) -> list[dict]:
+    """Dependency edges from over/index fields and expr source."""
+    return [{"from": src, "to": dst} for src, dst in registry.dependency_graph.edges()]
@@ -73,6 +73,8 @@ def generate_runner(blocks: list[Block], *, model_path: str = "model.model.md")
         parts.append('                     if not k.startswith("_") and k not in ("strict", "sys")}')
         parts.append('    for _name, _value in _frame_locals.items():')
         parts.append('        registry.data_store[_name] = _value')
+        parts.append('    from meta_compiler.fixtures import bind_columns')
+        parts.append('    bind_columns(registry.data_store)')
         parts.append('')
 
     # Emit results blocks — display computed values
@@ -0,0 +1,242 @@
+"""Long-lived validation server for the PostToolUse hook.
+
+The hook script used to start a fresh interpreter per edit, paying the
+import cost of meta_compiler, numpy, and z3 every time. The daemon keeps
+those modules loaded and holds one ``IncrementalExecutor`` per file, so
+consecutive edits to the same document only re-execute changed blocks.
+
+Protocol: the client connects to a Unix socket, sends one JSON line
+``{"path": "/abs/file.model.md", "strict": false}``, and reads one JSON
+line back with the same shape ``check_file`` returns. Any failure on the
+client side returns None so callers can fall back to ``check_file``.
+
+The hook itself is killed after ``HOOK_BUDGET_S``. ``check_within`` keeps a
+daemon request plus the in-process fallback inside that budget: the request
+gets the budget minus a safety margin, the fallback only runs if at least
+``MIN_FALLBACK_S`` remain, and its Z3 deadline is capped at half of what
+remains. When there is no time left it returns None, and the hook reports
+the check as skipped instead of being killed with no result.
+
+Usage:
+    python -m meta_compiler.cli daemon [--socket PATH] [--idle-timeout SECONDS]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+_MAX_TRACKED_FILES = 32
+# Z3 time budget per check, well inside the hook's 30s limit; properties
+# still unproven by then are reported as warnings
+PROOF_DEADLINE_S = 15.0
+# PostToolUse hook timeout (hooks/hooks.json) and the time kept back from it
+# for interpreter start-up and writing the response
+HOOK_BUDGET_S = 30.0
+_HOOK_MARGIN_S = 3.0
+# Least time worth starting a cold in-process check with
+MIN_FALLBACK_S = 10.0
+
+
+def default_socket_path() -> Path:
+    """Socket location: $META_COMPILER_SOCKET, else a per-user runtime path."""
+    env = os.environ.get("META_COMPILER_SOCKET")
+    if env:
+        return Path(env)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "meta-compiler.sock"
+    return Path(tempfile.gettempdir()) / f"meta-compiler-{os.getuid()}.sock"
+
+
+def check_file(
+    path: str | Path,
+    *,
+    strict: bool = False,
+    executor=None,
+    proof_deadline: float | None = PROOF_DEADLINE_S,
+) -> dict:
+    """Validate a .model.md file and return a JSON-serializable summary."""
+    from meta_compiler.compiler import execute_blocks, parse_document
+    from meta_compiler.compiler.parser import coverage_metric
+    from meta_compiler.fixtures import use_data_dir
+
+    blocks = parse_document(Path(path).read_text())
+    cov = coverage_metric(blocks)
+    with use_data_dir(Path(path).parent):
+        if executor is not None:
+            result = executor.execute(blocks, strict=strict, proof_deadline=proof_deadline)
+        else:
+            result = execute_blocks(blocks, strict=strict, proof_deadline=proof_deadline)
+    return {
+        "passed": result.passed,
+        "errors": list(result.errors),
+        "warnings": list(result.warnings),
+        "coverage": {
+            "total_math": cov.total_math,
+            "covered_math": cov.covered_math,
+            "uncovered_sections": list(cov.uncovered_sections),
+            "sections": [
+                {"section": sc.section, "total_math": sc.total_math,
+                 "covered_math": sc.covered_math}
+                for sc in cov.sections
+            ],
+        },
+    }
+
+
+def request_check(
+    path: str | Path,
+    *,
+    strict: bool = False,
+    socket_path: str | Path | None = None,
+    timeout: float = HOOK_BUDGET_S - _HOOK_MARGIN_S,
+) -> dict | None:
+    """Ask a running daemon to check ``path``. Returns None if unavailable."""
+    sock_path = Path(socket_path) if socket_path else default_socket_path()
+    if not sock_path.exists():
+        return None
+    request = json.dumps({"path": str(Path(path).resolve()), "strict": strict})
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(sock_path))
+            sock.sendall(request.encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        response = json.loads(line)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(response, dict) or "error" in response:
+        return None
+    return response
+
+
+def check_within(
+    path: str | Path,
+    *,
+    strict: bool = False,
+    budget_s: float = HOOK_BUDGET_S,
+    socket_path: str | Path | None = None,
+) -> dict | None:
+    """Check ``path`` via the daemon, else in-process, finishing within ``budget_s``.
+
+    Returns None when the daemon did not answer and too little time is left
+    for an in-process check.
+    """
+    deadline = time.monotonic() + budget_s - _HOOK_MARGIN_S
+    result = request_check(path, strict=strict, socket_path=socket_path,
+                           timeout=max(0.1, deadline - time.monotonic()))
+    if result is not None:
+        return result
+    remaining = deadline - time.monotonic()
+    if remaining < MIN_FALLBACK_S:
+        return None
+    return check_file(path, strict=strict,
+                      proof_deadline=min(PROOF_DEADLINE_S, remaining / 2))
+
+
+class _CheckHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON-line check request."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return  # liveness probe or client gave up
+        try:
+            request = json.loads(line)
+            response = self.server.check(request["path"], strict=bool(request.get("strict")))
+        except Exception as e:  # report, never crash the server
+            response = {"error": f"{type(e).__name__}: {e}"}
+        try:
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+        except BrokenPipeError:
+            pass
+
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server with per-file incremental state.
+
+    Requests are handled one at a time because validation mutates the
+    global registry.
+    """
+
+    def __init__(self, socket_path: str | Path, *, idle_timeout: float | None = None):
+        self.socket_path = Path(socket_path)
+        self.timeout = idle_timeout
+        self._executors: OrderedDict[str, object] = OrderedDict()
+        self._idle = False
+        # Before binding, so a failed import leaves no socket file behind
+        _warm_imports()
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _CheckHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def check(self, path: str, *, strict: bool = False) -> dict:
+        """Check ``path`` with the executor cached for that file."""
+        from meta_compiler.compiler.incremental import IncrementalExecutor
+
+        key = str(Path(path).resolve())
+        executor = self._executors.pop(key, None) or IncrementalExecutor()
+        self._executors[key] = executor
+        while len(self._executors) > _MAX_TRACKED_FILES:
+            self._executors.popitem(last=False)
+        return check_file(key, strict=strict, executor=executor)
+
+    def handle_timeout(self) -> None:
+        self._idle = True
+
+    def serve_until_idle(self) -> None:
+        """Serve requests until ``idle_timeout`` elapses with no traffic."""
+        if self.timeout is None:
+            self.serve_forever()
+            return
+        while not self._idle:
+            self.handle_request()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Unlink a leftover socket file, refusing if a live server owns it."""
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+            return
+    raise RuntimeError(f"A validation daemon is already listening on {path}")
+
+
+def _warm_imports() -> None:
+    """Import the modules every check needs so the first request is fast."""
+    import meta_compiler.checks  # noqa: F401
+    import meta_compiler.compiler  # noqa: F401
+    import numpy  # noqa: F401
+    from meta_compiler.verification import z3_available
+    z3_available()
+
+
+def serve(socket_path: str | Path | None = None, *, idle_timeout: float | None = None) -> None:
+    """Run the validation daemon in the foreground."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+    server = ValidationServer(path, idle_timeout=idle_timeout)
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,446 @@
+"""Columnar fixture data.
+
+A ``python:fixture`` block normally builds parameters as dicts keyed by set
+member. For parameters over large sets that costs a Python object per
+entry and a hash lookup per access. ``Column`` instead stores the values as
+one NumPy array whose axes are aligned to the member order of the index
+sets::
+
+    from meta_compiler.fixtures import Column
+    W = [f"w{i}" for i in range(1_000_000)]
+    cap = Column("W", np.random.default_rng(0).uniform(0, 100, len(W)))
+
+After the fixture blocks run, the executor binds every column to its sets'
+member lists (``bind_columns``). Each set's member -> position index is
+built once and shared by all columns over that set. A bound column behaves
+like the equivalent read-only dict (``cap["w3"]``, ``len``, iteration,
+``in``) and proxies additionally accept vectorized keys: a ``VectorIndex``
+over the whole set returns a view of the array, and a list of members
+returns the matching values.
+
+Large data can instead come from files. ``load_npy``, ``load_npz`` and
+``load_csv`` return a column (when given ``index=``) or a set's member list
+(without it)::
+
+    W = load_csv("data/workers.csv", "worker")
+    cap = load_csv("data/workers.csv", "capacity", index="W")
+    demand = load_npy("data/demand.npy", index=("W", "P"))
+
+Columns from files are not opened until a proxy first reads them, and are
+then memory-mapped rather than read into memory. Member lists are read when
+the fixture is bound, since every column over the set is aligned to them.
+CSV columns and ``.npz`` members are parsed once into a ``.npy`` file next
+to the source, named after the source's modification time, so later runs
+map that file directly and an edited source is re-parsed.
+
+Relative paths resolve against the data directory bound with
+``use_data_dir`` -- the document's own directory when the CLI, the batch
+checker or the daemon runs it -- and against the working directory
+otherwise, so a document reads the same files wherever it is checked from.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import glob
+import itertools
+import os
+import re
+from collections.abc import Iterator, Mapping
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from meta_compiler.proxy import NotVectorizable, VectorIndex
+
+
+class MemberIndex:
+    """A set's member list plus its member -> position map.
+
+    The map is built on first use (whole-set vectorized access never needs
+    it) and then shared by every column over the set.
+    """
+
+    __slots__ = ("set_name", "members", "_positions")
+
+    def __init__(self, set_name: str, members: list) -> None:
+        self.set_name = set_name
+        self.members = members
+        self._positions: dict | None = None
+
+    @property
+    def positions(self) -> dict:
+        if self._positions is None:
+            positions = {m: i for i, m in enumerate(self.members)}
+            if len(positions) != len(self.members):
+                raise ValueError(f'set "{self.set_name}" has duplicate members')
+            self._positions = positions
+        return self._positions
+
+
+class Column(Mapping):
+    """Parameter values as a NumPy array aligned to index-set member order."""
+
+    def __init__(self, index: str | tuple[str, ...] | list[str], values: Any) -> None:
+        import numpy as np
+
+        self.index = (index,) if isinstance(index, str) else tuple(index)
+        self.values = np.asarray(values)
+        if self.values.ndim != len(self.index):
+            raise ValueError(
+                f"Column over {self.index} needs a {len(self.index)}-D array, "
+                f"got {self.values.ndim}-D"
+            )
+        self._axes: tuple[MemberIndex, ...] | None = None
+        self._item = self.values.item
+
+    # -- binding -----------------------------------------------------------
+
+    def bind(self, name: str, data_store: dict, indexes: dict[str, MemberIndex]) -> None:
+        """Align to the member lists in ``data_store`` (shared via ``indexes``)."""
+        axes = []
+        for axis, set_name in enumerate(self.index):
+            members = data_store.get(set_name)
+            if not isinstance(members, list):
+                raise ValueError(
+                    f'Column "{name}": set "{set_name}" needs a member list in the fixture'
+                )
+            if set_name not in indexes:
+                indexes[set_name] = MemberIndex(set_name, members)
+            if self.values.shape[axis] != len(members):
+                raise ValueError(
+                    f'Column "{name}": axis {axis} has {self.values.shape[axis]} values '
+                    f'but set "{set_name}" has {len(members)} members'
+                )
+            axes.append(indexes[set_name])
+        self._axes = tuple(axes)
+
+    @property
+    def axes(self) -> tuple[MemberIndex, ...]:
+        if self._axes is None:
+            raise RuntimeError(f"Column over {self.index} is not bound to its sets yet")
+        return self._axes
+
+    # -- dict semantics ----------------------------------------------------
+
+    def _position(self, key) -> int | tuple[int, ...]:
+        axes = self.axes
+        try:
+            if len(axes) == 1:
+                return axes[0].positions[key]
+            if type(key) is not tuple or len(key) != len(axes):
+                raise KeyError(key)
+            return tuple(ax.positions[k] for ax, k in zip(axes, key))
+        except TypeError:  # unhashable key
+            raise KeyError(key) from None
+
+    def __getitem__(self, key):
+        # .item() returns a Python scalar, matching what a dict of numbers holds
+        return self._item(self._position(key))
+
+    def __contains__(self, key) -> bool:
+        try:
+            self._position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        axes = self.axes
+        if len(axes) == 1:
+            return iter(axes[0].members)
+        return itertools.product(*(ax.members for ax in axes))
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def __repr__(self) -> str:
+        return f"Column({self.index!r}, shape={self.values.shape}, dtype={self.values.dtype})"
+
+    # -- vectorized access -------------------------------------------------
+
+    def lookup(self, key):
+        """Resolve a proxy subscript: member key, member list, or VectorIndex.
+
+        A ``VectorIndex`` spanning a whole set selects the full axis and
+        returns a view (no copy); a subset of members or a list of members
+        gathers their positions. At most one axis may be vectorized.
+        """
+        axes = self.axes
+        if len(axes) == 1:
+            if type(key) is VectorIndex or type(key) is list:
+                return self.values[self._axis_selector(axes[0], key)]
+            return self._item(axes[0].positions[key])
+        if type(key) is tuple and len(key) == len(axes):
+            vectors = sum(1 for k in key if _is_vector(k))
+            if vectors > 1:
+                raise NotVectorizable(f"{self!r} indexed by several vectorized sets")
+            if vectors == 1:
+                return self.values[tuple(
+                    self._axis_selector(ax, k) for ax, k in zip(axes, key)
+                )]
+        return self[key]
+
+    @staticmethod
+    def _axis_selector(ax: MemberIndex, part):
+        import numpy as np
+
+        if type(part) is VectorIndex:
+            if part.members is ax.members:
+                return slice(None)
+            members = part.members
+        elif type(part) is list:
+            members = part
+        else:
+            return ax.positions[part]
+        return np.fromiter((ax.positions[m] for m in members), dtype=np.intp,
+                           count=len(members))
+
+
+def _is_vector(part) -> bool:
+    return type(part) is VectorIndex or type(part) is list
+
+
+def bind_columns(data_store: dict) -> list[Path]:
+    """Bind every ``Column`` in ``data_store`` to its sets' member lists.
+
+    File-backed member lists (``FileMembers``) are read first and replaced by
+    plain lists. Returns the resolved paths of all data files the fixture
+    loads, in first-use order.
+    """
+    files: dict[Path, None] = {}
+    for name, value in data_store.items():
+        if isinstance(value, FileMembers):
+            files[value.source.path.resolve()] = None
+            data_store[name] = value.load(name)
+    indexes: dict[str, MemberIndex] = {}
+    for name, value in data_store.items():
+        if isinstance(value, Column):
+            value.bind(name, data_store, indexes)
+            if isinstance(value, FileColumn):
+                files[value.source.path.resolve()] = None
+    return list(files)
+
+
+# -- file-backed data ------------------------------------------------------
+
+
+_data_dir: ContextVar["Path | None"] = ContextVar("meta_compiler_data_dir", default=None)
+
+
+@contextlib.contextmanager
+def use_data_dir(path: str | os.PathLike | None) -> Iterator[None]:
+    """Resolve relative fixture file paths against ``path`` in the enclosed code."""
+    token = _data_dir.set(None if path is None else Path(path))
+    try:
+        yield
+    finally:
+        _data_dir.reset(token)
+
+
+class _ArraySource:
+    """Where a file-backed array comes from and how to (re)build its cache."""
+
+    def __init__(self, path: str | os.PathLike, kind: str, key: str | None = None) -> None:
+        base = _data_dir.get()
+        self.path = Path(path) if base is None else base / path
+        self.kind = kind  # "npy", "npz" or "csv"
+        self.key = key  # npz member or CSV column
+
+    def __repr__(self) -> str:
+        return f"{self.path}" + (f"[{self.key}]" if self.key is not None else "")
+
+    def open(self):
+        """The array, memory-mapped where the format allows."""
+        import numpy as np
+
+        if not self.path.exists():
+            raise ValueError(f"fixture file {self.path} does not exist")
+        if self.kind == "npy":
+            return np.load(self.path, mmap_mode="r", allow_pickle=False)
+        cache = self.cache_path()
+        if cache.exists():
+            return np.load(cache, mmap_mode="r", allow_pickle=False)
+        array = self._parse()
+        try:
+            _write_cache(cache, array)
+        except OSError:
+            return array  # read-only data directory: use the parsed copy
+        return np.load(cache, mmap_mode="r", allow_pickle=False)
+
+    def cache_path(self) -> Path:
+        """``.<file>.<key>.<mtime_ns>.npy`` in the source's directory."""
+        key = re.sub(r"[^\w.-]", "_", str(self.key))
+        mtime = self.path.stat().st_mtime_ns
+        return self.path.with_name(f".{self.path.name}.{key}.{mtime}.npy")
+
+    def _parse(self):
+        import numpy as np
+
+        if self.kind == "npz":
+            with np.load(self.path, allow_pickle=False) as archive:
+                if self.key not in archive.files:
+                    raise ValueError(
+                        f"{self.path} has no array {self.key!r} "
+                        f"(arrays: {', '.join(archive.files)})"
+                    )
+                return archive[self.key]
+        with open(self.path, newline="") as fh:
+            reader = csv.reader(fh)
+            header = next(reader, [])
+            if self.key not in header:
+                raise ValueError(
+                    f"{self.path} has no column {self.key!r} (columns: {', '.join(header)})"
+                )
+            col = header.index(self.key)
+            try:
+                cells = [row[col] for row in reader if row]
+            except IndexError:
+                raise ValueError(
+                    f"{self.path} line {reader.line_num}: row has no {self.key!r} cell "
+                    f"(expected at least {col + 1} cells)"
+                ) from None
+        return _typed(np.asarray(cells, dtype=str))
+
+
+def _typed(cells):
+    """CSV cells as integers, else floats, else strings."""
+    import numpy as np
+
+    for dtype in (np.int64, np.float64):
+        try:
+            return cells.astype(dtype)
+        except ValueError:
+            continue
+    return cells
+
+
+def _write_cache(cache: Path, array) -> None:
+    """Write ``cache`` atomically and drop caches for older versions of the source."""
+    import numpy as np
+
+    stem = cache.name.rsplit(".", 2)[0]  # without "<mtime>.npy"
+    for stale in cache.parent.glob(f"{glob.escape(stem)}.*.npy"):
+        if stale != cache and stale.name[len(stem) + 1:-4].isdigit():
+            stale.unlink(missing_ok=True)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, array, allow_pickle=False)
+    os.replace(tmp, cache)
+
+
+class FileColumn(Column):
+    """A ``Column`` whose array is opened from a file on first use."""
+
+    def __init__(self, index: str | tuple[str, ...] | list[str], source: _ArraySource) -> None:
+        self.index = (index,) if isinstance(index, str) else tuple(index)
+        self.source = source
+        self._name = ""
+        self._axes = None
+
+    @property
+    def values(self):
+        if not self.loaded:
+            self._load()
+        return self._values
+
+    def __getattr__(self, attr: str):
+        # ``_item`` is set once the file has been opened
+        if attr == "_item":
+            self._load()
+            return self._item
+        raise AttributeError(attr)
+
+    @property
+    def loaded(self) -> bool:
+        return "_values" in self.__dict__
+
+    def bind(self, name: str, data_store: dict, indexes: dict[str, MemberIndex]) -> None:
+        """Record the member lists; the shape is checked when the file is opened."""
+        axes = []
+        for set_name in self.index:
+            members = data_store.get(set_name)
+            if not isinstance(members, list):
+                raise ValueError(
+                    f'Column "{name}": set "{set_name}" needs a member list in the fixture'
+                )
+            if set_name not in indexes:
+                indexes[set_name] = MemberIndex(set_name, members)
+            axes.append(indexes[set_name])
+        self._name = name
+        self._axes = tuple(axes)
+
+    def _load(self) -> None:
+        values = self.source.open()
+        if values.ndim != len(self.index):
+            raise ValueError(
+                f'Column "{self._name}": {self.source} holds a {values.ndim}-D array '
+                f"but is indexed by {len(self.index)} sets {self.index}"
+            )
+        for axis, ax in enumerate(self.axes):
+            if values.shape[axis] != len(ax.members):
+                raise ValueError(
+                    f'Column "{self._name}": axis {axis} of {self.source} has '
+                    f"{values.shape[axis]} values but set \"{ax.set_name}\" has "
+                    f"{len(ax.members)} members"
+                )
+        self._values = values
+        self._item = values.item
+
+    def __len__(self) -> int:
+        size = 1
+        for ax in self.axes:
+            size *= len(ax.members)
+        return size
+
+    def __repr__(self) -> str:
+        return f"FileColumn({self.index!r}, {self.source!r})"
+
+
+class FileMembers:
+    """A set's member list read from a file by ``bind_columns``."""
+
+    def __init__(self, source: _ArraySource) -> None:
+        self.source = source
+
+    def load(self, name: str) -> list:
+        values = self.source.open()
+        if values.ndim != 1:
+            raise ValueError(
+                f'Set "{name}": {self.source} holds a {values.ndim}-D array, '
+                f"members need 1-D"
+            )
+        return values.tolist()
+
+    def __repr__(self) -> str:
+        return f"FileMembers({self.source!r})"
+
+
+def _file_data(source: _ArraySource, index) -> FileColumn | FileMembers:
+    if index is None:
+        return FileMembers(source)
+    return FileColumn(index, source)
+
+
+def load_npy(path: str | os.PathLike, *, index: str | tuple[str, ...] | None = None):
+    """Set members (no ``index``) or a column memory-mapped from a ``.npy`` file."""
+    return _file_data(_ArraySource(path, "npy"), index)
+
+
+def load_npz(path: str | os.PathLike, key: str, *,
+             index: str | tuple[str, ...] | None = None):
+    """Set members or a column from array ``key`` of a ``.npz`` archive."""
+    return _file_data(_ArraySource(path, "npz", key), index)
+
+
+def load_csv(path: str | os.PathLike, column: str, *,
+             index: str | tuple[str, ...] | None = None):
+    """Set members or a 1-D column from one named column of a CSV file.
+
+    Rows are taken in file order, so a column's rows must follow the member
+    order of its set. Cells are parsed as integers, else floats, else strings.
+    """
+    if index is not None and not isinstance(index, str) and len(tuple(index)) != 1:
+        raise ValueError(f"load_csv reads one column, so index must name one set, got {index!r}")
+    return _file_data(_ArraySource(path, "csv", column), index)
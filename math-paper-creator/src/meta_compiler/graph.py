@@ -0,0 +1,168 @@
+"""Symbol dependency graph, built once per registry state.
+
+Edges run from a symbol to what it depends on: the set in its ``over``
+field, the sets in its ``index``, and every registered symbol named in its
+callable's source (via the registry's ``SourceAnalysis`` cache). Cycle
+detection, the report's dependency listing, and incremental invalidation
+all read the same graph instead of re-extracting names.
+
+Strongly connected components are found with an iterative Tarjan search,
+so arbitrarily long expression chains cannot hit Python's recursion limit.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from meta_compiler.registry import Registry
+
+
+class DependencyGraph:
+    """Directed symbol -> dependency edges over the registered symbols."""
+
+    def __init__(self, order: list[str], edges: dict[str, tuple[str, ...]]) -> None:
+        self.order = order  # registration order
+        self._edges = edges  # name -> sorted dependencies (no self-edges)
+        self._rank = {name: i for i, name in enumerate(order)}
+        self._dependents: dict[str, set[str]] | None = None
+
+    @classmethod
+    def build(cls, registry: "Registry") -> "DependencyGraph":
+        order = [name for name in registry._registration_order if name in registry.symbols]
+        registered = registry.symbols.keys()
+        edges: dict[str, tuple[str, ...]] = {}
+        for name in order:
+            sym = registry.symbols[name]
+            refs: set[str] = set()
+            if getattr(sym, "over", None):
+                refs.add(sym.over)
+            if getattr(sym, "index", None):
+                refs.update(sym.index if isinstance(sym.index, tuple) else (sym.index,))
+            expr_fn = getattr(sym, "expr", None)
+            if expr_fn is not None:
+                refs |= registry.analysis.names(expr_fn) & registered
+            refs.discard(name)  # no self-edges
+            edges[name] = tuple(sorted(refs))
+        return cls(order, edges)
+
+    def dependencies(self, name: str) -> tuple[str, ...]:
+        """Direct dependencies of ``name``, sorted by name."""
+        return self._edges.get(name, ())
+
+    def dependents(self, name: str) -> set[str]:
+        """Symbols that depend directly on ``name``."""
+        if self._dependents is None:
+            self._dependents = {n: set() for n in self.order}
+            for src, targets in self._edges.items():
+                for dst in targets:
+                    self._dependents.setdefault(dst, set()).add(src)
+        return self._dependents.get(name, set())
+
+    def downstream(self, names: Iterable[str]) -> set[str]:
+        """``names`` plus every symbol that transitively depends on them."""
+        seen = set(names)
+        queue = deque(seen)
+        while queue:
+            for dependent in self.dependents(queue.popleft()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen
+
+    def edges(self) -> list[tuple[str, str]]:
+        """(from, to) pairs in registration order, targets sorted by name."""
+        return [(src, dst) for src in self.order for dst in self._edges[src]]
+
+    def strongly_connected_components(
+        self, within: set[str] | None = None
+    ) -> list[list[str]]:
+        """SCCs of the subgraph induced by ``within`` (default: every symbol).
+
+        Components and their members are ordered by registration order.
+        """
+        nodes = [n for n in self.order if within is None or n in within]
+        member = set(nodes)
+        rank = self._rank
+        succ = {
+            n: sorted((d for d in self._edges[n] if d in member), key=rank.__getitem__)
+            for n in nodes
+        }
+
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in nodes:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(succ[root]))]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(succ[child])))
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.discard(w)
+                            component.append(w)
+                            if w == node:
+                                break
+                        components.append(sorted(component, key=rank.__getitem__))
+
+        components.sort(key=lambda c: rank[c[0]])
+        return components
+
+    def cycles(self, within: set[str] | None = None) -> list[list[str]]:
+        """One cycle per cyclic component, as a closed path ``[a, b, ..., a]``.
+
+        Each cycle starts at the component's earliest-registered symbol and
+        is a shortest path back to it.
+        """
+        cycles = []
+        for component in self.strongly_connected_components(within):
+            if len(component) > 1:
+                cycles.append(self._shortest_cycle(component))
+        return cycles
+
+    def _shortest_cycle(self, component: list[str]) -> list[str]:
+        start = component[0]
+        member = set(component)
+        rank = self._rank
+        parent: dict[str, str] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for dep in sorted((d for d in self._edges[node] if d in member),
+                              key=rank.__getitem__):
+                if dep == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    return path[::-1] + [start]
+                if dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        return component + [start]  # unreachable for a strongly connected component
@@ -0,0 +1,619 @@
+"""Optional solving stage: lower the model to a sparse LP/MILP and solve it.
+
+Numeric mode checks that the fixture's decision variables satisfy the
+constraints and that each objective evaluates to a number. This module goes
+further: it rebuilds the registered Variables as matrix columns, re-evaluates
+the hard Constraints and the Objectives with every variable replaced by a
+linear expression (``LinExpr``), assembles the resulting rows into one sparse
+matrix, and solves it with ``scipy.optimize.milp``. Each objective is
+reported with its optimum and the fixture assignment's gap against it.
+
+Lowering reuses the vectorized-evaluation idea of the executor: a
+per-member constraint is first called once with the set's ``VectorIndex``,
+which yields a whole block of rows as NumPy arrays; constraints that branch
+on the member fall back to one call per member. Strict inequalities are
+relaxed to ``<=``/``>=``. Constraints that are not linear in the variables
+(products of variables, chained comparisons, ``and``/``or``) are left out
+and reported, so the optimum is then a bound on
+the true problem rather than its solution.
+
+Variable domains map to the solver as follows: ``binary`` is an integer
+column in [0, 1], ``integer``/``nonneg_int`` are integer columns,
+``nonneg_real``/``nonneg_int`` get a lower bound of 0; ``bounds`` are
+intersected with those.
+
+Requires scipy: pip install scipy
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from meta_compiler.proxy import NotVectorizable, VectorIndex
+from meta_compiler.symbols import (
+    ConstraintSymbol,
+    ExpressionSymbol,
+    ObjectiveSymbol,
+    VariableSymbol,
+)
+
+if TYPE_CHECKING:
+    from meta_compiler.registry import Registry
+
+_INTEGER_DOMAINS = {"binary", "integer", "nonneg_int"}
+_NONNEGATIVE_DOMAINS = {"binary", "nonneg_real", "nonneg_int"}
+
+
+@dataclass
+class OptimizationResult:
+    """Solution of one objective over the lowered model."""
+    objective: str
+    sense: str
+    status: str  # "optimal", "infeasible", "unbounded", "limit", "skipped", "error"
+    optimum: float | None = None
+    fixture_value: float | None = None
+    gap: float | None = None  # fixture's relative shortfall from the optimum
+    mip_gap: float | None = None
+    omitted: dict[str, str] = field(default_factory=dict)  # constraint -> reason
+    variables: int = 0
+    rows: int = 0
+    error: str | None = None
+    duration_s: float | None = None
+
+
+def scipy_available() -> bool:
+    """Check if scipy is installed."""
+    try:
+        import scipy.optimize  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class NotLinear(Exception):
+    """Raised when an expression is not linear in the decision variables."""
+
+
+# -- linear expressions ------------------------------------------------------
+
+
+class LinExpr:
+    """A batch of ``rows`` affine expressions over the variable columns.
+
+    Each term is ``(cols, coefs)``: Python numbers when the term is the same
+    for every row, else arrays of length ``rows``. Terms are appended to a
+    list shared with the expression they were built from; ``_size`` marks
+    how much of it belongs to this expression, so ``sum()`` over many terms
+    stays linear in the number of terms.
+    """
+
+    __slots__ = ("_terms", "_size", "const", "rows")
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+    __hash__ = None
+
+    def __init__(self, terms: list, size: int, const: Any, rows: int) -> None:
+        self._terms = terms
+        self._size = size
+        self.const = const
+        self.rows = rows
+
+    @classmethod
+    def column(cls, cols) -> "LinExpr":
+        rows = 1 if isinstance(cols, int) else len(cols)
+        return cls([(cols, 1.0)], 1, 0.0, rows)
+
+    @property
+    def terms(self) -> list:
+        return self._terms[: self._size]
+
+    # -- combining ---------------------------------------------------------
+
+    def _rows_with(self, other_rows: int) -> int:
+        if self.rows == other_rows or other_rows == 1:
+            return self.rows
+        if self.rows == 1:
+            return other_rows
+        raise NotVectorizable(f"row counts {self.rows} and {other_rows} do not broadcast")
+
+    def _add(self, other, sign: float) -> "LinExpr":
+        if isinstance(other, LinExpr):
+            rows = self._rows_with(other.rows)
+            more = other.terms if sign > 0 else [(c, -k) for c, k in other.terms]
+            terms = self._terms
+            if len(terms) == self._size:  # nobody extended our list yet
+                terms.extend(more)
+            else:
+                terms = terms[: self._size] + more
+            return LinExpr(terms, len(terms), self.const + sign * other.const, rows)
+        value = _constant(other)
+        rows = self._rows_with(_length(value))
+        return LinExpr(self._terms, self._size, self.const + sign * value, rows)
+
+    def _scale(self, factor) -> "LinExpr":
+        if isinstance(factor, LinExpr):
+            if factor._size:
+                raise NotLinear("product of decision variables")
+            factor = factor.const
+        factor = _constant(factor)
+        rows = self._rows_with(_length(factor))
+        terms = [(cols, coefs * factor) for cols, coefs in self.terms]
+        return LinExpr(terms, len(terms), self.const * factor, rows)
+
+    def __add__(self, other):
+        return self._add(other, 1.0)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._add(other, -1.0)
+
+    def __rsub__(self, other):
+        return self._scale(-1.0)._add(other, 1.0)
+
+    def __neg__(self):
+        return self._scale(-1.0)
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, other):
+        return self._scale(other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, LinExpr):
+            if other._size:
+                raise NotLinear("division by a decision variable")
+            other = other.const
+        return self._scale(1.0 / _constant(other))
+
+    def __rtruediv__(self, other):
+        raise NotLinear("division by a decision variable")
+
+    def __pow__(self, other):
+        if other == 1:
+            return self
+        raise NotLinear("power of a decision variable")
+
+    # -- constraints -------------------------------------------------------
+
+    def __le__(self, other):
+        return LinRows(self - other, "<=")
+
+    def __ge__(self, other):
+        return LinRows(self - other, ">=")
+
+    def __eq__(self, other):
+        return LinRows(self - other, "==")
+
+    # Strict inequalities are relaxed to their closure, as LP solvers do
+    __lt__ = __le__
+    __gt__ = __ge__
+
+    def __bool__(self):
+        raise NotLinear("decision variable used as a truth value")
+
+    def __repr__(self) -> str:
+        return f"LinExpr({self._size} terms, {self.rows} rows)"
+
+
+class LinRows:
+    """``expr <sense> 0`` for each of ``expr.rows`` rows."""
+
+    __slots__ = ("expr", "sense")
+
+    def __init__(self, expr: LinExpr, sense: str) -> None:
+        self.expr = expr
+        self.sense = sense
+
+    def __bool__(self):
+        raise NotLinear("constraint used as a truth value (chained comparison or and/or)")
+
+    def __repr__(self) -> str:
+        return f"LinRows({self.sense}, {self.expr.rows} rows)"
+
+
+def _constant(value):
+    """A NumPy array or Python number usable as a row constant."""
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        if value.ndim == 0:
+            return value.item()
+        if value.ndim != 1:
+            raise NotVectorizable("constants must be scalars or 1-D arrays")
+        return value.astype(float, copy=False)
+    if isinstance(value, (bool, int, float, np.integer, np.floating)):
+        return float(value)
+    raise NotLinear(f"cannot combine a decision variable with {type(value).__name__}")
+
+
+def _length(value) -> int:
+    return 1 if isinstance(value, float) else len(value)
+
+
+# -- lowering ------------------------------------------------------------------
+
+
+class _VariableColumns:
+    """Stands in for a Variable's proxy: ``x[i, p]`` returns its column(s)."""
+
+    def __init__(self, name: str, offset: int, axes: list) -> None:
+        self.name = name
+        self.offset = offset
+        self.axes = axes
+        self.shape = tuple(len(ax.members) for ax in axes)
+
+    def __getitem__(self, key):
+        import numpy as np
+
+        parts = key if type(key) is tuple else (key,)
+        if len(parts) != len(self.axes):
+            raise KeyError(key)
+        positions = []
+        vector = False
+        for ax, part in zip(self.axes, parts):
+            if type(part) is VectorIndex:
+                vector = True
+                if part.members is ax.members:
+                    positions.append(np.arange(len(ax.members)))
+                else:
+                    positions.append(np.fromiter(
+                        (ax.positions[m] for m in part.members), dtype=np.intp,
+                        count=len(part.members),
+                    ))
+            else:
+                positions.append(ax.positions[part])
+        if not vector:
+            flat = 0
+            for pos, size in zip(positions, self.shape):
+                flat = flat * size + pos
+            return LinExpr.column(self.offset + flat)
+        flat = np.ravel_multi_index(np.broadcast_arrays(*positions), self.shape)
+        return LinExpr.column(self.offset + flat)
+
+
+class _ExpressionTerms:
+    """Stands in for an indexed Expression: ``load[i]`` calls its definition."""
+
+    def __init__(self, definition) -> None:
+        self.definition = definition
+
+    def __getitem__(self, key):
+        return self.definition(*key) if type(key) is tuple else self.definition(key)
+
+
+@dataclass
+class LinearModel:
+    """The lowered model: ``lb <= A @ x <= ub`` with per-column bounds."""
+    columns: dict[str, tuple[int, tuple[int, ...]]]  # variable -> (offset, shape)
+    A: Any  # scipy.sparse.csr_array
+    lb: Any
+    ub: Any
+    lower: Any
+    upper: Any
+    integrality: Any
+    objectives: dict[str, tuple[Any, float]]  # name -> (c, constant)
+    omitted: dict[str, str] = field(default_factory=dict)  # constraint -> reason
+
+
+def lower_model(reg: "Registry") -> LinearModel:
+    """Build the sparse constraint matrix and objective vectors for ``reg``."""
+    import numpy as np
+
+    from meta_compiler.fixtures import MemberIndex
+
+    indexes: dict[str, MemberIndex] = {}
+
+    def axis(set_name: str) -> MemberIndex:
+        if set_name not in indexes:
+            members = reg.data_store.get(set_name)
+            if not isinstance(members, list):
+                raise ValueError(f'set "{set_name}" has no member list in the fixture')
+            indexes[set_name] = MemberIndex(set_name, members)
+        return indexes[set_name]
+
+    # Columns, bounds and integrality per variable
+    columns: dict[str, _VariableColumns] = {}
+    lower, upper, integral = [], [], []
+    offset = 0
+    for sym in reg.symbols.values():
+        if not isinstance(sym, VariableSymbol):
+            continue
+        var = _VariableColumns(sym.name, offset, [axis(s) for s in sym.index or ()])
+        size = math.prod(var.shape)
+        lo, hi = sym.bounds
+        lo = -np.inf if lo is None else lo
+        hi = np.inf if hi is None else hi
+        if sym.domain in _NONNEGATIVE_DOMAINS:
+            lo = max(lo, 0)
+        if sym.domain == "binary":
+            hi = min(hi, 1)
+        lower.append(np.full(size, lo, dtype=float))
+        upper.append(np.full(size, hi, dtype=float))
+        integral.append(np.full(size, int(sym.domain in _INTEGER_DOMAINS), dtype=np.uint8))
+        columns[sym.name] = var
+        offset += size
+    n_cols = offset
+
+    namespaces = {
+        id(sym.expr.__globals__): sym.expr.__globals__
+        for sym in reg.symbols.values()
+        if isinstance(sym, (ConstraintSymbol, ObjectiveSymbol, ExpressionSymbol))
+        and getattr(sym.expr, "__globals__", None) is not None
+    }
+    replaced: list[tuple[dict, str, Any]] = []  # (namespace, name, original)
+    missing = object()
+
+    def stand_in(name: str, value) -> None:
+        for ns in namespaces.values():
+            replaced.append((ns, name, ns.get(name, missing)))
+            ns[name] = value
+
+    try:
+        for name, var in columns.items():
+            stand_in(name, var if var.axes else var[()])
+        for sym in reg.symbols.values():
+            if isinstance(sym, ExpressionSymbol) and sym.expr is not None:
+                value = _expression_stand_in(sym)
+                if value is not None:
+                    stand_in(sym.name, value)
+
+        blocks: list[LinRows] = []
+        omitted: dict[str, str] = {}
+        for sym in reg.symbols.values():
+            if (isinstance(sym, ConstraintSymbol) and sym.expr is not None
+                    and sym.constraint_type == "hard"):
+                try:
+                    blocks.extend(_lower_constraint(sym, reg))
+                except Exception as e:
+                    omitted[sym.name] = _reason(e)
+
+        objectives: dict[str, tuple[Any, float]] = {}
+        for sym in reg.symbols.values():
+            if isinstance(sym, ObjectiveSymbol) and sym.expr is not None:
+                try:
+                    expr = sym.expr()
+                except Exception as e:
+                    omitted[sym.name] = _reason(e)
+                    continue
+                if not isinstance(expr, LinExpr):
+                    expr = LinExpr([], 0, _constant(expr), 1)
+                if expr.rows != 1:
+                    omitted[sym.name] = "objective is not a scalar"
+                    continue
+                c = np.zeros(n_cols)
+                for cols, coefs in expr.terms:
+                    np.add.at(c, cols, coefs)
+                objectives[sym.name] = (c, float(expr.const))
+    finally:
+        for ns, name, original in reversed(replaced):
+            if original is missing:
+                ns.pop(name, None)
+            else:
+                ns[name] = original
+
+    A, lb, ub = _assemble(blocks, n_cols)
+    return LinearModel(
+        columns={name: (var.offset, var.shape) for name, var in columns.items()},
+        A=A, lb=lb, ub=ub,
+        lower=np.concatenate(lower) if lower else np.zeros(0),
+        upper=np.concatenate(upper) if upper else np.zeros(0),
+        integrality=np.concatenate(integral) if integral else np.zeros(0, dtype=np.uint8),
+        objectives=objectives,
+        omitted=omitted,
+    )
+
+
+def _expression_stand_in(sym: ExpressionSymbol):
+    """What an Expression's name resolves to while lowering (None: keep the data)."""
+    from meta_compiler.compiler.executor import _arity
+
+    if sym.index:
+        return _ExpressionTerms(sym.expr)
+    if _arity(sym.expr) == 0:
+        try:
+            return sym.expr()
+        except Exception:
+            return None
+    return None
+
+
+def _lower_constraint(sym: ConstraintSymbol, reg: "Registry") -> list[LinRows]:
+    """Rows for one constraint: one vectorized call, else one call per member."""
+    from meta_compiler.compiler.executor import _arity
+
+    if _arity(sym.expr) == 0:
+        return _rows_of(sym.expr())
+    members = reg.data_store.get(sym.over)
+    if not isinstance(members, list):
+        raise ValueError(f'set "{sym.over}" has no member list in the fixture')
+    if not members:
+        return []
+    try:
+        rows = _rows_of(sym.expr(VectorIndex(sym.over, members)))
+        # one row when the constraint does not depend on the member
+        if all(block.expr.rows in (1, len(members)) for block in rows):
+            return rows
+    except Exception:
+        pass  # NotVectorizable, NotLinear on a branch, ...: retry per member
+    blocks = []
+    for member in members:
+        blocks.extend(_rows_of(sym.expr(member)))
+    return blocks
+
+
+def _rows_of(result) -> list[LinRows]:
+    """A constraint result as row blocks; constant results have no rows."""
+    import numpy as np
+
+    if isinstance(result, LinRows):
+        return [result]
+    if isinstance(result, (bool, np.bool_, np.ndarray)):
+        return []  # involves no decision variable; checked in numeric mode
+    raise NotLinear(f"constraint returned {type(result).__name__}, not a comparison")
+
+
+def _reason(e: Exception) -> str:
+    if isinstance(e, NotLinear):
+        return f"not linear in the variables ({e})"
+    return f"{type(e).__name__}: {e}"
+
+
+def _assemble(blocks: list[LinRows], n_cols: int):
+    """Stack row blocks into a CSR matrix with row bounds (duplicates are summed)."""
+    import numpy as np
+    import scipy.sparse as sp
+
+    row_parts, col_parts, data_parts = [], [], []
+    # Scalar rows (the per-member fallback) are gathered in plain lists
+    scalar_rows, scalar_cols, scalar_data = [], [], []
+    lb_parts, ub_parts = [], []
+    r0 = 0
+    for block in blocks:
+        expr, n = block.expr, block.expr.rows
+        if n == 1:
+            for cols, coefs in expr.terms:
+                if isinstance(cols, int):
+                    scalar_rows.append(r0)
+                    scalar_cols.append(cols)
+                    scalar_data.append(float(coefs) if not isinstance(coefs, np.ndarray)
+                                       else coefs.item())
+                else:
+                    row_parts.append(np.full(len(cols), r0))
+                    col_parts.append(cols)
+                    data_parts.append(np.broadcast_to(coefs, cols.shape))
+        else:
+            rows = np.arange(r0, r0 + n)
+            for cols, coefs in expr.terms:
+                row_parts.append(rows)
+                col_parts.append(np.broadcast_to(cols, (n,)))
+                data_parts.append(np.broadcast_to(coefs, (n,)))
+        bound = -np.broadcast_to(np.asarray(expr.const, dtype=float), (n,))
+        lb_parts.append(bound if block.sense in (">=", "==") else np.full(n, -np.inf))
+        ub_parts.append(bound if block.sense in ("<=", "==") else np.full(n, np.inf))
+        r0 += n
+
+    row_parts.append(np.asarray(scalar_rows, dtype=np.intp))
+    col_parts.append(np.asarray(scalar_cols, dtype=np.intp))
+    data_parts.append(np.asarray(scalar_data, dtype=float))
+    A = sp.coo_array(
+        (np.concatenate(data_parts).astype(float),
+         (np.concatenate(row_parts).astype(np.intp), np.concatenate(col_parts).astype(np.intp))),
+        shape=(r0, n_cols),
+    ).tocsr()
+    A.sum_duplicates()
+    lb = np.concatenate(lb_parts) if lb_parts else np.zeros(0)
+    ub = np.concatenate(ub_parts) if ub_parts else np.zeros(0)
+    return A, lb, ub
+
+
+# -- solving -------------------------------------------------------------------
+
+_MILP_STATUS = {0: "optimal", 1: "limit", 2: "infeasible", 3: "unbounded", 4: "error"}
+
+
+def optimize_model(reg: "Registry", *, time_limit: float | None = None) -> list[OptimizationResult]:
+    """Solve every objective over the lowered model and compare with the fixture.
+
+    ``gap`` is the fixture's relative shortfall, ``(optimum - fixture) /
+    max(|optimum|, |fixture|, 1)`` for a maximization (reversed for
+    minimization), so a zero optimum does not blow it up; a negative gap means
+    the fixture beats the optimum, i.e. it violates a bound or a lowered
+    constraint.
+    """
+    objectives = [
+        sym for sym in reg.symbols.values()
+        if isinstance(sym, ObjectiveSymbol) and sym.expr is not None
+    ]
+    if not objectives:
+        return []
+    try:
+        from scipy.optimize import Bounds, LinearConstraint, milp
+    except ImportError:
+        return [OptimizationResult(objective=sym.name, sense=sym.sense, status="skipped",
+                                   error="scipy not installed") for sym in objectives]
+
+    start = time.monotonic()
+    try:
+        model = lower_model(reg)
+    except Exception as e:
+        return [OptimizationResult(objective=sym.name, sense=sym.sense, status="error",
+                                   error=str(e)) for sym in objectives]
+    objective_names = {sym.name for sym in objectives}
+    omitted = {n: why for n, why in model.omitted.items() if n not in objective_names}
+    build_s = time.monotonic() - start
+    n_rows, n_cols = model.A.shape
+
+    results = []
+    for sym in objectives:
+        result = OptimizationResult(
+            objective=sym.name, sense=sym.sense, status="error",
+            omitted=dict(omitted), variables=n_cols, rows=n_rows,
+        )
+        results.append(result)
+        if sym.name not in model.objectives:
+            result.error = model.omitted.get(sym.name, "objective could not be lowered")
+            continue
+        c, constant = model.objectives[sym.name]
+        sign = -1.0 if sym.sense == "maximize" else 1.0
+        solve_start = time.monotonic()
+        try:
+            res = milp(
+                sign * c,
+                constraints=[LinearConstraint(model.A, model.lb, model.ub)] if n_rows else None,
+                integrality=model.integrality,
+                bounds=Bounds(model.lower, model.upper),
+                options={"time_limit": time_limit} if time_limit else None,
+            )
+        except Exception as e:
+            result.error = str(e)
+            continue
+        result.duration_s = build_s + time.monotonic() - solve_start
+        result.status = _MILP_STATUS.get(res.status, "error")
+        if res.x is not None:
+            result.optimum = sign * res.fun + constant
+            result.mip_gap = getattr(res, "mip_gap", None)
+        if result.status in ("error", "infeasible", "unbounded"):
+            result.error = res.message
+        result.fixture_value = _fixture_value(sym)
+        if result.optimum is not None and result.fixture_value is not None:
+            shortfall = result.optimum - result.fixture_value
+            if sym.sense != "maximize":
+                shortfall = -shortfall
+            scale = max(abs(result.optimum), abs(result.fixture_value), 1.0)
+            result.gap = shortfall / scale
+    return results
+
+
+def _fixture_value(sym: ObjectiveSymbol) -> float | None:
+    """The objective evaluated on the fixture's variable values."""
+    from meta_compiler.compiler.executor import _arity, _is_numeric
+
+    try:
+        value = sym.expr() if _arity(sym.expr) == 0 else None
+    except Exception:
+        return None
+    return float(value) if value is not None and _is_numeric(value) else None
+
+
+def optimization_warnings(results: list[OptimizationResult]) -> list[str]:
+    """Warnings for skipped solves, solver failures and constraints left out."""
+    warnings: list[str] = []
+    if any(r.status == "skipped" for r in results):
+        warnings.append("Optimization skipped: scipy not installed (pip install scipy)")
+    for r in results:
+        if r.status not in ("optimal", "skipped", "limit"):
+            warnings.append(f'Optimization of objective "{r.objective}": {r.status}'
+                            + (f" — {r.error}" if r.error else ""))
+    omitted = results[0].omitted if results else {}
+    for name, reason in omitted.items():
+        warnings.append(
+            f'Optimization: constraint "{name}" left out of the solve ({reason}); '
+            f"the optimum is only a bound"
+        )
+    return warnings
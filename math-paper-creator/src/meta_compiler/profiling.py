@@ -0,0 +1,136 @@
+"""Opt-in timing of the validation and compile pipeline.
+
+``profile()`` activates a ``Profiler`` for the duration of a ``with`` block.
+Pipeline code wraps its phases, blocks, constraints and proofs in
+``span(kind, name)``; with no active profiler ``span`` returns a shared
+no-op context, so the instrumentation costs one function call.
+
+Each span records wall time (``perf_counter``), CPU time of this process
+(``process_time``) and the process's peak resident memory when it ended
+(``ru_maxrss``, a high-water mark, so a jump marks the span that raised
+it). Spans nest; ``Profiler.to_dict()`` renders the tree as JSON-ready
+dicts. Work done in forked workers (``jobs > 1``) is timed as a whole by
+the span around the pool; proofs solved there are added with ``record``
+from the durations the workers report.
+
+The active profiler is held in a ``ContextVar``, like the current registry,
+so threads validating documents concurrently each see only their own
+``profile()`` (or none).
+
+Usage:
+    python -m meta_compiler.cli check model.model.md --profile trace.json
+    python -m meta_compiler.cli compile model.model.md --cprofile out.pstats
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+_active: ContextVar["Profiler | None"] = ContextVar("meta_compiler_profiler", default=None)
+_NOOP = contextlib.nullcontext()
+
+
+@dataclass
+class Span:
+    """One timed region of the pipeline."""
+    kind: str  # "run", "phase", "block", "constraint", "objective" or "proof"
+    name: str
+    wall_s: float = 0.0
+    cpu_s: float | None = None  # None for spans recorded after the fact
+    peak_rss_kb: int | None = None
+    attrs: dict = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        entry = {"kind": self.kind, "name": self.name, "wall_s": self.wall_s,
+                 "cpu_s": self.cpu_s, "peak_rss_kb": self.peak_rss_kb}
+        entry.update(self.attrs)
+        if self.children:
+            entry["children"] = [child.to_dict() for child in self.children]
+        return entry
+
+
+class Profiler:
+    """Collects a tree of spans for one run."""
+
+    def __init__(self, name: str = "run") -> None:
+        self.root = Span("run", name)
+        self._stack = [self.root]
+
+    @contextlib.contextmanager
+    def span(self, kind: str, name: str, **attrs) -> Iterator[Span]:
+        node = Span(kind, name, attrs=attrs)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield node
+        finally:
+            node.wall_s = time.perf_counter() - wall
+            node.cpu_s = time.process_time() - cpu
+            node.peak_rss_kb = peak_rss_kb()
+            self._stack.pop()
+
+    def record(self, kind: str, name: str, wall_s: float, **attrs) -> Span:
+        """Add an already-finished span (e.g. timed in a worker process)."""
+        node = Span(kind, name, wall_s=wall_s, attrs=attrs)
+        self._stack[-1].children.append(node)
+        return node
+
+    def to_dict(self) -> dict:
+        return {"version": 1, **self.root.to_dict()}
+
+    def write(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+
+@contextlib.contextmanager
+def profile(name: str = "run") -> Iterator[Profiler]:
+    """Activate a new ``Profiler`` for the enclosed code."""
+    profiler = Profiler(name)
+    token = _active.set(profiler)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield profiler
+    finally:
+        root = profiler.root
+        root.wall_s = time.perf_counter() - wall
+        root.cpu_s = time.process_time() - cpu
+        root.peak_rss_kb = peak_rss_kb()
+        _active.reset(token)
+
+
+def span(kind: str, name: str, **attrs):
+    """Time the enclosed code under the active profiler, if any."""
+    profiler = _active.get()
+    if profiler is None:
+        return _NOOP
+    return profiler.span(kind, name, **attrs)
+
+
+def record(kind: str, name: str, wall_s: float | None, **attrs) -> None:
+    """Add a finished span to the active profiler, if any."""
+    profiler = _active.get()
+    if profiler is not None and wall_s is not None:
+        profiler.record(kind, name, wall_s, **attrs)
+
+
+def active() -> bool:
+    return _active.get() is not None
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
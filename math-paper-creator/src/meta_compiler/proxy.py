@@ -1,29 +1,140 @@
 """Data-backed symbol proxy with access logging.
 
 In v2, proxies hold real data (from fixtures) and return actual values
-on __getitem__. Each access logs the symbol name for orphan/phantom detection.
+on __getitem__. The first access logs the symbol name for orphan/phantom
+detection; the proxy then switches its class to ``UnloggedSymbolProxy`` so
+later reads skip the log (it would learn nothing new). The registry re-arms
+its proxies whenever the access log is rebuilt, and creates them unlogged
+when access logging is off.
+
+Data may also be a ``fixtures.Column`` (a NumPy array aligned to set member
+order), which the proxy delegates to directly.
+
+Proxies also accept a ``VectorIndex`` key, which stands for every member of
+a set at once and returns a NumPy array aligned to the set order. The
+executor uses this to evaluate a constraint lambda once per set instead of
+once per member.
 """
 
 from __future__ import annotations
 
 
+class NotVectorizable(Exception):
+    """Raised when an expression uses a VectorIndex in a non-elementwise way."""
+
+
+class VectorIndex:
+    """Stand-in for "all members of a set" during vectorized evaluation.
+
+    The only supported use is as a proxy subscript (``cap[i]``,
+    ``x[i, p]``). Comparing, hashing, formatting, or branching on it raises
+    ``NotVectorizable`` so the caller falls back to per-member evaluation
+    instead of silently computing something different.
+    """
+
+    __slots__ = ("set_name", "members")
+
+    def __init__(self, set_name: str, members: list):
+        self.set_name = set_name
+        self.members = members
+
+    def _refuse(self, *args, **kwargs):
+        raise NotVectorizable(
+            f"set member of {self.set_name!r} used outside of a subscript"
+        )
+
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _refuse
+    __bool__ = __hash__ = __len__ = __iter__ = __contains__ = _refuse
+    __index__ = __int__ = __float__ = __str__ = __format__ = _refuse
+    __getattr__ = _refuse
+
+    def __repr__(self) -> str:
+        return f"VectorIndex({self.set_name!r}, {len(self.members)} members)"
+
+
 class SymbolProxy:
     """Proxy for a registered symbol backed by fixture data."""
 
+    # Slots give both proxy classes one layout, so switching ``__class__``
+    # keeps attribute reads on their fast path
+    __slots__ = ("name", "_data", "_access_log", "_vector_cache", "_column")
+
     def __init__(self, name: str, data: dict | None, access_log: set):
+        from meta_compiler.fixtures import Column
+
         self.name = name
         self._data = data
         self._access_log = access_log
+        self._vector_cache: dict = {}
+        self._column = data if isinstance(data, Column) else None
 
     def __getitem__(self, key):
         self._access_log.add(self.name)
+        self.__class__ = UnloggedSymbolProxy  # logged once; later reads skip the log
+        return self._lookup(key)
+
+    def _lookup(self, key):
         if self._data is None:
             raise RuntimeError(
                 f"No fixture data for symbol '{self.name}'. "
                 f"Add a python:fixture block with data for '{self.name}'."
             )
+        if self._column is not None:
+            return self._column.lookup(key)
+        if type(key) is VectorIndex or (
+            type(key) is tuple and any(type(k) is VectorIndex for k in key)
+        ):
+            return self._gather(key)
         return self._data[key]
 
+    def _gather(self, key):
+        """Return an array of values for every member a VectorIndex key covers."""
+        import numpy as np
+
+        if type(key) is VectorIndex:
+            vi, signature = key, key.set_name
+            keys = key.members
+        else:
+            vectors = [k for k in key if type(k) is VectorIndex]
+            if len(vectors) != 1:
+                raise NotVectorizable(f"'{self.name}' indexed by several vectorized sets")
+            vi = vectors[0]
+            pos = next(n for n, k in enumerate(key) if type(k) is VectorIndex)
+            signature = key[:pos] + (vi.set_name,) + key[pos + 1:]
+            keys = [key[:pos] + (m,) + key[pos + 1:] for m in vi.members]
+
+        try:
+            cached = self._vector_cache.get(signature)
+        except TypeError:  # unhashable fixed index component
+            cached, signature = None, None
+        if cached is not None and cached[0] is vi:
+            return cached[1]
+
+        data = self._data
+        if isinstance(data, np.ndarray) and type(key) is VectorIndex:
+            values = data[np.asarray(keys)]
+        else:
+            values = np.asarray([data[k] for k in keys])
+        if signature is not None:
+            self._vector_cache[signature] = (vi, values)
+        return values
+
     def __repr__(self):
         backed = "data-backed" if self._data is not None else "no-data"
         return f"SymbolProxy({self.name!r}, {backed})"
+
+
+class UnloggedSymbolProxy(SymbolProxy):
+    """A ``SymbolProxy`` whose reads are not logged (already logged, or logging off)."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if self._column is not None:
+            return self._column.lookup(key)
+        try:
+            return self._data[key]
+        except Exception:
+            pass
+        # VectorIndex keys, missing data and genuine lookup errors
+        return self._lookup(key)
@@ -1,14 +1,31 @@
 """Global symbol registry — the heart of the validation system.
 
 Accumulates symbol declarations and runs cumulative integrity checks.
+
+The DSL functions and the executor act on ``current_registry()``: the
+registry bound by the innermost ``use_registry()`` in the current context,
+or the module-level ``registry`` when none is bound. Bindings live in a
+``ContextVar``, so each thread and each asyncio task can validate its own
+document concurrently::
+
+    with use_registry():
+        result = check_document(source)  # result.registry is private
+
 """
 
 from __future__ import annotations
 
+import contextlib
+import sys
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator
 
-from meta_compiler.proxy import SymbolProxy
+from meta_compiler.analysis import BlockSource, SourceAnalysis
+from meta_compiler.fixtures import Column
+from meta_compiler.graph import DependencyGraph
+from meta_compiler.proxy import SymbolProxy, UnloggedSymbolProxy, VectorIndex
 from meta_compiler.symbols import (
     AxiomSymbol,
     ConstraintSymbol,
@@ -35,23 +52,44 @@ class Registry:
     """Global symbol registry that accumulates state as the document grows."""
 
     def __init__(self) -> None:
-        self.symbols: dict[str, Symbol] = {}
-        self._registration_order: list[str] = []
+        self.symbols: dict[str, Symbol] = {}  # insertion order is registration order
         self.data_store: dict[str, Any] = {}
+        self.data_files: list[Path] = []  # files loaded by the fixture (load_npy etc.)
         self.access_log: set[str] = set()
         self.scalar_names: set[str] = set()
         self._exec_namespace: dict | None = None  # set by executor
-        self._current_block_source: str | None = None  # set by executor per block
+        self._current_block: BlockSource | None = None  # set by executor per block
+        self._vector_indices: dict[str, VectorIndex] = {}  # set name -> index, numeric mode
+        self.analysis = SourceAnalysis()  # source/token/AST cache shared by checks
+        self._dependency_graph: DependencyGraph | None = None
+        self.log_access = True  # False: proxies skip the access log (no orphan check)
+        self._proxies: list[SymbolProxy] = []
 
     def reset(self) -> None:
         """Clear all symbols — used between tests."""
         self.symbols.clear()
-        self._registration_order.clear()
         self.data_store.clear()
+        self.data_files = []
         self.access_log.clear()
         self.scalar_names = set()
         self._exec_namespace = None
-        self._current_block_source = None
+        self._current_block = None
+        self._vector_indices.clear()
+        self.analysis.clear()
+        self._dependency_graph = None
+        self.log_access = True
+        self._proxies.clear()
+
+    def set_access_logging(self, enabled: bool) -> None:
+        """Turn proxy access logging on or off.
+
+        Turning it on re-arms every proxy, so each one logs its next read
+        again even if it already logged into an earlier access log.
+        """
+        self.log_access = enabled
+        cls = SymbolProxy if enabled else UnloggedSymbolProxy
+        for proxy in self._proxies:
+            proxy.__class__ = cls
 
     def _register(self, name: str, symbol: Symbol) -> None:
         """Register a symbol, raising on conflicts."""
@@ -62,8 +100,47 @@ class Registry:
                 f'"{existing.description}". '
                 f'Cannot redefine as "{symbol.description}"'
             )
-        self.symbols[name] = symbol
-        self._registration_order.append(name)
+        self.symbols[symbol.name] = symbol  # interned by the symbol record
+
+    @property
+    def _registration_order(self) -> list[str]:
+        """Symbol names in registration order (derived from ``symbols``)."""
+        return list(self.symbols)
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """Dependency graph of the current symbols, rebuilt only when they change."""
+        graph = self._dependency_graph
+        if graph is None or len(graph.order) != len(self.symbols):
+            graph = self._dependency_graph = DependencyGraph.build(self)
+        return graph
+
+    def _attach_source(self, fn) -> None:
+        """Record where a callable from the executing validate block was defined.
+
+        Callables the executor can map to their own AST node get that node
+        and its source segment; anything else (e.g. a lambda from an earlier
+        block) falls back to the whole block's source.
+        """
+        block = self._current_block
+        if block is None or hasattr(fn, "_source_text"):
+            return
+        node = block.locate(fn)
+        if node is None:
+            fn._source_text = block.text
+        else:
+            fn._source_text = block.segment(node)
+            fn._source_node = node
+            fn._source_block = block
+
+    def _check_column(self, name: str, idx: tuple[str, ...] | None, kind: str) -> None:
+        """A Column fixture must be indexed by exactly the declared sets."""
+        data = self.data_store.get(name)
+        if isinstance(data, Column) and data.index != (idx or ()):
+            raise ValueError(
+                f'BLOCK: {kind} "{name}" is indexed by {idx or ()} '
+                f"but its fixture Column is indexed by {data.index}"
+            )
 
     def _require_sets(self, *set_names: str, context: str = "") -> None:
         """Verify that all named sets exist."""
@@ -90,6 +167,7 @@ class Registry:
 
     def _make_proxy(self, name: str) -> "SymbolProxy | int | float | str":
         """Create a data-backed proxy and auto-inject into exec namespace."""
+        name = sys.intern(name)  # share the string with the symbol record and access log
         if name in self.data_store and self._is_scalar(self.data_store[name]):
             # Scalar value — inject raw value, not a proxy
             value = self.data_store[name]
@@ -98,6 +176,9 @@ class Registry:
                 self._exec_namespace[name] = value
             return value
         proxy = SymbolProxy(name, data=self.data_store.get(name), access_log=self.access_log)
+        if not self.log_access:
+            proxy.__class__ = UnloggedSymbolProxy
+        self._proxies.append(proxy)
         if self._exec_namespace is not None:
             self._exec_namespace[name] = proxy
         return proxy
@@ -131,6 +212,7 @@ class Registry:
         idx = self._normalize_index(index)
         if idx:
             self._require_sets(*idx, context=f'Parameter "{name}"')
+        self._check_column(name, idx, "Parameter")
         symbol = ParameterSymbol(
             name=name, index=idx, domain=domain,
             units=units, description=description,
@@ -152,6 +234,7 @@ class Registry:
         idx = self._normalize_index(index)
         if idx:
             self._require_sets(*idx, context=f'Variable "{name}"')
+        self._check_column(name, idx, "Variable")
         symbol = VariableSymbol(
             name=name, index=idx, domain=domain, bounds=bounds,
             units=units, description=description,
@@ -172,8 +255,7 @@ class Registry:
         idx = self._normalize_index(index)
         if idx:
             self._require_sets(*idx, context=f'Expression "{name}"')
-        if self._current_block_source and not hasattr(definition, "_source_text"):
-            definition._source_text = self._current_block_source
+        self._attach_source(definition)
         sym = ExpressionSymbol(
             name=name, index=idx, units=units,
             description=description, expr=definition,
@@ -194,8 +276,7 @@ class Registry:
         over_str = over if isinstance(over, str) or over is None else over[0] if over else None
         if over_str:
             self._require_sets(over_str, context=f'Constraint "{name}"')
-        if self._current_block_source and not hasattr(expr, "_source_text"):
-            expr._source_text = self._current_block_source
+        self._attach_source(expr)
         sym = ConstraintSymbol(
             name=name, over=over_str, constraint_type=constraint_type,
             description=description, expr=expr,
@@ -211,8 +292,7 @@ class Registry:
         description: str = "",
     ) -> None:
         """Register an objective by storing its callable directly."""
-        if self._current_block_source and not hasattr(expr, "_source_text"):
-            expr._source_text = self._current_block_source
+        self._attach_source(expr)
         sym = ObjectiveSymbol(
             name=name, sense=sense, description=description, expr=expr,
         )
@@ -287,5 +367,28 @@ class Registry:
         return run_all_checks(self, strict=strict)
 
 
-# Global registry instance
+# Global registry instance, used where no registry is bound
 registry = Registry()
+
+_current: ContextVar[Registry] = ContextVar("meta_compiler_registry")
+
+
+def current_registry() -> Registry:
+    """The registry bound in this context, else the global ``registry``."""
+    return _current.get(registry)
+
+
+@contextlib.contextmanager
+def use_registry(reg: Registry | None = None) -> Iterator[Registry]:
+    """Bind ``reg`` (a fresh ``Registry`` by default) for the enclosed code.
+
+    Documents bound to different registries can be checked in parallel
+    threads, except that their z3 work (validate blocks and proofs) takes
+    turns under ``verification.z3_lock``.
+    """
+    reg = Registry() if reg is None else reg
+    token = _current.set(reg)
+    try:
+        yield reg
+    finally:
+        _current.reset(token)
@@ -1,18 +1,73 @@
-"""Symbol record dataclasses — what gets stored in the registry."""
+"""Symbol record dataclasses — what gets stored in the registry.
+
+Generated models can register hundreds of thousands of symbols, so records
+are slotted and share their repeated parts: names are interned, and index
+tuples and unit strings are stored once in module-level tables (each unit
+string alongside its parsed ``Unit``).
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
+
+from meta_compiler.units import Unit, parse_unit
+
+_INDEX_TABLE: dict[tuple[str, ...], tuple[str, ...]] = {}
+_UNIT_TABLE: dict[str, tuple[str, Unit]] = {}
+
+
+def intern_index(index: tuple[str, ...] | None) -> tuple[str, ...] | None:
+    """Return the shared copy of an index tuple (set names interned)."""
+    if type(index) is not tuple:
+        return index
+    shared = _INDEX_TABLE.get(index)
+    if shared is None:
+        shared = _INDEX_TABLE[index] = tuple(_intern(n) for n in index)
+    return shared
+
+
+def intern_units(spec: str) -> str:
+    """Return the shared copy of a unit string, parsing it on first sight."""
+    entry = _UNIT_TABLE.get(spec)
+    if entry is None:
+        entry = _UNIT_TABLE[spec] = (_intern(spec), parse_unit(spec))
+    return entry[0]
+
+
+def unit_of(spec: str) -> Unit:
+    """Parsed ``Unit`` for a unit string, from the shared table."""
+    entry = _UNIT_TABLE.get(spec)
+    if entry is None:
+        intern_units(spec)
+        entry = _UNIT_TABLE[spec]
+    return entry[1]
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
 
 
-@dataclass(frozen=True)
+def _share_fields(record, *, index: bool = False, units: bool = False) -> None:
+    """Replace a new record's name/index/units with their shared copies."""
+    object.__setattr__(record, "name", _intern(record.name))
+    if index:
+        object.__setattr__(record, "index", intern_index(record.index))
+    if units and type(record.units) is str:
+        object.__setattr__(record, "units", intern_units(record.units))
+
+
+@dataclass(frozen=True, slots=True)
 class SetSymbol:
     """An index set like W (workers), P (projects)."""
     name: str
     description: str
 
+    def __post_init__(self) -> None:
+        _share_fields(self)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterSymbol:
     """A parameter like cap_i (capacity of worker i)."""
     name: str
@@ -21,8 +76,11 @@ class ParameterSymbol:
     units: str
     description: str
 
+    def __post_init__(self) -> None:
+        _share_fields(self, index=True, units=True)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VariableSymbol:
     """A decision variable like x_{ijp} (allocation fraction)."""
     name: str
@@ -32,8 +90,11 @@ class VariableSymbol:
     units: str
     description: str
 
+    def __post_init__(self) -> None:
+        _share_fields(self, index=True, units=True)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpressionSymbol:
     """A derived expression like load_i (total load on worker i)."""
     name: str
@@ -42,8 +103,11 @@ class ExpressionSymbol:
     description: str
     expr: object  # callable in v2
 
+    def __post_init__(self) -> None:
+        _share_fields(self, index=True, units=True)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ConstraintSymbol:
     """A constraint like capacity_limit (no worker exceeds capacity)."""
     name: str
@@ -52,8 +116,12 @@ class ConstraintSymbol:
     description: str
     expr: object  # callable in v2
 
+    def __post_init__(self) -> None:
+        _share_fields(self)
+        object.__setattr__(self, "over", _intern(self.over))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectiveSymbol:
     """An objective like maximize_utility."""
     name: str
@@ -61,8 +129,11 @@ class ObjectiveSymbol:
     description: str
     expr: object  # callable in v2
 
+    def __post_init__(self) -> None:
+        _share_fields(self)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AxiomSymbol:
     """A foundational axiom like A1 (non-negativity of hours)."""
     name: str
@@ -70,8 +141,11 @@ class AxiomSymbol:
     z3_expr: object | None  # callable returning z3 expr, or None
     description: str
 
+    def __post_init__(self) -> None:
+        _share_fields(self)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PropertySymbol:
     """A derived property like P1 (effective time is non-negative)."""
     name: str
@@ -80,6 +154,10 @@ class PropertySymbol:
     given: tuple[str, ...]  # axiom names this property depends on
     description: str
 
+    def __post_init__(self) -> None:
+        _share_fields(self)
+        object.__setattr__(self, "given", intern_index(self.given))
+
 
 # Union of all symbol types
 Symbol = (SetSymbol | ParameterSymbol | VariableSymbol | ExpressionSymbol
@@ -1,69 +1,219 @@
 """Lightweight unit algebra for dimensional consistency checks.
 
 Supports base units (hours, headcount, dollars, points, dimensionless) and
-compound units formed by multiplication and division. Not a full physical
-units library — a tag system sufficient to catch common errors.
+compound units formed by multiplication, division and powers
+(``hours^2/headcount``, ``meters^0.5``). Not a full physical units library —
+a tag system sufficient to catch common errors.
+
+A ``Unit`` is an exponent vector over a global dimension table, stored
+sparsely as ``((dimension id, exponent), ...)`` sorted by id. Exponents are
+ints, or ``Fraction``s for fractional powers, so ``m^0.5 * m^0.5`` is ``m``.
+A factor whose power is not a number (``m^x``) is kept whole as an opaque
+base unit, as unit strings were before powers were parsed. Units are
+interned: every construction of the same vector returns the same object,
+so equality is an identity check. Parsing, multiplication, division and
+powers are memoized, which makes repeated unit inference over large
+models a sequence of dictionary hits.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from fractions import Fraction
+
+# Global dimension table: base unit name <-> dimension id
+_DIMENSION_IDS: dict[str, int] = {}
+_DIMENSION_NAMES: list[str] = []
+
+# Interned units by exponent vector, and memoized operations
+_UNITS: dict[tuple[tuple[int, int | Fraction], ...], "Unit"] = {}
+_PARSED: dict[str, "Unit"] = {}
+_PRODUCTS: dict[tuple["Unit", "Unit"], "Unit"] = {}
+_QUOTIENTS: dict[tuple["Unit", "Unit"], "Unit"] = {}
+_POWERS: dict[tuple["Unit", int], "Unit"] = {}
+
+# Factors that carry no dimension
+_UNITLESS = {"", "1", "dimensionless"}
 
 
-@dataclass(frozen=True)
 class Unit:
-    """A unit represented as a fraction: numer / denom (sorted tuples)."""
-    numer: tuple[str, ...]
-    denom: tuple[str, ...]
+    """An interned unit: exponents of base dimensions.
+
+    ``Unit(numer=("hours",), denom=("headcount",))`` builds hours/headcount;
+    repeated names multiply (``numer=("hours", "hours")`` is hours^2).
+    """
+
+    __slots__ = ("exponents", "_str")
+
+    exponents: tuple[tuple[int, int | Fraction], ...]
+
+    def __new__(cls, numer: tuple[str, ...] = (), denom: tuple[str, ...] = ()) -> "Unit":
+        counts: dict[int, int] = {}
+        for name in numer:
+            dim = _dimension(name)
+            counts[dim] = counts.get(dim, 0) + 1
+        for name in denom:
+            dim = _dimension(name)
+            counts[dim] = counts.get(dim, 0) - 1
+        return _unit(counts)
+
+    def __reduce__(self):
+        # Unpickled and copied units are re-interned, keeping identity equality
+        return (_unit_from_names, (tuple(
+            (_DIMENSION_NAMES[dim], exp) for dim, exp in self.exponents),))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Unit is immutable")
+
+    @property
+    def numer(self) -> tuple[str, ...]:
+        """Base units with positive exponents, repeated per power, sorted.
+
+        A fractional power appears once with its exponent (``m^0.5``).
+        """
+        return tuple(sorted(_factors(self.exponents, 1)))
+
+    @property
+    def denom(self) -> tuple[str, ...]:
+        """Base units with negative exponents, as ``numer``."""
+        return tuple(sorted(_factors(self.exponents, -1)))
 
     def __str__(self) -> str:
-        if not self.numer and not self.denom:
-            return "dimensionless"
-        n = "*".join(self.numer) if self.numer else "1"
-        if not self.denom:
-            return n
-        d = "*".join(self.denom)
-        return f"{n}/{d}"
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"Unit({self._str!r})"
+
+
+def _dimension(name: str) -> int:
+    dim = _DIMENSION_IDS.get(name)
+    if dim is None:
+        dim = _DIMENSION_IDS[name] = len(_DIMENSION_NAMES)
+        _DIMENSION_NAMES.append(name)
+    return dim
+
+
+def _factors(exponents, sign: int):
+    for dim, exp in exponents:
+        exp *= sign
+        if exp > 0:
+            name = _DIMENSION_NAMES[dim]
+            if exp.denominator == 1:
+                yield from [name] * int(exp)
+            else:
+                yield f"{name}^{_format_exponent(exp)}"
+
+
+def _unit_from_names(exponents: tuple[tuple[str, int | Fraction], ...]) -> Unit:
+    return _unit({_dimension(name): exp for name, exp in exponents})
+
+
+def _unit(counts: dict[int, int | Fraction]) -> Unit:
+    """The interned unit for a dimension id -> exponent mapping."""
+    # Integral fractions become ints so equal vectors intern together
+    exponents = tuple(sorted(
+        (dim, int(exp) if exp.denominator == 1 else exp)
+        for dim, exp in counts.items() if exp
+    ))
+    unit = _UNITS.get(exponents)
+    if unit is None:
+        unit = object.__new__(Unit)
+        object.__setattr__(unit, "exponents", exponents)
+        object.__setattr__(unit, "_str", _render(exponents))
+        unit = _UNITS.setdefault(exponents, unit)
+    return unit
+
+
+def _format_exponent(exp: int | Fraction) -> str:
+    if exp.denominator == 1:
+        return str(int(exp))
+    return format(float(exp), "g") if _finite_decimal(exp) else f"({exp})"
+
+
+def _finite_decimal(exp: Fraction) -> bool:
+    d = exp.denominator
+    for p in (2, 5):
+        while d % p == 0:
+            d //= p
+    return d == 1
+
+
+def _render(exponents: tuple[tuple[int, int | Fraction], ...]) -> str:
+    if not exponents:
+        return "dimensionless"
+
+    def side(factors: list[tuple[str, int | Fraction]]) -> str:
+        return "*".join(name if exp == 1 else f"{name}^{_format_exponent(exp)}"
+                        for name, exp in sorted(factors))
+
+    numer = [(_DIMENSION_NAMES[dim], exp) for dim, exp in exponents if exp > 0]
+    denom = [(_DIMENSION_NAMES[dim], -exp) for dim, exp in exponents if exp < 0]
+    n = side(numer) if numer else "1"
+    return f"{n}/{side(denom)}" if denom else n
 
 
 def parse_unit(spec: str) -> Unit:
-    """Parse a unit string like 'hours', 'hours/headcount', or 'dimensionless'."""
-    spec = spec.strip()
-    if spec == "dimensionless":
-        return Unit(numer=(), denom=())
-    if "/" in spec:
-        numer_str, denom_str = spec.split("/", 1)
-        numer = tuple(sorted(numer_str.strip().split("*")))
-        denom = tuple(sorted(denom_str.strip().split("*")))
-        return Unit(numer=numer, denom=denom)
-    return Unit(numer=(spec,), denom=())
+    """Parse a unit string like 'hours', 'hours/headcount', 'hours^2' or 'dimensionless'.
+
+    Factors are joined by ``*`` and may carry a numeric power (``^2``,
+    ``**2``, ``^0.5``); everything after the first ``/`` is the denominator.
+    """
+    unit = _PARSED.get(spec)
+    if unit is None:
+        numer_str, _, denom_str = spec.strip().replace("**", "^").partition("/")
+        counts: dict[int, int | Fraction] = {}
+        for part, sign in ((numer_str, 1), (denom_str, -1)):
+            for factor in part.split("*"):
+                name, exp = _parse_factor(factor)
+                if name is not None:
+                    dim = _dimension(name)
+                    counts[dim] = counts.get(dim, 0) + sign * exp
+        unit = _PARSED[spec] = _unit(counts)
+    return unit
+
+
+def _parse_factor(factor: str) -> tuple[str | None, int | Fraction]:
+    name, _, power = factor.strip().partition("^")
+    name = name.strip()
+    if name in _UNITLESS:
+        return None, 0
+    if not power:
+        return name, 1
+    try:
+        return name, Fraction(power.strip())
+    except (ValueError, ZeroDivisionError):
+        return factor.strip(), 1  # not a number: an opaque base unit
 
 
 def units_compatible(a: Unit, b: Unit) -> bool:
     """Check if two units are compatible (i.e., identical after normalization)."""
-    return a == b
-
-
-def _cancel(numer: list[str], denom: list[str]) -> tuple[tuple[str, ...], tuple[str, ...]]:
-    """Cancel matching terms between numerator and denominator."""
-    n = list(numer)
-    d = list(denom)
-    for term in list(n):
-        if term in d:
-            n.remove(term)
-            d.remove(term)
-    return tuple(sorted(n)), tuple(sorted(d))
+    return a is b
 
 
 def units_multiply(a: Unit, b: Unit) -> Unit:
-    """Multiply two units: (a.numer * b.numer) / (a.denom * b.denom), with cancellation."""
-    numer = list(a.numer) + list(b.numer)
-    denom = list(a.denom) + list(b.denom)
-    n, d = _cancel(numer, denom)
-    return Unit(numer=n, denom=d)
+    """Multiply two units: add their exponent vectors."""
+    product = _PRODUCTS.get((a, b))
+    if product is None:
+        counts = dict(a.exponents)
+        for dim, exp in b.exponents:
+            counts[dim] = counts.get(dim, 0) + exp
+        product = _PRODUCTS[(a, b)] = _unit(counts)
+    return product
 
 
 def units_divide(a: Unit, b: Unit) -> Unit:
-    """Divide units: a / b = a * (1/b)."""
-    flipped = Unit(numer=b.denom, denom=b.numer)
-    return units_multiply(a, flipped)
+    """Divide units: subtract ``b``'s exponent vector from ``a``'s."""
+    quotient = _QUOTIENTS.get((a, b))
+    if quotient is None:
+        counts = dict(a.exponents)
+        for dim, exp in b.exponents:
+            counts[dim] = counts.get(dim, 0) - exp
+        quotient = _QUOTIENTS[(a, b)] = _unit(counts)
+    return quotient
+
+
+def units_power(a: Unit, n: int | Fraction) -> Unit:
+    """Raise a unit to a power: scale its exponent vector."""
+    power = _POWERS.get((a, n))
+    if power is None:
+        power = _POWERS[(a, n)] = _unit({dim: exp * n for dim, exp in a.exponents})
+    return power
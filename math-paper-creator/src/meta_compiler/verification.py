@@ -3,22 +3,151 @@
 Provides consistency checking (are axioms self-consistent?) and
 implication checking (does a property follow from given axioms?).
 
+Both checks accept a ``ProofCache``: an on-disk store of previous results
+keyed by a hash of the built Z3 terms (their SMT-LIB ``sexpr()``), the z3 version
+and the solver configuration. Editing an axiom changes its terms and hence
+the key, so stale results are never reused; unchanged proofs are answered
+from disk without constructing a solver.
+
+``verify_model`` runs a whole model's checks incrementally: properties
+given the same axioms share one solver that asserts those axioms once and
+checks each negated claim inside a ``push()``/``pop()`` scope, and the
+group given every axiom shares the consistency check's solver. Each
+``check()`` can be bounded by ``timeout_ms``; results carry per-phase
+``timings``.
+
+Every axiom is asserted behind an assumption literal (``Implies(lit,
+axiom)``, checked under the literals), so an unsat result comes with a
+minimized unsat core: a contradiction names the smallest conflicting
+subset of axioms, and a verified property the given axioms it needed.
+
+All models share z3's global context, which is not thread-safe. Building
+and solving terms must hold ``z3_lock``; the checks here take it
+themselves, and the executor holds it while running validate blocks, so
+documents checked in threads (under ``use_registry()``) take turns in
+z3 while their numeric work still runs concurrently.
+
 Requires z3-solver: pip install z3-solver
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import os
+import threading
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
+
+# Serializes use of z3's shared global context across threads
+z3_lock = threading.RLock()
 
 
 @dataclass
 class VerificationResult:
     """Result of a Z3 verification check."""
-    status: str  # "consistent", "contradictory", "verified", "failed", "skipped", "error"
+    status: str  # "consistent", "contradictory", "verified", "failed", "timeout", "skipped", "error"
     counterexample: dict | None = None
     error: str | None = None
-    duration_s: float | None = None
+    duration_s: float | None = None  # solve time (of the original solve when cached)
+    cached: bool = False
+    # Seconds per phase: "build" (Z3 terms), "assert", "check", "core", "model"
+    timings: dict[str, float] = field(default_factory=dict)
+    # Minimized unsat core: the conflicting axioms ("contradictory") or the
+    # given axioms a property needed ("verified"); None otherwise
+    core: list[str] | None = None
+
+
+# Part of every proof cache key; bump when the way proofs are run changes
+_SOLVER_CONFIG = {"solver": "Solver", "cores": "minimized"}
+# Only definitive outcomes are cached; errors and "unknown" are retried
+_CACHEABLE = {"consistent", "contradictory", "verified", "failed"}
+
+
+def cache_dir() -> Path:
+    """Root of meta_compiler's on-disk caches.
+
+    ``$META_COMPILER_CACHE_DIR`` if set, else ``~/.cache/meta_compiler``.
+    """
+    configured = os.environ.get("META_COMPILER_CACHE_DIR")
+    return Path(configured) if configured else Path.home() / ".cache" / "meta_compiler"
+
+
+class ProofCache:
+    """Verification results stored as one JSON file per proof."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else cache_dir() / "proofs"
+
+    @staticmethod
+    def key(kind: str, terms: list, claim=None) -> str:
+        """Hash of the proof: its kind, the z3 version, solver config and terms.
+
+        For a property, ``terms`` are the given axioms and ``claim`` the
+        property; the negated claim is rendered separately so that checks
+        sharing axioms render them only once (see ``digest``).
+        """
+        import z3
+
+        goal = None if claim is None else _smtlib([z3.Not(claim)])
+        return ProofCache.digest(kind, _smtlib(terms), goal)
+
+    @staticmethod
+    def digest(kind: str, smtlib: str, goal: str | None = None) -> str:
+        """``key`` from already-rendered axioms and negated claim."""
+        import z3
+
+        payload = json.dumps({
+            "kind": kind,
+            "z3": z3.get_version_string(),
+            "config": _SOLVER_CONFIG,
+            "smtlib": smtlib,
+            "goal": goal,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, names: list[str] | None = None) -> VerificationResult | None:
+        """Cached result for ``key``; ``names`` maps its core back to axiom names.
+
+        Cores are stored as positions among the proof's axioms, so renaming
+        an axiom (which leaves the key unchanged) cannot surface a stale name.
+        """
+        try:
+            entry = json.loads((self.directory / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if entry.get("status") not in _CACHEABLE:
+            return None
+        return VerificationResult(
+            status=entry["status"],
+            counterexample=entry.get("counterexample"),
+            duration_s=entry.get("duration_s"),
+            cached=True,
+            core=(None if entry.get("core") is None or names is None
+                  else [names[i] for i in entry["core"]]),
+        )
+
+    def put(self, key: str, result: VerificationResult,
+            names: list[str] | None = None) -> None:
+        if result.status not in _CACHEABLE:
+            return
+        entry = {
+            "status": result.status,
+            "counterexample": result.counterexample,
+            "duration_s": result.duration_s,
+            "core": (None if result.core is None or names is None
+                     else [names.index(n) for n in result.core]),
+        }
+        path = self.directory / f"{key}.json"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(entry))
+            os.replace(tmp, path)
+        except OSError:
+            pass  # an unwritable cache only costs the re-proof
 
 
 def z3_available() -> bool:
@@ -30,87 +159,474 @@ def z3_available() -> bool:
         return False
 
 
+def _with_z3_lock(fn):
+    @functools.wraps(fn)
+    def locked(*args, **kwargs):
+        with z3_lock:
+            return fn(*args, **kwargs)
+    return locked
+
+
+@_with_z3_lock
 def check_axiom_consistency(
-    axiom_exprs: list[object],
+    axiom_exprs: list[object] | dict[str, object],
+    *,
+    cache: ProofCache | None = None,
+    timeout_ms: int | None = None,
 ) -> VerificationResult:
     """Check whether a set of axiom Z3 expressions are mutually consistent.
 
-    Returns VerificationResult with status "consistent" or "contradictory".
+    Returns VerificationResult with status "consistent" or "contradictory"
+    ("timeout" if the solver gives up after ``timeout_ms``). A contradiction's
+    ``core`` names the conflicting axioms: dict keys, or list positions as
+    strings.
     """
     try:
         import z3
     except ImportError:
         return VerificationResult(status="skipped", error="z3-solver not installed")
 
+    names, exprs = _named(axiom_exprs)
+    timings: dict[str, float] = {}
     start = time.monotonic()
     try:
-        solver = z3.Solver()
-        for expr_fn in axiom_exprs:
-            solver.add(expr_fn())
-
-        result = solver.check()
-        duration = time.monotonic() - start
-
-        if result == z3.sat:
-            return VerificationResult(status="consistent", duration_s=duration)
-        elif result == z3.unsat:
-            return VerificationResult(status="contradictory", duration_s=duration)
-        else:
-            return VerificationResult(
-                status="error", error="Z3 returned unknown",
-                duration_s=duration,
-            )
+        terms = [expr_fn() for expr_fn in exprs]
     except Exception as e:
-        return VerificationResult(
-            status="error", error=str(e),
-            duration_s=time.monotonic() - start,
-        )
+        return _error(str(e), _lap(timings, "build", start))
+    _lap(timings, "build", start)
+    prover = _Prover(z3, terms, timeout_ms, names=names)
+    return _cached(cache, prover, lambda: prover.key("consistency"),
+                   lambda: prover.consistency(timings))
 
 
+@_with_z3_lock
 def check_property(
-    axiom_exprs: list[object],
+    axiom_exprs: list[object] | dict[str, object],
     property_expr: object,
+    *,
+    cache: ProofCache | None = None,
+    timeout_ms: int | None = None,
 ) -> VerificationResult:
     """Check whether a property follows from given axioms.
 
     Uses proof by contradiction: if axioms AND NOT(property) is unsat,
-    then the property is implied by the axioms.
+    then the property is implied by the axioms. A verified property's
+    ``core`` names the axioms the proof needed (as for
+    ``check_axiom_consistency``).
     """
     try:
         import z3
     except ImportError:
         return VerificationResult(status="skipped", error="z3-solver not installed")
 
+    names, exprs = _named(axiom_exprs)
+    timings: dict[str, float] = {}
     start = time.monotonic()
     try:
-        solver = z3.Solver()
-        for expr_fn in axiom_exprs:
-            solver.add(expr_fn())
-        solver.add(z3.Not(property_expr()))
+        terms = [expr_fn() for expr_fn in exprs]
+        claim = property_expr()
+    except Exception as e:
+        return _error(str(e), _lap(timings, "build", start))
+    _lap(timings, "build", start)
+    prover = _Prover(z3, terms, timeout_ms, names=names)
+    return _cached(cache, prover, lambda: prover.key("property", claim),
+                   lambda: prover.implication(claim, timings))
+
+
+@dataclass
+class ModelVerification:
+    """Results of ``verify_model``: one consistency check, one result per property."""
+    consistency: VerificationResult
+    properties: dict[str, VerificationResult] = field(default_factory=dict)
+
+
+@_with_z3_lock
+def verify_model(
+    axioms: dict[str, object],
+    properties: dict[str, tuple[tuple[str, ...], object]],
+    *,
+    cache: ProofCache | None = None,
+    timeout_ms: int | None = None,
+    deadline_s: float | None = None,
+    jobs: int = 1,
+) -> ModelVerification:
+    """Check the axioms' consistency and every property on shared solvers.
+
+    ``axioms`` maps names to Z3 expression callables; ``properties`` maps
+    names to ``(given, expr)``. Properties are grouped by the set of
+    axioms they are given: each group asserts its axioms on one solver
+    once, and each property is checked as ``push(); add(Not(claim));
+    check(); pop()`` on top of them. The group given every axiom reuses the
+    consistency solver. Names in ``given`` that are not axioms are
+    ignored, and a property given no axioms gets no result.
+
+    ``timeout_ms`` bounds each ``check()`` and ``deadline_s`` the whole
+    run; checks cut off by either report status "timeout". When either is
+    set, or ``jobs > 1``, the groups are solved in up to ``jobs`` forked
+    worker processes, so a check that ignores z3's own timeout is killed
+    (and the rest of its group re-queued) instead of blocking the caller.
+    """
+    try:
+        import z3
+    except ImportError:
+        skipped = VerificationResult(status="skipped", error="z3-solver not installed")
+        return ModelVerification(skipped)
+
+    deadline = None if deadline_s is None else time.monotonic() + deadline_s
+    terms: dict[str, object] = {}
+    broken: dict[str, str] = {}
+    timings: dict[str, float] = {}
+    start = time.monotonic()
+    for name, expr_fn in axioms.items():
+        try:
+            terms[name] = expr_fn()
+        except Exception as e:
+            broken[name] = str(e)
+    _lap(timings, "build", start)
+
+    def prover_for(group: tuple[str, ...]) -> _Prover:
+        if group not in provers:
+            provers[group] = _Prover(z3, [terms[ax] for ax in group], timeout_ms,
+                                     deadline, deadline_s, names=list(group))
+        return provers[group]
+
+    # Each check is a (name, claim, timings) entry; name None is consistency
+    provers: dict[tuple[str, ...], _Prover] = {}
+    keys: dict[str | None, tuple[str, _Prover]] = {}
+    results: dict[str | None, VerificationResult] = {}
+    tasks: dict[tuple[str, ...], list[tuple]] = {}
+
+    def plan(group: tuple[str, ...], name: str | None, claim, entry_timings) -> None:
+        prover = prover_for(group)
+        if cache is not None:
+            try:
+                key = (prover.key("consistency") if claim is None
+                       else prover.key("property", claim))
+            except Exception:  # a term without sexpr(), e.g. a plain bool
+                pass
+            else:
+                keys[name] = (key, prover)
+                hit = cache.get(key, prover.names)
+                if hit is not None:
+                    results[name] = hit
+                    return
+        tasks.setdefault(group, []).append((name, claim, entry_timings))
+
+    if broken:
+        results[None] = _error(next(iter(broken.values())), timings)
+    else:
+        plan(tuple(terms), None, None, timings)
+
+    for name, (given, expr_fn) in properties.items():
+        group = tuple(ax for ax in axioms if ax in given)  # declaration order
+        if not group:
+            continue
+        failed = [broken[ax] for ax in group if ax in broken]
+        if failed:
+            results[name] = _error(failed[0], {})
+            continue
+        prop_timings: dict[str, float] = {}
+        start = time.monotonic()
+        try:
+            claim = expr_fn()
+        except Exception as e:
+            results[name] = _error(str(e), _lap(prop_timings, "build", start))
+            continue
+        _lap(prop_timings, "build", start)
+        plan(group, name, claim, prop_timings)
+
+    work = [(provers[group], entries) for group, entries in tasks.items()]
+    pooled = jobs > 1 or timeout_ms is not None or deadline is not None
+    if work and pooled and _can_fork():
+        solved = _prove_in_pool(work, jobs, timeout_ms, deadline_s, deadline)
+    else:
+        solved = {}
+        for prover, entries in work:
+            for name, claim, entry_timings in entries:
+                solved[name] = _prove(prover, claim, entry_timings)
+    for name, result in solved.items():
+        if cache is not None and name in keys:
+            key, prover = keys[name]
+            cache.put(key, result, prover.names)
+    results.update(solved)
 
-        result = solver.check()
-        duration = time.monotonic() - start
+    consistency = results.pop(None)
+    return ModelVerification(
+        consistency, {name: results[name] for name in properties if name in results},
+    )
 
+
+def _prove(prover: "_Prover", claim, timings: dict[str, float]) -> VerificationResult:
+    if claim is None:
+        return prover.consistency(timings)
+    return prover.implication(claim, timings)
+
+
+# Extra time a worker gets beyond z3's own timeout before it is killed
+_KILL_GRACE_S = 1.0
+
+
+def _can_fork() -> bool:
+    import multiprocessing
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _prove_in_pool(
+    work: list[tuple["_Prover", list[tuple]]],
+    jobs: int,
+    timeout_ms: int | None,
+    deadline_s: float | None,
+    deadline: float | None,
+) -> dict[str | None, VerificationResult]:
+    """Solve each group in a forked worker that streams back one result per check.
+
+    Forking hands the built terms and solvers to the worker without
+    pickling them. A worker silent for ``timeout_ms`` plus a grace period
+    is killed: its current check times out and the rest of its group is
+    re-queued. At the deadline every unfinished check times out.
+    """
+    import multiprocessing
+    from collections import deque
+    from multiprocessing.connection import wait
+
+    context = multiprocessing.get_context("fork")
+    queue = deque(work)
+    running: dict = {}  # connection -> [process, prover, entries, next index, last heard]
+    solved: dict[str | None, VerificationResult] = {}
+    limit = None if timeout_ms is None else timeout_ms / 1000 + _KILL_GRACE_S
+
+    def stop(conn) -> tuple:
+        process, prover, entries, done, _ = running.pop(conn)
+        process.kill()
+        process.join()
+        conn.close()
+        return prover, entries[done:]
+
+    try:
+        while queue or running:
+            while queue and len(running) < jobs:
+                prover, entries = queue.popleft()
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_prove_in_worker,
+                                          args=(prover, entries, sender), daemon=True)
+                process.start()
+                sender.close()
+                running[receiver] = [process, prover, entries, 0, time.monotonic()]
+
+            now = time.monotonic()
+            wake = [deadline] if deadline is not None else []
+            if limit is not None:
+                wake += [state[4] + limit for state in running.values()]
+            for conn in wait(list(running), None if not wake else max(0.0, min(wake) - now)):
+                state = running[conn]
+                try:
+                    name, result = conn.recv()
+                except EOFError:
+                    _, entries = stop(conn)
+                    if entries:  # the worker died mid-group
+                        name, claim, timings = entries[0]
+                        solved[name] = _error("verification worker exited unexpectedly",
+                                              timings)
+                        if entries[1:]:
+                            queue.appendleft((state[1], entries[1:]))
+                    continue
+                solved[name] = result
+                state[3] += 1
+                state[4] = time.monotonic()
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+            if limit is not None:
+                for conn in [c for c, state in running.items() if now - state[4] >= limit]:
+                    prover, entries = stop(conn)
+                    name, claim, timings = entries[0]
+                    solved[name] = _done("timeout", timings,
+                                         error=f"no result after {timeout_ms} ms")
+                    if entries[1:]:
+                        queue.appendleft((prover, entries[1:]))
+    finally:
+        unfinished = [entry for conn in list(running) for entry in stop(conn)[1]]
+    unfinished += [entry for _, entries in queue for entry in entries]
+    for name, claim, timings in unfinished:
+        if name not in solved:
+            solved[name] = _done("timeout", timings,
+                                 error=f"verification deadline of {deadline_s:g} s reached")
+    return solved
+
+
+def _prove_in_worker(prover: "_Prover", entries: list[tuple], conn) -> None:
+    """Worker body: solve ``entries`` in order, sending each result as it is found."""
+    for name, claim, timings in entries:
+        conn.send((name, _prove(prover, claim, timings)))
+    conn.close()
+
+
+class _Prover:
+    """A solver holding one fixed set of asserted axiom terms.
+
+    The solver is created and the axioms asserted on first use, so checks
+    answered from the proof cache never build one; the SMT-LIB rendering
+    used for cache keys is likewise computed once.
+    """
+
+    def __init__(self, z3, terms: list, timeout_ms: int | None,
+                 deadline: float | None = None, deadline_s: float | None = None,
+                 *, names: list[str]) -> None:
+        self.z3 = z3
+        self.terms = terms
+        self.names = names  # one per term, reported in unsat cores
+        self.timeout_ms = timeout_ms
+        self.deadline = deadline  # time.monotonic() value, or None
+        self.deadline_s = deadline_s
+        self._solver = None
+        self._literals: list = []
+        self._smtlib: str | None = None
+
+    def key(self, kind: str, claim=None) -> str:
+        if self._smtlib is None:
+            self._smtlib = _smtlib(self.terms)
+        goal = None if claim is None else _smtlib([self.z3.Not(claim)])
+        return ProofCache.digest(kind, self._smtlib, goal)
+
+    def consistency(self, timings: dict[str, float]) -> VerificationResult:
+        z3 = self.z3
+        try:
+            result, solver = self._check(timings)
+        except Exception as e:
+            return _error(str(e), timings)
+        if result == z3.sat:
+            return _done("consistent", timings)
         if result == z3.unsat:
-            # No counterexample exists — property is implied
-            return VerificationResult(status="verified", duration_s=duration)
-        elif result == z3.sat:
-            # Counterexample found — property does NOT follow
-            model = solver.model()
-            counterexample = {
-                str(d): str(model[d]) for d in model.decls()
-            }
-            return VerificationResult(
-                status="failed", counterexample=counterexample,
-                duration_s=duration,
-            )
-        else:
-            return VerificationResult(
-                status="error", error="Z3 returned unknown",
-                duration_s=duration,
-            )
-    except Exception as e:
-        return VerificationResult(
-            status="error", error=str(e),
-            duration_s=time.monotonic() - start,
-        )
+            return _done("contradictory", timings, core=self._core(solver, timings))
+        return self._unknown(solver, timings)
+
+    def implication(self, claim, timings: dict[str, float]) -> VerificationResult:
+        z3 = self.z3
+        try:
+            result, solver = self._check(timings, z3.Not(claim))
+            if result == z3.unsat:
+                # No counterexample exists — property is implied
+                return _done("verified", timings, core=self._core(solver, timings))
+            if result == z3.sat:
+                # Counterexample found — property does NOT follow
+                start = time.monotonic()
+                model = solver.model()
+                literals = {lit.decl() for lit in self._literals}
+                counterexample = {
+                    str(d): str(model[d]) for d in model.decls() if d not in literals
+                }
+                _lap(timings, "model", start)
+                return _done("failed", timings, counterexample=counterexample)
+            return self._unknown(solver, timings)
+        except Exception as e:
+            return _error(str(e), timings)
+        finally:
+            if self._solver is not None and self._solver.num_scopes():
+                self._solver.pop()
+
+    def _check(self, timings: dict[str, float], negation=None):
+        """``check()`` the axioms, plus ``negation`` in a pushed scope if given.
+
+        The caller pops the scope (after reading the model).
+        """
+        start = time.monotonic()
+        if self._solver is None:
+            z3 = self.z3
+            solver = z3.Solver()
+            solver.set("core.minimize", True)
+            self._literals = [z3.Bool(f"axiom!{i}") for i in range(len(self.terms))]
+            for literal, term in zip(self._literals, self.terms):
+                solver.add(z3.Implies(literal, term))
+            self._solver = solver
+        if negation is not None:
+            self._solver.push()
+            self._solver.add(negation)
+        _lap(timings, "assert", start)
+        budget = self._budget_ms()
+        if budget is not None:
+            self._solver.set("timeout", budget)
+        start = time.monotonic()
+        result = self._solver.check(*self._literals)
+        _lap(timings, "check", start)
+        return result, self._solver
+
+    def _core(self, solver, timings: dict[str, float]) -> list[str]:
+        """Names of the axioms in the (minimized) unsat core, in declaration order."""
+        start = time.monotonic()
+        position = {lit.decl(): i for i, lit in enumerate(self._literals)}
+        core = sorted(position[lit.decl()] for lit in solver.unsat_core())
+        _lap(timings, "core", start)
+        return [self.names[i] for i in core]
+
+    def _budget_ms(self) -> int | None:
+        """z3 timeout for the next check: ``timeout_ms``, capped by the deadline."""
+        budget = self.timeout_ms
+        if self.deadline is not None:
+            left = max(1, int((self.deadline - time.monotonic()) * 1000))
+            budget = left if budget is None else min(budget, left)
+        return None if budget is None else int(budget)
+
+    def _unknown(self, solver, timings: dict[str, float]) -> VerificationResult:
+        if solver.reason_unknown() in ("timeout", "canceled"):
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                return _done("timeout", timings, error=f"verification deadline of "
+                             f"{self.deadline_s:g} s reached")
+            return _done("timeout", timings,
+                         error=f"Z3 gave up after {self.timeout_ms} ms")
+        return _error("Z3 returned unknown", timings)
+
+
+def _lap(timings: dict[str, float], phase: str, start: float) -> dict[str, float]:
+    """Add the time since ``start`` to ``timings[phase]``."""
+    timings[phase] = timings.get(phase, 0.0) + time.monotonic() - start
+    return timings
+
+
+def _done(status: str, timings: dict[str, float], **fields) -> VerificationResult:
+    return VerificationResult(status=status, duration_s=sum(timings.values()),
+                              timings=dict(timings), **fields)
+
+
+def _error(message: str, timings: dict[str, float]) -> VerificationResult:
+    return _done("error", timings, error=message)
+
+
+def _smtlib(terms: list) -> str:
+    """``terms`` as SMT-LIB, with a declaration (and sort) for every constant.
+
+    Rendered through a scratch solver: a bare ``sexpr()`` reads ``x == y``
+    the same for Int and Real ``x``.
+    """
+    import z3
+
+    scratch = z3.Solver()
+    for term in terms:
+        scratch.add(term)
+    return scratch.sexpr()
+
+
+def _named(axiom_exprs: list[object] | dict[str, object]) -> tuple[list[str], list]:
+    """(names, callables); list positions serve as names for a plain list."""
+    if isinstance(axiom_exprs, dict):
+        return list(axiom_exprs), list(axiom_exprs.values())
+    return [str(i) for i in range(len(axiom_exprs))], list(axiom_exprs)
+
+
+def _cached(cache: ProofCache | None, prover: _Prover, key, solve) -> VerificationResult:
+    """Answer from ``cache`` if it holds this proof, else solve and store.
+
+    ``key`` and ``solve`` are thunks, so neither runs unless needed.
+    """
+    if cache is None:
+        return solve()
+    try:
+        digest = key()
+    except Exception:  # a term without sexpr(), e.g. a plain bool
+        return solve()
+    hit = cache.get(digest, prover.names)
+    if hit is not None:
+        return hit
+    result = solve()
+    cache.put(digest, result, prover.names)
+    return result
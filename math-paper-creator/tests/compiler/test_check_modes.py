@@ -0,0 +1,75 @@
+import pytest
+
+from meta_compiler.compiler import check_document
+from meta_compiler.compiler.executor import _NumericOptions, execute_blocks
+from meta_compiler.compiler.parser import parse_document
+
+
+def _doc(n=1000, bound=100):
+    return f'''# Model
+
+```python:fixture
+W = list(range({n}))
+cap = {{w: w for w in W}}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("cap_limit", over="W", expr=lambda i: cap[i] < {bound})
+```
+'''
+
+
+def _errors(source, **options):
+    return execute_blocks(parse_document(source), **options).errors
+
+
+def test_exhaustive_by_default():
+    assert len(_errors(_doc())) == 900
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_max_violations_truncates_and_counts(vectorize):
+    errors = _errors(_doc(), max_violations=3, vectorize=vectorize)
+    assert errors == _errors(_doc())[:3] + [
+        'Constraint "cap_limit" violated for 900 of 1000 checked members of W (897 not shown)'
+    ]
+
+
+def test_max_violations_not_reached_adds_nothing():
+    assert _errors(_doc(), max_violations=1000) == _errors(_doc())
+
+
+def test_sample_is_stratified_and_deterministic():
+    options = _NumericOptions(sample=10, seed=7)
+    members = list(range(1000))
+    picked = options.members_to_check("W", members)
+    assert len(picked) == 10
+    assert [m // 100 for m in picked] == list(range(10))  # one per stratum, in order
+    assert _NumericOptions(sample=10, seed=7).members_to_check("W", members) == picked
+    assert _NumericOptions(sample=10, seed=8).members_to_check("W", members) != picked
+
+
+def test_sample_larger_than_set_checks_everything():
+    members = [1, 2, 3]
+    assert _NumericOptions(sample=10).members_to_check("W", members) is members
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_sampled_check_reports_sampled_violations(vectorize):
+    result = execute_blocks(parse_document(_doc()), sample=20, vectorize=vectorize)
+    violations = [e for e in result.errors if "violated for W=" in e]
+    assert len(violations) == 18  # strata 2..19 lie entirely above the bound
+    assert result.warnings == [
+        'Constraints over "W" checked on a sample of 20 of 1000 members (seed 0)'
+    ]
+
+
+def test_sampling_can_miss_violations():
+    source = _doc(bound=999)  # only the last member fails
+    assert not check_document(source).passed
+    sampled = check_document(source, sample=10, seed=0)
+    assert sampled.passed == (999 not in _NumericOptions(sample=10).members_to_check(
+        "W", list(range(1000))))
+
@@ -202,3 +202,50 @@ Parameter("H", description="total hours")
         capture_output=True, text=True, env=_CLI_ENV,
     )
     assert result.returncode == 0, f"stderr: {result.stderr}"
+
+
+def test_cli_check_many_files(tmp_path):
+    """CLI check validates several files and writes a JUnit report."""
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.model.md").write_text('''
+```python:validate
+Set("W", description="Workers")
+```
+''')
+    junit = tmp_path / "report.xml"
+    result = subprocess.run(
+        [sys.executable, "-m", "meta_compiler.cli", "check", str(tmp_path),
+         "--workers", "2", "--junit", str(junit)],
+        capture_output=True, text=True, env=_CLI_ENV,
+    )
+    assert result.returncode == 0
+    assert "2 files: 2 passed, 0 failed" in result.stdout
+    assert junit.exists()
+
+
+def test_cli_compile_reuses_build_cache(tmp_path):
+    """An unchanged source is served from the build cache; an edit rebuilds."""
+    doc_path = tmp_path / "test.model.md"
+    doc_path.write_text('''### Sets
+
+```python:validate
+Set("W", description="Workers")
+```
+''')
+    out_dir = tmp_path / "output"
+
+    def compile_(*flags):
+        return subprocess.run(
+            [sys.executable, "-m", "meta_compiler.cli", "compile", str(doc_path),
+             "--output", str(out_dir), "--no-strict", *flags],
+            capture_output=True, text=True, env=_CLI_ENV,
+        )
+
+    assert "from build cache" not in compile_().stdout
+    assert "from build cache" in compile_().stdout
+    assert "from build cache" not in compile_("--no-build-cache").stdout
+    doc_path.write_text(doc_path.read_text() + "\nMore prose.\n")
+    result = compile_()
+    assert result.returncode == 0
+    assert "from build cache" not in result.stdout
+    assert "More prose." in (out_dir / "paper.md").read_text()
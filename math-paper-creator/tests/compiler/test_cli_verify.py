@@ -36,3 +36,23 @@ def test_cli_verify_contradictory(tmp_path):
     f.write_text(CONTRADICTORY_DOC)
     result = main(["verify", str(f)])
     assert result == 1
+
+
+PROPERTY_DOC = '''# Model
+
+```python:validate
+from z3 import Real
+H = Real('H')
+Axiom("A1", statement="H > 0", z3_expr=lambda: H > 0, description="Pos")
+Property("P1", claim="H >= 0", z3_expr=lambda: H >= 0, given=["A1"], description="Non-neg")
+```
+'''
+
+
+def test_cli_verify_prints_property_table(tmp_path, capsys):
+    f = tmp_path / "test.model.md"
+    f.write_text(PROPERTY_DOC)
+    assert main(["verify", str(f), "--jobs", "2", "--proof-timeout", "5"]) == 0
+    out = capsys.readouterr().out
+    assert "Property" in out and "Status" in out
+    assert any(line.split()[:2] == ["P1", "verified"] for line in out.splitlines())
@@ -94,3 +94,48 @@ def test_axiom_without_z3_expr_skips_verification():
     blocks = parse_document(NO_Z3_EXPR_DOC)
     result = execute_blocks(blocks)
     assert result.passed
+
+
+HARD_PROPERTY_DOC = '''# Model
+
+```python:validate
+from z3 import Ints, And
+x, y, z = Ints('x y z')
+Axiom("A1", statement="positive", z3_expr=lambda: And(x > 0, y > 0, z > 0), description="Pos")
+Property("P1", claim="no cube sums", z3_expr=lambda: x**3 + y**3 != z**3,
+         given=["A1"], description="Fermat n=3")
+```
+'''
+
+
+def test_property_timeout_is_a_warning():
+    blocks = parse_document(HARD_PROPERTY_DOC)
+    result = execute_blocks(blocks, proof_timeout=0.05, proof_cache=False)
+    assert result.passed, f"Errors: {result.errors}"
+    assert any('Property "P1" was not verified' in w for w in result.warnings)
+    assert result.verification.properties["P1"].status == "timeout"
+
+
+CORE_DOC = '''# Model
+
+```python:validate
+from z3 import Real
+H = Real('H')
+M = Real('M')
+Axiom("A1", statement="H is positive", z3_expr=lambda: H > 0, description="Pos")
+Axiom("A2", statement="M non-negative", z3_expr=lambda: M >= 0, description="Non-neg")
+Axiom("A3", statement="H below M", z3_expr=lambda: H < M, description="Order")
+Axiom("A4", statement="H is negative", z3_expr=lambda: H < 0, description="Neg")
+```
+'''
+
+
+def test_contradiction_names_minimal_core():
+    result = execute_blocks(parse_document(CORE_DOC))
+    assert "Axioms are contradictory: A1, A4 cannot all hold simultaneously" in result.errors
+
+
+def test_verified_property_reports_needed_axioms():
+    result = execute_blocks(parse_document(PROPERTY_HOLDS_DOC))
+    # H - M >= 0 follows from M <= H alone
+    assert result.verification.properties["P1"].core == ["A3"]
@@ -0,0 +1,192 @@
+from meta_compiler.compiler import check_document
+from meta_compiler.compiler.executor import execute_blocks
+from meta_compiler.compiler.incremental import IncrementalExecutor, block_fingerprint
+from meta_compiler.compiler.parser import ValidationBlock, ResultsBlock, parse_document
+
+BASE_DOC = '''# Model
+
+```python:fixture
+W = ["alice", "bob"]
+cap = {"alice": 40, "bob": 35}
+hours = {"alice": 30, "bob": 20}
+```
+
+```python:results
+print(f"workers: {len(W)}")
+```
+
+## Sets
+
+```python:validate
+Set("W", description="Workers")
+```
+
+## Parameters
+
+```python:validate
+Parameter("cap", index="W", units="hours", description="Capacity")
+Parameter("hours", index="W", units="hours", description="Assigned hours")
+```
+
+## Constraints
+
+```python:validate
+Constraint("fits", over="W", expr=lambda i: hours[i] <= cap[i])
+```
+'''
+
+
+def _full(source, strict=False):
+    result = execute_blocks(parse_document(source), strict=strict)
+    return result.passed, result.errors, result.warnings
+
+
+def _incremental(executor, source, strict=False):
+    result = executor.execute(parse_document(source), strict=strict)
+    return result.passed, result.errors, result.warnings
+
+
+def test_fingerprint_ignores_line_number():
+    a = ValidationBlock(code="Set('W')", line_number=3)
+    b = ValidationBlock(code="Set('W')", line_number=30)
+    assert block_fingerprint(a) == block_fingerprint(b)
+
+
+def test_fingerprint_distinguishes_block_types():
+    a = ValidationBlock(code="x = 1", line_number=1)
+    b = ResultsBlock(code="x = 1", line_number=1)
+    assert block_fingerprint(a) != block_fingerprint(b)
+
+
+def test_first_run_executes_everything():
+    ex = IncrementalExecutor()
+    assert _incremental(ex, BASE_DOC) == _full(BASE_DOC)
+    assert ex.reused_blocks == 0
+    assert ex.executed_blocks == 3
+
+
+def test_unchanged_document_reuses_all_blocks():
+    ex = IncrementalExecutor()
+    _incremental(ex, BASE_DOC)
+    assert _incremental(ex, BASE_DOC) == _full(BASE_DOC)
+    assert ex.reused_blocks == 3
+    assert ex.executed_blocks == 0
+
+
+def test_edit_reruns_only_downstream_blocks():
+    ex = IncrementalExecutor()
+    _incremental(ex, BASE_DOC)
+    edited = BASE_DOC.replace("hours[i] <= cap[i]", "hours[i] <= cap[i] - 10")
+    assert _incremental(ex, edited) == _full(edited)
+    assert ex.reused_blocks == 2
+    assert ex.executed_blocks == 1
+
+
+def test_prose_edit_shifting_lines_keeps_cache():
+    ex = IncrementalExecutor()
+    _incremental(ex, BASE_DOC)
+    edited = BASE_DOC.replace("# Model\n", "# Model\n\nSome new prose.\n\nMore.\n")
+    assert _incremental(ex, edited) == _full(edited)
+    assert ex.reused_blocks == 3
+
+
+def test_fixture_edit_invalidates_everything():
+    ex = IncrementalExecutor()
+    _incremental(ex, BASE_DOC)
+    edited = BASE_DOC.replace('"bob": 20', '"bob": 50')
+    expected = _full(edited)
+    assert not expected[0]
+    assert _incremental(ex, edited) == expected
+    assert ex.reused_blocks == 0
+
+
+def test_data_file_edit_invalidates_everything(tmp_path):
+    data = tmp_path / "workers.csv"
+    data.write_text("worker,hours\na,10\nb,20\n")
+    doc = f'''# Model
+
+```python:fixture
+from meta_compiler.fixtures import load_csv
+W = load_csv({str(data)!r}, "worker")
+hours = load_csv({str(data)!r}, "hours", index="W")
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("hours", index="W", units="hours", description="Assigned hours")
+Constraint("check", over="W", expr=lambda i: hours[i] <= 40)
+```
+'''
+    ex = IncrementalExecutor()
+    assert _incremental(ex, doc)[0]
+    data.write_text("worker,hours\na,10\nb,50\n")
+    expected = _full(doc)
+    assert not expected[0]
+    assert _incremental(ex, doc) == expected
+    assert ex.reused_blocks == 0
+
+
+def test_results_output_restored_from_cache():
+    ex = IncrementalExecutor()
+    _incremental(ex, BASE_DOC)
+    blocks = parse_document(BASE_DOC)
+    ex.execute(blocks)
+    rb = [b for b in blocks if isinstance(b, ResultsBlock)][0]
+    assert rb.output == "workers: 2\n"
+
+
+def test_matches_full_run_across_edit_sequence():
+    """Errors and warnings match a full run after every edit, including failures."""
+    revisions = [
+        BASE_DOC,
+        BASE_DOC.replace('Parameter("hours"', 'Parameter("hrs"'),  # phantom + exec error
+        BASE_DOC.replace("lambda i: hours[i] <= cap[i]", "lambda i: hours[i] <= 25"),
+        BASE_DOC + '\n```python:validate\nParameter("unused", units="hours")\n```\n',
+        BASE_DOC,
+    ]
+    ex = IncrementalExecutor()
+    for source in revisions:
+        for strict in (False, True):
+            assert _incremental(ex, source, strict) == _full(source, strict)
+
+
+def test_validation_error_then_fix():
+    ex = IncrementalExecutor()
+    broken = BASE_DOC.replace('Set("W", description="Workers")', 'Set("W", description="Workers"')
+    assert _incremental(ex, broken) == _full(broken)
+    assert _incremental(ex, BASE_DOC) == _full(BASE_DOC)
+    assert ex.reused_blocks == 0
+
+
+def test_namespace_restored_for_reexecuted_blocks():
+    """Names bound by discarded blocks must not leak into re-executed ones."""
+    doc_a = BASE_DOC + '\n```python:validate\nhelper = 1\n```\n'
+    doc_b = BASE_DOC + '\n```python:validate\nprint(helper)\n```\n'
+    ex = IncrementalExecutor()
+    _incremental(ex, doc_a)
+    passed, errors, _ = _incremental(ex, doc_b)
+    assert (passed, errors) == _full(doc_b)[:2]
+    assert any("helper" in e for e in errors)
+
+
+def test_mutated_object_from_reused_block_is_reexecuted():
+    """A later block mutating an earlier block's object must not leak into the reused state."""
+    doc = BASE_DOC + (
+        '\n```python:validate\nitems = []\n```\n'
+        '\n```python:validate\nitems.append(1)\n'
+        'Constraint("one", expr=lambda: len(items) == 1)\n```\n'
+    )
+    edited = doc.replace("items.append(1)", "items.append(1)  # edited")
+    ex = IncrementalExecutor()
+    assert _incremental(ex, doc) == _full(doc)
+    assert _full(edited)[0]
+    assert _incremental(ex, edited) == _full(edited)
+    assert ex.reused_blocks == 3  # the immutable prefix is still reused
+
+
+def test_check_document_accepts_executor():
+    ex = IncrementalExecutor()
+    first = check_document(BASE_DOC, executor=ex)
+    second = check_document(BASE_DOC, executor=ex)
+    assert first.passed and second.passed
+    assert ex.reused_blocks == 3
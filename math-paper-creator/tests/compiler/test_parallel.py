@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from meta_compiler.compiler.executor import _can_fork, execute_blocks
+from meta_compiler.compiler.parser import parse_document
+from meta_compiler.registry import registry
+
+pytestmark = pytest.mark.skipif(not _can_fork(), reason="fork start method unavailable")
+
+_CLI_ENV = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[2] / "src")}
+
+
+def _doc(n_constraints=12):
+    constraints = "\n".join(
+        f'Constraint("c{k}", over="W", expr=lambda i: cap[i] <= {40 + 10 * k})'
+        for k in range(n_constraints)
+    )
+    return f'''# Model
+
+```python:fixture
+W = ["alice", "bob", "carol"]
+cap = {{"alice": 40, "bob": 90, "carol": 150}}
+cost = {{"alice": 1.0, "bob": 2.0, "carol": 3.0}}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Parameter("cost", index="W", units="USD", description="Cost")
+Parameter("unused", units="hours", description="Never referenced")
+{constraints}
+Constraint("broken", over="W", expr=lambda i: cap[i] / 0 <= 1)
+Constraint("total", expr=lambda: sum(cap[w] for w in W) <= 1000)
+Objective("spend", sense="minimize", expr=lambda: sum(cost[w] for w in W))
+Objective("label", sense="minimize", expr=lambda: "not a number")
+```
+'''
+
+
+def _run(source, jobs, strict=False):
+    result = execute_blocks(parse_document(source), strict=strict, jobs=jobs)
+    return result.passed, result.errors, result.warnings, set(registry.access_log)
+
+
+@pytest.mark.parametrize("jobs", [2, 4])
+def test_parallel_matches_serial(jobs):
+    source = _doc()
+    assert _run(source, jobs) == _run(source, 1)
+
+
+def test_parallel_matches_serial_strict():
+    source = _doc()
+    assert _run(source, 3, strict=True) == _run(source, 1, strict=True)
+
+
+def test_parallel_errors_in_registry_order():
+    _, errors, _, _ = _run(_doc(), 4)
+    names = [e.split('"')[1] for e in errors if e.startswith(("Constraint", "Error", "Objective"))]
+    assert list(dict.fromkeys(names)) == [f"c{k}" for k in range(11)] + ["broken", "label"]
+
+
+def test_parallel_access_log_merged():
+    *_, accessed = _run(_doc(), 2)
+    assert {"cap", "cost"} <= accessed
+    assert "unused" not in accessed
+
+
+def test_cli_check_jobs(tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(_doc())
+    outputs = [
+        subprocess.run(
+            [sys.executable, "-m", "meta_compiler.cli", "check", str(doc), "--jobs", jobs],
+            capture_output=True, text=True, env=_CLI_ENV,
+        )
+        for jobs in ("1", "3")
+    ]
+    assert outputs[0].returncode == outputs[1].returncode == 1
+    assert outputs[0].stdout == outputs[1].stdout
+
+
+def test_cli_rejects_zero_jobs(tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(_doc())
+    result = subprocess.run(
+        [sys.executable, "-m", "meta_compiler.cli", "check", str(doc), "--jobs", "0"],
+        capture_output=True, text=True, env=_CLI_ENV,
+    )
+    assert result.returncode == 2
+    assert "positive integer" in result.stderr
@@ -271,3 +271,89 @@ def test_extract_section_blocks_unknown_heading_returns_empty():
     doc = "## Intro\n\nSome text.\n"
     blocks = parse_document(doc)
     assert extract_section_blocks(blocks, "Nonexistent") == []
+
+
+from meta_compiler.compiler.parser import Heading, heading_index, iter_blocks
+
+
+def test_iter_blocks_is_lazy():
+    blocks = iter_blocks("# A\n\n$$x$$\n")
+    assert isinstance(next(blocks), ProseBlock)
+    assert isinstance(next(blocks), MathBlock)
+
+
+def test_blocks_carry_source_spans():
+    doc = "# Title\n\nProse.\n\n```python:validate\nSet('W')\n```\n\n$$\nx\n$$\n"
+    blocks = parse_document(doc)
+    prose, validate, math = blocks
+    assert (prose.span.first_line, prose.span.last_line) == (0, 3)
+    assert doc[validate.span.start:validate.span.end] == "```python:validate\nSet('W')\n```"
+    assert (validate.span.first_line, validate.span.last_line) == (4, 6)
+    assert doc[math.span.start:math.span.end] == "$$\nx\n$$"
+
+
+def test_prose_block_heading_index():
+    blocks = parse_document("# Top\n\ntext\n\n## Sub Section\n\nmore\n")
+    assert blocks[0].headings == (Heading(1, "Top", 0), Heading(2, "Sub Section", 4))
+
+
+def test_constructed_prose_block_indexes_itself():
+    block = ProseBlock(content="intro\n<!-- depth:technical -->\n### Deep\n")
+    assert block.headings == (Heading(3, "Deep", 2),)
+    assert [(m.depth, m.line) for m in block.depth_markers] == [("technical", 1)]
+
+
+def test_prose_outline_is_built_on_demand():
+    [block] = parse_document("# Top\n\n  ## Sub #1 ##\ntext # not a heading\n")
+    assert block.outline is None
+    assert block.section_title() == "Sub #1 ##"
+    assert block.outline is None
+    assert [h.title for h in block.headings] == ["Top", "Sub #1 ##"]
+    assert block.section_title() == "Sub #1 ##"
+
+
+def test_spans_do_not_affect_equality():
+    assert parse_document("# A\n") == [ProseBlock(content="# A\n")]
+
+
+def test_heading_index_across_blocks():
+    doc = "# A\n\n$$x$$\n\n## B\n"
+    index = heading_index(parse_document(doc))
+    assert [(i, h.title) for i, h in index] == [(0, "A"), (2, "B")]
+
+
+from meta_compiler.compiler.parser import SectionCoverage, next_block_index
+
+
+def test_next_block_index():
+    blocks = parse_document("$$a$$\n\n$$b$$\n\n```python:validate\nx()\n```\n")
+    assert next_block_index(blocks, ValidationBlock) == [2, 2, 3]
+    assert next_block_index(blocks, MathBlock) == [1, 3, 3]
+
+
+def test_coverage_metric_per_section_counts():
+    doc = (
+        "$$z = 0$$\n\n"
+        "## A\n\n$$x = 1$$\n\n$$y = 2$$\n\n```python:validate\ncode()\n```\n\n"
+        "## B\n\nNo math here.\n\n"
+        "## C\n\n$$w = 3$$\n"
+    )
+    result = coverage_metric(parse_document(doc))
+    assert result.sections == [
+        SectionCoverage(section="", total_math=1, covered_math=0),
+        SectionCoverage(section="A", total_math=2, covered_math=1),
+        SectionCoverage(section="C", total_math=1, covered_math=0),
+    ]
+    assert result.uncovered_sections == ["", "A", "C"]
+
+
+def test_coverage_metric_scales_linearly():
+    """Long runs of uncovered math must not trigger a quadratic forward scan."""
+    import time
+    doc = "# Big\n\n" + "$$x$$\n\n" * 40_000 + "```python:validate\ncode()\n```\n"
+    blocks = parse_document(doc)
+    start = time.perf_counter()
+    result = coverage_metric(blocks)
+    assert time.perf_counter() - start < 2.0
+    assert result.total_math == 40_000
+    assert result.covered_math == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from meta_compiler.compiler.report import generate_report, Report
 from meta_compiler.compiler.parser import parse_document
 from meta_compiler.compiler.executor import execute_blocks
@@ -228,3 +230,20 @@ Property("P1", claim="t_eff >= 0", z3_expr=lambda: None, given=["A1"], descripti
     prop_entry = [s for s in report.symbol_table if s["type"] == "Property"][0]
     assert prop_entry["claim"] == "t_eff >= 0"
     assert prop_entry["given"] == ["A1"]
+
+
+def test_report_lists_axioms_each_property_needed():
+    pytest.importorskip("z3")
+    from meta_compiler.compiler import compile_document
+
+    artifacts = compile_document('''# Model
+```python:validate
+from z3 import Real
+H = Real('H')
+M = Real('M')
+Axiom("A1", statement="H > 0", z3_expr=lambda: H > 0, description="Pos")
+Axiom("A2", statement="M <= H", z3_expr=lambda: M <= H, description="Bound")
+Property("P1", claim="H >= M", z3_expr=lambda: H >= M, given=["A1", "A2"], description="Order")
+```
+''')
+    assert "  P1: verified (needs A2)" in artifacts["report_text"]
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from meta_compiler.compiler import check_document
+from meta_compiler.compiler.executor import execute_blocks
+from meta_compiler.compiler.parser import parse_document
+from meta_compiler.proxy import NotVectorizable, SymbolProxy, VectorIndex
+
+DOC = '''# Model
+
+```python:fixture
+W = ["alice", "bob", "carol", "dave"]
+P = ["p1", "p2"]
+cap = {"alice": 40, "bob": 150, "carol": 35, "dave": 200}
+hours = {"alice": 30, "bob": 20, "carol": 50, "dave": 10}
+x = {(w, p): 1 if w in ("bob", "dave") else 0 for w in W for p in P}
+```
+
+```python:validate
+Set("W", description="Workers")
+Set("P", description="Projects")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Parameter("hours", index="W", units="hours", description="Assigned hours")
+Variable("x", index=("W", "P"), domain="binary", description="Assignment")
+{constraints}
+```
+'''
+
+
+def _errors(constraints, *, vectorize):
+    source = DOC.replace("{constraints}", constraints)
+    result = execute_blocks(parse_document(source), vectorize=vectorize)
+    return result.passed, result.errors
+
+
+@pytest.mark.parametrize("constraints", [
+    'Constraint("cap_limit", over="W", expr=lambda i: cap[i] <= 100)',
+    'Constraint("fits", over="W", expr=lambda i: hours[i] <= cap[i])',
+    'Constraint("spare", over="W", expr=lambda i: cap[i] - hours[i] >= 10)',
+    'Constraint("one", over="W", expr=lambda i: x[i, "p1"] + x[i, "p2"] <= 1)',
+    'Constraint("ratio", over="W", expr=lambda i: hours[i] / cap[i] <= 0.5)',
+])
+def test_vectorized_errors_match_scalar(constraints):
+    assert _errors(constraints, vectorize=True) == _errors(constraints, vectorize=False)
+
+
+def test_vectorized_reports_violations_in_set_order():
+    passed, errors = _errors(
+        'Constraint("cap_limit", over="W", expr=lambda i: cap[i] <= 100)', vectorize=True
+    )
+    assert not passed
+    assert errors == [
+        'Constraint "cap_limit" violated for W="bob": result is False',
+        'Constraint "cap_limit" violated for W="dave": result is False',
+    ]
+
+
+@pytest.mark.parametrize("constraints", [
+    # branches on the member
+    'Constraint("skip", over="W", expr=lambda i: True if i == "bob" else cap[i] <= 100)',
+    # short-circuits on an array
+    'Constraint("either", over="W", expr=lambda i: cap[i] <= 100 or hours[i] <= 10)',
+    # returns a non-bool per member
+    'Constraint("slack", over="W", expr=lambda i: 100 - cap[i])',
+    # iterates over another set inside the lambda
+    'Constraint("sum", over="W", expr=lambda i: sum(x[i, p] for p in P) <= 1)',
+])
+def test_non_vectorizable_falls_back_to_scalar(constraints):
+    assert _errors(constraints, vectorize=True) == _errors(constraints, vectorize=False)
+
+
+def test_division_by_zero_matches_scalar():
+    constraints = 'Constraint("ratio", over="W", expr=lambda i: cap[i] / (hours[i] - 10) >= 0)'
+    vec = _errors(constraints, vectorize=True)
+    assert vec == _errors(constraints, vectorize=False)
+    assert any("ZeroDivisionError" in e or "division" in e for e in vec[1])
+
+
+def test_check_document_vectorize_flag():
+    source = DOC.replace(
+        "{constraints}", 'Constraint("cap_limit", over="W", expr=lambda i: cap[i] <= 300)'
+    )
+    assert check_document(source, vectorize=True).passed
+
+
+def test_proxy_gathers_dict_values():
+    vi = VectorIndex("W", ["a", "b"])
+    proxy = SymbolProxy("cap", {"a": 1, "b": 2}, set())
+    np.testing.assert_array_equal(proxy[vi], [1, 2])
+    assert proxy[vi] is proxy[vi]  # cached per index
+
+
+def test_proxy_gathers_tuple_keys():
+    vi = VectorIndex("W", ["a", "b"])
+    proxy = SymbolProxy("x", {("a", 1): 5, ("b", 1): 6, ("a", 2): 7}, set())
+    np.testing.assert_array_equal(proxy[vi, 1], [5, 6])
+
+
+def test_proxy_gathers_from_ndarray():
+    vi = VectorIndex("T", [0, 2])
+    proxy = SymbolProxy("demand", np.array([10.0, 20.0, 30.0]), set())
+    np.testing.assert_array_equal(proxy[vi], [10.0, 30.0])
+
+
+def test_proxy_logs_vectorized_access():
+    log = set()
+    SymbolProxy("cap", {"a": 1}, log)[VectorIndex("W", ["a"])]
+    assert log == {"cap"}
+
+
+def test_vector_index_refuses_scalar_use():
+    vi = VectorIndex("W", ["a"])
+    with pytest.raises(NotVectorizable):
+        vi == "a"
+    with pytest.raises(NotVectorizable):
+        bool(vi)
+    with pytest.raises(NotVectorizable):
+        f"{vi}"
+    with pytest.raises(NotVectorizable):
+        SymbolProxy("y", {}, set())[vi, VectorIndex("P", ["p"])]
+
+
+def test_vectorized_path_is_taken(monkeypatch):
+    from meta_compiler.compiler import executor
+
+    outcomes = []
+    original = executor._check_constraint_vectorized
+
+    def spy(*args):
+        outcomes.append(original(*args))
+        return outcomes[-1]
+
+    monkeypatch.setattr(executor, "_check_constraint_vectorized", spy)
+    _errors('Constraint("fits", over="W", expr=lambda i: hours[i] <= cap[i])', vectorize=True)
+    _errors('Constraint("skip", over="W", expr=lambda i: i != "bob")', vectorize=True)
+    assert outcomes == [True, False]
@@ -7,3 +7,11 @@ def fresh_registry():
     from meta_compiler.registry import registry
     registry.reset()
     yield registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk caches (proof cache, ...) out of the user's home directory."""
+    cache = tmp_path / "meta_compiler_cache"
+    monkeypatch.setenv("META_COMPILER_CACHE_DIR", str(cache))
+    return cache
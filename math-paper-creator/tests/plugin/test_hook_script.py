@@ -105,6 +105,7 @@ class TestHookValidation:
         output = json.loads(result.stdout)
         context = output.get("hookSpecificOutput", {}).get("additionalContext", "")
         assert "math block" in context.lower() or "unvalidated" in context.lower() or "coverage" in context.lower()
+        assert "Section B (0/1 covered)" in context
 
 
 class TestHookEdgeCases:
@@ -158,3 +159,44 @@ class TestHookEdgeCases:
         assert result.returncode == 0
         output = json.loads(result.stdout)  # Must be valid JSON
         assert output["decision"] == "block"
+
+
+class TestHookDaemon:
+    """Hook should delegate to a running daemon and fall back when it is down."""
+
+    INVALID_DOC = (
+        '```python:validate\n'
+        'Parameter("x", index=["MISSING"], domain="real",\n'
+        '          units="hours", description="Bad param")\n'
+        '```\n'
+    )
+
+    def test_falls_back_when_socket_missing(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("META_COMPILER_SOCKET", str(tmp_path / "absent.sock"))
+        doc = tmp_path / "bad.model.md"
+        doc.write_text(self.INVALID_DOC)
+        result = run_hook("Write", str(doc))
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["decision"] == "block"
+
+    def test_uses_running_daemon(self, tmp_path, monkeypatch):
+        import tempfile
+        import threading
+        from meta_compiler.daemon import ValidationServer
+
+        with tempfile.TemporaryDirectory(prefix="mc") as d:
+            server = ValidationServer(Path(d) / "d.sock")
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                monkeypatch.setenv("META_COMPILER_SOCKET", str(server.socket_path))
+                doc = tmp_path / "bad.model.md"
+                doc.write_text(self.INVALID_DOC)
+                result = run_hook("Write", str(doc))
+                assert result.returncode == 0
+                assert json.loads(result.stdout)["decision"] == "block"
+                assert str(doc.resolve()) in server._executors
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=5)
@@ -0,0 +1,91 @@
+"""Tests for log-once proxies and the no-access-log mode."""
+import numpy as np
+import pytest
+
+from meta_compiler.compiler import check_document
+from meta_compiler.compiler.incremental import IncrementalExecutor
+from meta_compiler.proxy import SymbolProxy, UnloggedSymbolProxy, VectorIndex
+
+
+def test_proxy_logs_first_read_then_stops():
+    log = set()
+    proxy = SymbolProxy("cap", {"a": 1, "b": 2}, log)
+    assert proxy["a"] == 1
+    assert log == {"cap"} and type(proxy) is UnloggedSymbolProxy
+    log.clear()
+    assert proxy["b"] == 2
+    assert log == set()
+
+
+@pytest.mark.parametrize("data", [{"a": 1, "b": 2}, np.array([1, 2])])
+def test_unlogged_proxy_reads_like_logged(data):
+    proxy = SymbolProxy("cap", data, set())
+    proxy.__class__ = UnloggedSymbolProxy
+    keys = ["a", "b"] if isinstance(data, dict) else [0, 1]
+    assert proxy[keys[1]] == 2
+    np.testing.assert_array_equal(proxy[VectorIndex("W", keys)], [1, 2])
+    with pytest.raises((KeyError, IndexError)):
+        proxy["z" if isinstance(data, dict) else 5]
+
+
+def test_unlogged_proxy_without_data_raises():
+    proxy = SymbolProxy("cap", None, set())
+    proxy.__class__ = UnloggedSymbolProxy
+    with pytest.raises(RuntimeError, match="No fixture data"):
+        proxy["a"]
+
+
+def test_set_access_logging_rearms_proxies(fresh_registry):
+    fresh_registry.data_store.update(W=["a"], cap={"a": 1})
+    fresh_registry.register_set("W", description="")
+    cap = fresh_registry.register_parameter("cap", index="W", description="")
+    cap["a"]
+    fresh_registry.access_log.clear()
+    fresh_registry.set_access_logging(True)
+    cap["a"]
+    assert "cap" in fresh_registry.access_log
+
+
+def test_logging_off_creates_unlogged_proxies(fresh_registry):
+    fresh_registry.set_access_logging(False)
+    fresh_registry.data_store.update(cap={"a": 1})
+    cap = fresh_registry.register_parameter("cap", description="")
+    assert cap["a"] == 1
+    assert fresh_registry.access_log == set()
+
+
+# ``cap`` is read only through a helper, so the access log is the only
+# evidence that it is used
+MODEL = '''
+```python:fixture
+W = ["alice", "bob"]
+cap = {"alice": 10, "bob": 20}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+```
+
+```python:validate
+def _cap(i):
+    return cap[i]
+Constraint("limit", over="W", expr=lambda i: _cap(i) <= 100)
+```
+'''
+
+
+def test_no_orphans_mode_skips_log_and_check():
+    result = check_document(MODEL.replace("_cap(i) <= 100", "True"), strict=True,
+                            orphans=False)
+    assert result.passed
+    assert result.registry.access_log == set()
+
+
+def test_incremental_restore_rearms_proxies():
+    ex = IncrementalExecutor()
+    first = check_document(MODEL, strict=True, executor=ex)
+    assert first.passed, first.errors
+    second = check_document(MODEL.replace("<= 100", "<= 50"), strict=True, executor=ex)
+    assert ex.reused_blocks == 1
+    assert second.passed, second.errors
@@ -0,0 +1,144 @@
+"""Tests for the per-run source analysis cache."""
+import meta_compiler.analysis as analysis_mod
+from meta_compiler.analysis import BlockSource, SourceAnalysis
+from meta_compiler.compiler.executor import execute_blocks
+from meta_compiler.compiler.parser import parse_document
+from meta_compiler.registry import registry
+
+
+def _block_lambda(block: str):
+    fn = eval("lambda i: cap[i] <= 100")
+    fn._source_text = block
+    return fn
+
+
+def test_source_falls_back_to_source_text():
+    fn = _block_lambda("Constraint('c', expr=lambda i: cap[i] <= 100)")
+    assert SourceAnalysis().source(fn) == fn._source_text
+
+
+def test_names_and_tree_shared_per_source_text(monkeypatch):
+    calls = []
+    original = analysis_mod._tokenize_names
+    monkeypatch.setattr(
+        analysis_mod, "_tokenize_names", lambda text: calls.append(text) or original(text)
+    )
+    block = "a = lambda i: cap[i] <= 100\nb = lambda i: hours[i] >= 0\n"
+    fa, fb = _block_lambda(block), _block_lambda(block)
+    cache = SourceAnalysis()
+    assert cache.names(fa) >= {"cap", "hours"}
+    assert cache.names(fb) is cache.names(fa)
+    assert cache.tree(fa) is cache.tree(fb)
+    assert calls == [block]
+
+
+def test_partial_source_is_best_effort():
+    cache = SourceAnalysis()
+    fn = _block_lambda("x = (cap[i] +\n")  # unterminated: TokenError after 'cap'
+    assert "cap" in cache.names(fn)
+    assert cache.tree(fn) is None
+
+
+def test_clear_drops_cached_entries():
+    cache = SourceAnalysis()
+    fn = _block_lambda("cap")
+    cache.names(fn)
+    cache.clear()
+    assert not cache._sources and not cache._names and not cache._trees
+
+
+def test_each_validate_block_tokenized_once(monkeypatch):
+    calls = []
+    original = analysis_mod._tokenize_names
+    monkeypatch.setattr(
+        analysis_mod, "_tokenize_names", lambda text: calls.append(text) or original(text)
+    )
+    source = '''# Model
+
+```python:fixture
+W = ["a", "b"]
+cap = {"a": 1, "b": 2}
+hours = {"a": 1, "b": 1}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Parameter("hours", index="W", units="hours", description="Hours")
+Constraint("c1", over="W", expr=lambda i: hours[i] <= cap[i])
+Constraint("c2", over="W", expr=lambda i: hours[i] + 0 <= cap[i])
+Expression("slack", index="W", units="hours", definition=lambda i: cap[i] - hours[i])
+```
+'''
+    assert execute_blocks(parse_document(source)).passed
+    assert len(calls) == len(set(calls))
+
+
+CHAIN_DOC = '''# Model
+
+```python:validate
+Parameter("H", units="hours", description="Hours")
+Expression("base", units="hours", definition=lambda: H * 2)
+Expression("total", units="hours", definition=lambda: base + 1)
+Constraint("cap", expr=lambda: total <= 100)
+```
+'''
+
+
+def test_block_lambdas_record_their_own_node():
+    execute_blocks(parse_document(CHAIN_DOC))
+    base_fn = registry.symbols["base"].expr
+    total_fn = registry.symbols["total"].expr
+    assert base_fn._source_text == "lambda: H * 2"
+    assert registry.analysis.names(base_fn) == {"H"}
+    assert registry.analysis.names(total_fn) == {"base"}
+
+
+def test_same_block_expressions_have_no_false_cycle():
+    # With whole-block source, "base" appeared to reference "total"
+    result = execute_blocks(parse_document(CHAIN_DOC))
+    assert not any("Cycle" in e for e in result.errors)
+
+
+def test_locate_distinguishes_lambdas_on_one_line():
+    block = BlockSource("pair = (lambda i: a[i], lambda j: (lambda k: b[k])(j))\n")
+    ns = {}
+    exec(block.compile(), ns)
+    first, second = ns["pair"]
+    assert block.segment(block.locate(first)) == "lambda i: a[i]"
+    assert block.segment(block.locate(second)).startswith("lambda j:")
+    assert block.locate(lambda: None) is None  # defined elsewhere
+
+
+def test_locate_decorated_def():
+    block = BlockSource("def deco(f):\n    return f\n\n@deco\ndef g(i):\n    return c[i]\n")
+    ns = {}
+    exec(block.compile(), ns)
+    assert block.locate(ns["g"]).name == "g"
+
+
+HELPER_DOC = '''# Model
+
+```python:fixture
+W = ["a", "b"]
+hrs = {"a": 30, "b": 20}
+cap = {"a": 40, "b": 40}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("hrs", index="W", units="hours", description="Hours worked")
+Parameter("cap", index="W", units="hours", description="Capacity")
+
+def used(i):
+    return hrs[i]
+
+Constraint("within", over="W", expr=lambda i: used(i) <= cap[i], description="Within cap")
+```
+'''
+
+
+def test_helper_function_names_count_as_references():
+    result = execute_blocks(parse_document(HELPER_DOC), strict=True)
+    assert result.passed, result.errors
+    assert registry.analysis.names(registry.symbols["within"].expr) >= {"used", "hrs", "cap"}
@@ -0,0 +1,77 @@
+import json
+from xml.etree import ElementTree
+
+from meta_compiler.batch import check_files, expand_paths, summarize, write_json, write_junit
+
+GOOD = '''# Model
+
+```python:fixture
+W = ["alice", "bob"]
+cap = {"alice": 40, "bob": 35}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("check", over="W", expr=lambda i: cap[i] <= 100)
+```
+'''
+
+# Registers "cap" without its set; passes only if it saw another file's registry
+BAD = '''# Model
+
+```python:validate
+Parameter("cap", index="W", units="hours", description="Capacity")
+```
+'''
+
+
+def _models(tmp_path):
+    (tmp_path / "sub").mkdir()
+    paths = [tmp_path / "a.model.md", tmp_path / "sub" / "b.model.md",
+             tmp_path / "sub" / "c.model.md"]
+    for path, doc in zip(paths, [GOOD, BAD, GOOD]):
+        path.write_text(doc)
+    (tmp_path / "notes.md").write_text("# Not a model\n")
+    return paths
+
+
+def test_expand_paths_directories_and_globs(tmp_path):
+    paths = _models(tmp_path)
+    assert expand_paths([tmp_path]) == paths
+    assert expand_paths([f"{tmp_path}/sub/*.model.md", paths[1]]) == paths[1:]
+    assert expand_paths([f"{tmp_path}/**/*.model.md"]) == paths
+    missing = tmp_path / "missing.model.md"
+    assert expand_paths([missing]) == [missing]
+
+
+def test_check_files_isolates_documents(tmp_path):
+    paths = _models(tmp_path)
+    serial = check_files(paths)
+    pooled = check_files(paths, workers=2)
+    assert [r.passed for r in serial] == [True, False, True]
+    assert [(r.path, r.passed, r.errors) for r in pooled] == \
+        [(r.path, r.passed, r.errors) for r in serial]
+    assert summarize(serial)["failed"] == 1
+
+
+def test_unreadable_file_is_reported(tmp_path):
+    [result] = check_files([tmp_path / "missing.model.md"])
+    assert not result.passed
+    assert result.errors[0].startswith("FileNotFoundError")
+
+
+def test_reports(tmp_path):
+    results = check_files(_models(tmp_path))
+    write_json(results, tmp_path / "r.json")
+    write_junit(results, tmp_path / "r.xml")
+
+    report = json.loads((tmp_path / "r.json").read_text())
+    assert report["summary"]["files"] == 3
+    assert [f["passed"] for f in report["files"]] == [True, False, True]
+
+    suite = ElementTree.parse(tmp_path / "r.xml").getroot().find("testsuite")
+    assert suite.get("tests") == "3" and suite.get("failures") == "1"
+    cases = suite.findall("testcase")
+    assert [c.find("failure") is not None for c in cases] == [False, True, False]
+    assert "W" in cases[1].find("failure").text
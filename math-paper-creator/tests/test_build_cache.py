@@ -0,0 +1,80 @@
+import os
+
+from meta_compiler.build_cache import BuildCache, write_if_changed
+from meta_compiler.compiler import compile_document
+
+DOC = '''# Model
+
+```python:fixture
+from meta_compiler.fixtures import load_csv
+W = load_csv({path!r}, "worker")
+cap = load_csv({path!r}, "capacity", index="W")
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("check", over="W", expr=lambda i: cap[i] <= 100, description="Cap")
+```
+'''
+
+
+def test_key_depends_on_source_and_options():
+    key = BuildCache.key("doc", target="compile", depth=None, strict=True)
+    assert key == BuildCache.key("doc", target="compile", depth=None, strict=True)
+    assert key != BuildCache.key("doc!", target="compile", depth=None, strict=True)
+    assert key != BuildCache.key("doc", target="compile", depth="executive", strict=True)
+    assert key != BuildCache.key("doc", target="paper", depth=None, strict=True)
+
+
+def test_key_depends_on_z3_availability(monkeypatch):
+    from meta_compiler import build_cache
+
+    keys = set()
+    for version in (None, "4.12.0", "4.13.0"):
+        monkeypatch.setattr(build_cache, "_z3_version", lambda: version)
+        keys.add(BuildCache.key("doc", target="compile"))
+    assert len(keys) == 3
+
+
+def test_round_trip_shares_objects(tmp_path):
+    cache = BuildCache(tmp_path)
+    cache.put("k1", {"paper.md": "same", "report.txt": "one"})
+    cache.put("k2", {"paper.md": "same", "report.txt": "two"})
+    assert cache.get("k1") == {"paper.md": "same", "report.txt": "one"}
+    assert cache.get("missing") is None
+    assert len(list((tmp_path / "objects").iterdir())) == 3
+
+
+def test_edited_data_file_invalidates_entry(tmp_path):
+    data = tmp_path / "workers.csv"
+    data.write_text("worker,capacity\nalice,40\n")
+    artifacts = compile_document(DOC.format(path=str(data)))
+    assert artifacts["data_files"] == [data.resolve()]
+
+    cache = BuildCache(tmp_path / "cache")
+    cache.put("k", {"paper.md": artifacts["paper"]}, artifacts["data_files"])
+    assert cache.get("k") is not None
+    data.write_text("worker,capacity\nalice,400\n")
+    assert cache.get("k") is None
+
+
+def test_prune_keeps_newest_manifests(tmp_path, monkeypatch):
+    from meta_compiler import build_cache
+
+    monkeypatch.setattr(build_cache, "_MAX_MANIFESTS", 2)
+    cache = BuildCache(tmp_path)
+    for i in range(4):
+        cache.put(f"k{i}", {"paper.md": f"paper {i}"})
+        os.utime(tmp_path / f"k{i}.json", ns=(i * 10**9, i * 10**9))
+    cache.put("k4", {"paper.md": "paper 4"})
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["k3", "k4"]
+    assert cache.get("k3") == {"paper.md": "paper 3"}
+    assert len(list((tmp_path / "objects").iterdir())) == 2
+
+
+def test_write_if_changed_keeps_identical_files(tmp_path):
+    path = tmp_path / "paper.md"
+    assert write_if_changed(path, "text")
+    assert not write_if_changed(path, "text")
+    assert write_if_changed(path, "new text")
@@ -0,0 +1,161 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from meta_compiler.daemon import (
+    ValidationServer,
+    check_file,
+    check_within,
+    default_socket_path,
+    request_check,
+)
+
+DOC = '''# Model
+
+$$cap_i \\le 100$$
+
+```python:fixture
+W = ["alice", "bob"]
+cap = {"alice": 40, "bob": 35}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("check", over="W", expr=lambda i: cap[i] <= 100)
+```
+'''
+
+
+@pytest.fixture
+def short_tmp():
+    # Unix socket paths are limited to ~100 bytes; pytest's tmp_path can exceed it
+    with tempfile.TemporaryDirectory(prefix="mc") as d:
+        yield Path(d)
+
+
+@pytest.fixture
+def server(short_tmp):
+    srv = ValidationServer(short_tmp / "d.sock")
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    thread.join(timeout=5)
+
+
+_SRC = str(Path(__file__).parent.parent / "src")
+
+
+def test_cli_daemon_serves_requests(short_tmp):
+    # A fresh interpreter, so the daemon's own imports are exercised
+    sock = short_tmp / "cli.sock"
+    doc = short_tmp / "m.model.md"
+    doc.write_text(DOC)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "meta_compiler.cli", "daemon", "--socket", str(sock)],
+        env={**os.environ, "PYTHONPATH": _SRC},
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not sock.exists() and proc.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert proc.poll() is None, proc.stderr.read()
+        assert request_check(doc, socket_path=sock) == check_file(doc)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_default_socket_path_env_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("META_COMPILER_SOCKET", str(tmp_path / "x.sock"))
+    assert default_socket_path() == tmp_path / "x.sock"
+
+
+def test_check_file_summary(tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    summary = check_file(doc)
+    assert summary["passed"]
+    assert summary["coverage"] == {
+        "total_math": 1, "covered_math": 1, "uncovered_sections": [],
+        "sections": [{"section": "Model", "total_math": 1, "covered_math": 1}],
+    }
+
+
+def test_request_check_returns_none_without_daemon(short_tmp):
+    assert request_check(short_tmp / "doc.model.md", socket_path=short_tmp / "none.sock") is None
+
+
+def test_check_within_prefers_daemon(server, tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    assert check_within(doc, socket_path=server.socket_path) == check_file(doc)
+
+
+def test_check_within_falls_back_in_process(short_tmp):
+    doc = short_tmp / "m.model.md"
+    doc.write_text(DOC)
+    assert check_within(doc, socket_path=short_tmp / "none.sock") == check_file(doc)
+
+
+def test_check_within_skips_fallback_without_budget(short_tmp, monkeypatch):
+    import meta_compiler.daemon as daemon
+
+    def fail(*args, **kwargs):
+        raise AssertionError("in-process check started without enough budget")
+
+    monkeypatch.setattr(daemon, "check_file", fail)
+    doc = short_tmp / "m.model.md"
+    doc.write_text(DOC)
+    assert check_within(doc, budget_s=5.0, socket_path=short_tmp / "none.sock") is None
+
+
+def test_daemon_matches_in_process(server, tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC.replace('"bob": 35', '"bob": 150'))
+    response = request_check(doc, socket_path=server.socket_path)
+    assert response == check_file(doc)
+    assert not response["passed"]
+
+
+def test_daemon_reuses_per_file_state(server, tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    request_check(doc, socket_path=server.socket_path)
+    response = request_check(doc, socket_path=server.socket_path)
+    assert response["passed"]
+    executor = server._executors[str(doc.resolve())]
+    assert executor.reused_blocks == 1
+
+
+def test_daemon_reports_errors_without_crashing(server, tmp_path):
+    missing = tmp_path / "missing.model.md"
+    assert request_check(missing, socket_path=server.socket_path) is None
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    assert request_check(doc, socket_path=server.socket_path)["passed"]
+
+
+def test_stale_socket_file_is_replaced(short_tmp):
+    path = short_tmp / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()  # file remains, nobody listening
+    srv = ValidationServer(path)
+    srv.server_close()
+    assert not path.exists()
+
+
+def test_refuses_to_replace_live_socket(server):
+    with pytest.raises(RuntimeError, match="already listening"):
+        ValidationServer(server.socket_path)
@@ -0,0 +1,247 @@
+"""Tests for columnar fixture data."""
+import os
+import numpy as np
+import pytest
+
+from meta_compiler.compiler.executor import execute_blocks
+from meta_compiler.compiler.parser import parse_document
+from meta_compiler.fixtures import Column, bind_columns
+from meta_compiler.proxy import NotVectorizable, SymbolProxy, VectorIndex
+
+
+def _bound(**data):
+    bind_columns(data)
+    return data
+
+
+def test_column_behaves_like_dict():
+    store = _bound(W=["a", "b", "c"], cap=Column("W", [10, 20, 30]))
+    cap = store["cap"]
+    assert cap["b"] == 20 and type(cap["b"]) is int
+    assert dict(cap) == {"a": 10, "b": 20, "c": 30}
+    assert "c" in cap and "z" not in cap
+    with pytest.raises(KeyError):
+        cap["z"]
+
+
+def test_two_dimensional_column():
+    store = _bound(W=["a", "b"], P=["p", "q", "r"], x=Column(("W", "P"), np.arange(6).reshape(2, 3)))
+    x = store["x"]
+    assert x["b", "q"] == 4
+    assert len(x) == 6
+    assert list(x)[:2] == [("a", "p"), ("a", "q")]
+
+
+def test_member_index_shared_between_columns():
+    store = _bound(W=["a", "b"], c1=Column("W", [1, 2]), c2=Column("W", [3, 4]))
+    assert store["c1"].axes[0] is store["c2"].axes[0]
+
+
+@pytest.mark.parametrize("store, message", [
+    (dict(cap=Column("W", [1, 2])), 'set "W" needs a member list'),
+    (dict(W=["a"], cap=Column("W", [1, 2])), "axis 0 has 2 values but set \"W\" has 1 members"),
+])
+def test_bind_errors(store, message):
+    with pytest.raises(ValueError, match=message):
+        bind_columns(store)
+
+
+def test_duplicate_members_rejected_on_lookup():
+    store = _bound(W=["a", "a"], cap=Column("W", [1, 2]))
+    with pytest.raises(ValueError, match="duplicate members"):
+        store["cap"]["a"]
+
+
+def test_whole_set_access_skips_position_map():
+    store = _bound(W=["a", "b"], cap=Column("W", [1, 2]))
+    SymbolProxy("cap", store["cap"], set())[VectorIndex("W", store["W"])]
+    assert store["cap"].axes[0]._positions is None
+
+
+def test_dimension_mismatch_rejected():
+    with pytest.raises(ValueError, match="2-D array"):
+        Column(("W", "P"), [1, 2])
+
+
+def test_proxy_full_set_returns_view():
+    store = _bound(W=["a", "b", "c"], cap=Column("W", np.array([1.0, 2.0, 3.0])))
+    proxy = SymbolProxy("cap", store["cap"], set())
+    result = proxy[VectorIndex("W", store["W"])]
+    assert np.shares_memory(result, store["cap"].values)
+
+
+def test_proxy_member_list_and_subset():
+    store = _bound(W=["a", "b", "c"], cap=Column("W", [1, 2, 3]))
+    proxy = SymbolProxy("cap", store["cap"], set())
+    np.testing.assert_array_equal(proxy[["c", "a"]], [3, 1])
+    np.testing.assert_array_equal(proxy[VectorIndex("W", ["b", "c"])], [2, 3])
+
+
+def test_proxy_vectorized_axis_of_2d_column():
+    store = _bound(W=["a", "b"], P=["p", "q"], x=Column(("W", "P"), [[1, 2], [3, 4]]))
+    proxy = SymbolProxy("x", store["x"], set())
+    np.testing.assert_array_equal(proxy[VectorIndex("W", store["W"]), "q"], [2, 4])
+    with pytest.raises(NotVectorizable):
+        proxy[VectorIndex("W", store["W"]), VectorIndex("P", store["P"])]
+
+
+DOC = '''# Model
+
+```python:fixture
+import numpy as np
+from meta_compiler.fixtures import Column
+W = [f"w{i}" for i in range(1000)]
+cap = Column("W", np.arange(1000))
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("limit", over="W", expr=lambda i: cap[i] < 998)
+```
+'''
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_column_constraints_end_to_end(vectorize):
+    result = execute_blocks(parse_document(DOC), vectorize=vectorize)
+    assert result.errors == [
+        'Constraint "limit" violated for W="w998": result is False',
+        'Constraint "limit" violated for W="w999": result is False',
+    ]
+
+
+def test_column_index_must_match_declaration():
+    source = DOC.replace('Parameter("cap", index="W"', 'Set("P", description="P")\n'
+                         'Parameter("cap", index="P"')
+    result = execute_blocks(parse_document(source))
+    assert any("fixture Column is indexed by ('W',)" in e for e in result.errors)
+
+
+def test_bind_error_reported_as_fixture_error():
+    source = DOC.replace("np.arange(1000)", "np.arange(10)")
+    result = execute_blocks(parse_document(source))
+    assert not result.passed
+    assert result.errors[0].startswith('Fixture error: Column "cap": axis 0 has 10 values')
+
+
+# -- file-backed data --------------------------------------------------------
+
+from meta_compiler.fixtures import FileColumn, load_csv, load_npy, load_npz  # noqa: E402
+
+
+@pytest.fixture
+def workers_csv(tmp_path):
+    path = tmp_path / "workers.csv"
+    path.write_text("worker,capacity\nalice,40\nbob,150\ncarol,35.5\n")
+    return path
+
+
+def test_csv_members_and_column(workers_csv):
+    store = _bound(W=load_csv(workers_csv, "worker"),
+                   cap=load_csv(workers_csv, "capacity", index="W"))
+    assert store["W"] == ["alice", "bob", "carol"]
+    assert not store["cap"].loaded
+    assert store["cap"]["bob"] == 150.0
+    assert store["cap"].loaded
+
+
+def test_csv_cached_as_npy_keyed_by_mtime(workers_csv):
+    store = _bound(W=load_csv(workers_csv, "worker"),
+                   cap=load_csv(workers_csv, "capacity", index="W"))
+    store["cap"]["alice"]
+    caches = sorted(p.name for p in workers_csv.parent.glob(".workers.csv.*.npy"))
+    assert len(caches) == 2
+    assert isinstance(store["cap"].values, np.memmap)
+
+    workers_csv.write_text("worker,capacity\nalice,1\nbob,2\ncarol,3\n")
+    os.utime(workers_csv, ns=(0, 10**9))
+    store = _bound(W=load_csv(workers_csv, "worker"),
+                   cap=load_csv(workers_csv, "capacity", index="W"))
+    assert store["cap"]["carol"] == 3
+    assert len(list(workers_csv.parent.glob(".workers.csv.capacity.*.npy"))) == 1
+
+
+def test_npy_column_is_memory_mapped(tmp_path):
+    np.save(tmp_path / "x.npy", np.arange(6.0).reshape(2, 3))
+    store = _bound(W=["a", "b"], P=["p", "q", "r"],
+                   x=load_npy(tmp_path / "x.npy", index=("W", "P")))
+    assert isinstance(store["x"], FileColumn)
+    assert store["x"]["b", "r"] == 5.0
+    assert isinstance(store["x"].values, np.memmap)
+
+
+def test_npz_members_and_column(tmp_path):
+    np.savez(tmp_path / "data.npz", members=np.array(["a", "b"]), cap=np.array([1, 2]))
+    store = _bound(W=load_npz(tmp_path / "data.npz", "members"),
+                   cap=load_npz(tmp_path / "data.npz", "cap", index="W"))
+    assert store["W"] == ["a", "b"]
+    np.testing.assert_array_equal(
+        SymbolProxy("cap", store["cap"], set())[VectorIndex("W", store["W"])], [1, 2])
+
+
+def test_file_column_shape_checked_on_first_use(tmp_path):
+    np.save(tmp_path / "cap.npy", np.arange(3))
+    store = _bound(W=["a", "b"], cap=load_npy(tmp_path / "cap.npy", index="W"))
+    with pytest.raises(ValueError, match='axis 0 of .*cap.npy has 3 values but set "W" has 2'):
+        store["cap"]["a"]
+
+
+@pytest.mark.parametrize("loader, message", [
+    (lambda d: load_csv(d / "workers.csv", "age"), "has no column 'age'"),
+    (lambda d: load_npy(d / "missing.npy"), "does not exist"),
+])
+def test_file_errors(workers_csv, loader, message):
+    with pytest.raises(ValueError, match=message):
+        bind_columns({"W": loader(workers_csv.parent)})
+
+
+def test_short_csv_row_names_file_and_line(tmp_path):
+    path = tmp_path / "workers.csv"
+    path.write_text("worker,capacity\nalice,40\nbob\n")
+    store = _bound(W=["alice", "bob"], cap=load_csv(path, "capacity", index="W"))
+    with pytest.raises(ValueError, match="workers.csv line 3: row has no 'capacity' cell"):
+        store["cap"]["alice"]
+
+
+def test_relative_paths_resolve_against_document_dir(workers_csv, tmp_path, monkeypatch):
+    from meta_compiler.daemon import check_file
+
+    doc = tmp_path / "model.md"
+    doc.write_text('''# Model
+
+```python:fixture
+from meta_compiler.fixtures import load_csv
+W = load_csv("workers.csv", "worker")
+cap = load_csv("workers.csv", "capacity", index="W")
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("limit", over="W", expr=lambda i: cap[i] <= 100)
+```
+''')
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    assert check_file(doc)["errors"] == ['Constraint "limit" violated for W="bob": result is False']
+
+
+def test_file_backed_fixture_end_to_end(workers_csv):
+    source = f'''# Model
+
+```python:fixture
+from meta_compiler.fixtures import load_csv
+W = load_csv({str(workers_csv)!r}, "worker")
+cap = load_csv({str(workers_csv)!r}, "capacity", index="W")
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("limit", over="W", expr=lambda i: cap[i] <= 100)
+```
+'''
+    result = execute_blocks(parse_document(source), vectorize=True)
+    assert result.errors == ['Constraint "limit" violated for W="bob": result is False']
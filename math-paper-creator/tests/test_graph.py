@@ -0,0 +1,85 @@
+"""Tests for the registry's dependency graph."""
+import random
+
+from meta_compiler import Set
+from meta_compiler.graph import DependencyGraph
+from meta_compiler.symbols import ExpressionSymbol
+
+
+def _graph(edges: dict[str, list[str]]) -> DependencyGraph:
+    order = list(edges)
+    return DependencyGraph(order, {n: tuple(sorted(d)) for n, d in edges.items()})
+
+
+def _reachable(edges, start):
+    seen, todo = set(), [start]
+    while todo:
+        for d in edges[todo.pop()]:
+            if d not in seen:
+                seen.add(d)
+                todo.append(d)
+    return seen
+
+
+def test_scc_matches_reachability_on_random_graphs():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(1, 12)
+        names = [f"n{i}" for i in range(n)]
+        edges = {a: [b for b in names if b != a and rng.random() < 0.2] for a in names}
+        components = _graph(edges).strongly_connected_components()
+        assert sorted(x for c in components for x in c) == sorted(names)
+        reach = {a: _reachable(edges, a) for a in names}
+        for c in components:
+            for a in c:
+                for b in names:
+                    same = b in c
+                    assert same == (b == a or (b in reach[a] and a in reach[b]))
+
+
+def test_cycles_are_closed_shortest_paths_in_registration_order():
+    graph = _graph({"a": ["b"], "b": ["c"], "c": ["a", "b"], "d": ["e"], "e": ["d"], "f": []})
+    assert graph.cycles() == [["a", "b", "c", "a"], ["d", "e", "d"]]
+
+
+def test_cycles_restricted_to_subgraph():
+    graph = _graph({"a": ["b"], "b": ["a"], "c": []})
+    assert graph.cycles(within={"a", "c"}) == []
+
+
+def test_deep_chain_does_not_recurse():
+    n = 20000
+    edges = {f"e{i}": [f"e{i - 1}"] if i else [] for i in range(n)}
+    edges["e0"] = [f"e{n - 1}"]
+    components = _graph(edges).strongly_connected_components()
+    assert len(components) == 1 and len(components[0]) == n
+
+
+def test_dependents_and_downstream():
+    graph = _graph({"W": [], "cap": ["W"], "slack": ["cap"], "c": ["slack"], "other": ["W"]})
+    assert graph.dependents("cap") == {"slack"}
+    assert graph.downstream(["cap"]) == {"cap", "slack", "c"}
+
+
+def test_registry_graph_cached_until_symbols_change(fresh_registry):
+    Set("W", description="Workers")
+    graph = fresh_registry.dependency_graph
+    assert fresh_registry.dependency_graph is graph
+    Set("P", description="Projects")
+    assert fresh_registry.dependency_graph is not graph
+
+
+def test_long_expression_chain_cycle_reported(fresh_registry):
+    n = 3000
+    for i in range(n):
+        fn = lambda: 0
+        fn._source_text = f"lambda: e{(i - 1) % n}"
+        sym = ExpressionSymbol(name=f"e{i}", index=None, units="dimensionless",
+                               description="", expr=fn)
+        fresh_registry.symbols[sym.name] = sym
+        fresh_registry._registration_order.append(sym.name)
+    result = fresh_registry.run_tests()
+    cycle_errors = [e for e in result.errors if e.startswith("Cycle detected")]
+    assert len(cycle_errors) == 1
+    assert cycle_errors[0].startswith("Cycle detected: e0 -> e2999 -> e2998")
+    assert cycle_errors[0].endswith("e1 -> e0")
@@ -0,0 +1,122 @@
+"""Tests for the LP/MILP solving stage."""
+import sys
+
+import numpy as np
+import pytest
+
+from meta_compiler.compiler import check_document
+from meta_compiler.optimization import LinExpr, NotLinear, lower_model, optimize_model
+
+pytest.importorskip("scipy")
+
+MODEL = '''# Model
+
+```python:fixture
+W = ["alice", "bob"]
+P = ["p1", "p2"]
+cap = {"alice": 1, "bob": 1}
+U = {("alice", "p1"): 3, ("alice", "p2"): 1, ("bob", "p1"): 2, ("bob", "p2"): 4}
+x = {(w, p): 0.5 for w in W for p in P}
+```
+
+```python:validate
+Set("W", description="Workers")
+Set("P", description="Projects")
+Parameter("cap", index="W", units="dimensionless", description="Capacity")
+Parameter("U", index=("W", "P"), units="dimensionless", description="Utility")
+Variable("x", index=("W", "P"), domain="{domain}", bounds=(0, 1), description="Allocation")
+Constraint("capacity", over="W", expr=lambda i: sum(x[i, p] for p in S("P")) <= cap[i])
+Constraint("coverage", over="P", expr=lambda p: sum(x[w, p] for w in S("W")) <= 1)
+{extra}
+Objective("utility", expr=lambda: sum(U[w, p] * x[w, p] for w in S("W") for p in S("P")),
+          sense="maximize")
+```
+'''
+
+
+def _model(domain="continuous", extra=""):
+    return MODEL.replace("{domain}", domain).replace("{extra}", extra)
+
+
+def test_optimum_and_gap():
+    result = check_document(_model(), optimize=True)
+    assert result.passed, result.errors
+    [opt] = result.optimization
+    assert opt.status == "optimal"
+    assert opt.optimum == pytest.approx(7.0)
+    assert opt.fixture_value == pytest.approx(5.0)
+    assert opt.gap == pytest.approx(2 / 7)
+    assert (opt.variables, opt.rows) == (4, 4)
+
+
+def test_gap_against_zero_optimum():
+    result = check_document(_model().replace('sense="maximize"', 'sense="minimize"'),
+                            optimize=True)
+    [opt] = result.optimization
+    assert opt.optimum == pytest.approx(0.0)
+    assert opt.fixture_value == pytest.approx(5.0)
+    assert opt.gap == pytest.approx(1.0)
+
+
+def test_vectorized_rows_match_per_member_rows(fresh_registry):
+    check_document(_model())
+    vectorized = lower_model(fresh_registry).A.toarray()
+    # branching on the member forces one evaluation per member
+    check_document(_model().replace(
+        "sum(x[i, p] for p in S(\"P\")) <= cap[i])",
+        "sum(x[i, p] for p in S(\"P\")) <= cap[i] if i else True)",
+    ))
+    np.testing.assert_array_equal(lower_model(fresh_registry).A.toarray(), vectorized)
+
+
+def test_binary_domain_is_integral():
+    extra = 'Constraint("half", expr=lambda: x["alice", "p1"] * 2 <= 1)'
+    source = _model("binary", extra).replace("0.5 for w", "0 for w")
+    result = check_document(source, optimize=True)
+    assert result.passed, result.errors
+    # x[alice, p1] <= 0.5 forces it to 0 when binary: bob -> p2 is best
+    assert result.optimization[0].optimum == pytest.approx(4.0)
+    relaxed = check_document(source.replace('"binary"', '"continuous"'), optimize=True)
+    assert relaxed.optimization[0].optimum == pytest.approx(5.5)
+
+
+def test_nonlinear_constraint_left_out():
+    extra = 'Constraint("square", over="W", expr=lambda i: x[i, "p1"] * x[i, "p2"] <= 1)'
+    result = check_document(_model(extra=extra), optimize=True)
+    assert result.optimization[0].omitted == {
+        "square": "not linear in the variables (product of decision variables)"
+    }
+    assert any('constraint "square" left out' in w for w in result.warnings)
+
+
+def test_namespace_restored_after_lowering(fresh_registry):
+    check_document(_model(), optimize=True)
+    fn = fresh_registry.symbols["capacity"].expr
+    assert fn("alice") is True  # evaluated on fixture values again, not LinExpr
+
+
+def test_skipped_without_scipy(monkeypatch, fresh_registry):
+    check_document(_model())
+    monkeypatch.setitem(sys.modules, "scipy.optimize", None)
+    [opt] = optimize_model(fresh_registry)
+    assert opt.status == "skipped"
+
+
+def test_linexpr_broadcasts_and_rejects_products():
+    x = LinExpr.column(np.arange(3))
+    rows = (2 * x + np.array([1.0, 2.0, 3.0]) <= 10).expr
+    assert rows.rows == 3
+    np.testing.assert_array_equal(rows.const, [-9.0, -8.0, -7.0])
+    with pytest.raises(NotLinear):
+        x * x
+    with pytest.raises(NotLinear):
+        bool(0 <= x)
+
+
+def test_cli_prints_optimum(tmp_path, capsys):
+    from meta_compiler.cli import main
+
+    path = tmp_path / "m.model.md"
+    path.write_text(_model())
+    assert main(["check", str(path), "--optimize"]) == 0
+    assert 'OPTIMUM: maximize "utility" = 7 — fixture 5, gap 28.57%' in capsys.readouterr().out
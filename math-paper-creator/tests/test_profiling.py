@@ -0,0 +1,100 @@
+"""Tests for the opt-in pipeline profiler and the CLI's --profile/--cprofile."""
+import json
+import pstats
+import threading
+
+from meta_compiler import profiling
+from meta_compiler.cli import main
+
+DOC = '''# Model
+
+```python:fixture
+W = ["a", "b"]
+cap = {"a": 10, "b": 12}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Cap")
+Constraint("pos", over="W", expr=lambda i: cap[i] >= 0, description="Positive")
+```
+'''
+
+
+def _find(span: dict, kind: str) -> list[dict]:
+    found = [span] if span["kind"] == kind else []
+    for child in span.get("children", []):
+        found.extend(_find(child, kind))
+    return found
+
+
+def test_span_is_noop_without_profiler():
+    assert not profiling.active()
+    with profiling.span("phase", "parse") as node:
+        assert node is None
+
+
+def test_spans_nest_and_time():
+    with profiling.profile("test") as prof:
+        with profiling.span("phase", "outer"):
+            with profiling.span("block", "inner", line=3):
+                pass
+        profiling.record("proof", "P1", 0.5, status="verified")
+    assert not profiling.active()
+    trace = prof.to_dict()
+    assert (trace["kind"], trace["name"], trace["version"]) == ("run", "test", 1)
+    outer, proof = trace["children"]
+    assert outer["name"] == "outer" and outer["cpu_s"] >= 0
+    (inner,) = outer["children"]
+    assert (inner["kind"], inner["name"], inner["line"]) == ("block", "inner", 3)
+    assert proof == {"kind": "proof", "name": "P1", "wall_s": 0.5, "cpu_s": None,
+                     "peak_rss_kb": None, "status": "verified"}
+
+
+def test_threads_profile_separately():
+    barrier = threading.Barrier(2)
+    traces = {}
+
+    def run(name):
+        with profiling.profile(name) as prof:
+            for k in range(3):
+                with profiling.span("phase", f"{name}-{k}"):
+                    barrier.wait(timeout=5)
+        traces[name] = prof.to_dict()
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not profiling.active()
+    for name in ("a", "b"):
+        assert [c["name"] for c in traces[name]["children"]] == [f"{name}-{k}" for k in range(3)]
+
+
+def test_cli_profile_trace(tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    trace_path = tmp_path / "trace.json"
+    assert main(["check", str(doc), "--profile", str(trace_path)]) == 0
+
+    trace = json.loads(trace_path.read_text())
+    assert trace["name"] == "check"
+    phases = [s["name"] for s in _find(trace, "phase")]
+    assert phases == ["parse", "fixtures", "validate", "evaluate", "checks"]
+    assert [b["name"] for b in _find(trace, "block")] == [
+        "fixture (line 3)", "validate (line 8)",
+    ]
+    (constraint,) = _find(trace, "constraint")
+    assert (constraint["name"], constraint["errors"]) == ("pos", 0)
+    for span in _find(trace, "phase") + _find(trace, "block"):
+        assert span["wall_s"] >= 0 and span["cpu_s"] >= 0
+
+
+def test_cli_cprofile_dump(tmp_path):
+    doc = tmp_path / "m.model.md"
+    doc.write_text(DOC)
+    out = tmp_path / "out.pstats"
+    assert main(["check", str(doc), "--cprofile", str(out)]) == 0
+    stats = pstats.Stats(str(out))
+    assert any(func[2] == "execute_blocks" for func in stats.stats)
@@ -0,0 +1,97 @@
+"""Tests for the on-disk Z3 proof cache."""
+import pytest
+
+z3 = pytest.importorskip("z3")
+
+from meta_compiler.compiler import check_document  # noqa: E402
+from meta_compiler.verification import (  # noqa: E402
+    ProofCache, check_axiom_consistency, check_property, cache_dir,
+)
+
+
+def test_cache_dir_follows_environment(isolated_cache_dir):
+    assert cache_dir() == isolated_cache_dir
+
+
+def test_property_result_is_reused(tmp_path):
+    cache = ProofCache(tmp_path)
+    H, M = z3.Reals("H M")
+    axioms = [lambda: H > 0, lambda: M <= H]
+    first = check_property(axioms, lambda: H - M >= 0, cache=cache)
+    second = check_property(axioms, lambda: H - M >= 0, cache=cache)
+    assert (first.status, first.cached) == ("verified", False)
+    assert (second.status, second.cached) == ("verified", True)
+    assert second.duration_s == first.duration_s
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_counterexample_is_cached(tmp_path):
+    cache = ProofCache(tmp_path)
+    H = z3.Real("H")
+    first = check_property([lambda: H > 0], lambda: H > 1, cache=cache)
+    second = check_property([lambda: H > 0], lambda: H > 1, cache=cache)
+    assert second.cached and second.status == "failed"
+    assert second.counterexample == first.counterexample
+
+
+def test_changed_axiom_misses(tmp_path):
+    cache = ProofCache(tmp_path)
+    H = z3.Real("H")
+    check_axiom_consistency([lambda: H > 0], cache=cache)
+    assert not check_axiom_consistency([lambda: H > 1], cache=cache).cached
+    assert check_axiom_consistency([lambda: H > 0], cache=cache).cached
+
+
+def test_key_distinguishes_sorts():
+    xi, yi = z3.Ints("x y")
+    xr, yr = z3.Reals("x y")
+    assert ProofCache.key("consistency", [xi == yi]) != ProofCache.key("consistency", [xr == yr])
+
+
+def test_corrupt_entry_is_ignored(tmp_path):
+    cache = ProofCache(tmp_path)
+    H = z3.Real("H")
+    key = cache.key("consistency", [H > 0])
+    (tmp_path / f"{key}.json").write_text("{not json")
+    result = check_axiom_consistency([lambda: H > 0], cache=cache)
+    assert (result.status, result.cached) == ("consistent", False)
+
+
+DOC = '''# Model
+
+```python:validate
+from z3 import Real
+H = Real('H')
+Axiom("A1", statement="H positive", z3_expr=lambda: H > 0, description="Pos")
+Property("P1", claim="H >= 0", z3_expr=lambda: H >= 0, given=["A1"], description="Non-neg")
+```
+'''
+
+
+def test_executor_uses_cache(isolated_cache_dir, monkeypatch):
+    from meta_compiler import verification
+
+    assert check_document(DOC).passed
+    assert len(list((isolated_cache_dir / "proofs").glob("*.json"))) == 2
+
+    def no_solver(*args):
+        raise AssertionError("solver ran despite a cache hit")
+
+    monkeypatch.setattr(verification._Prover, "_check", no_solver)
+    assert check_document(DOC).passed
+
+
+def test_executor_without_cache(isolated_cache_dir):
+    assert check_document(DOC, proof_cache=False).passed
+    assert not (isolated_cache_dir / "proofs").exists()
+
+
+def test_cached_core_follows_axiom_names(tmp_path):
+    cache = ProofCache(tmp_path)
+    H, M = z3.Reals("H M")
+    first = check_property({"A1": lambda: H > 0, "A2": lambda: M <= H},
+                           lambda: H - M >= 0, cache=cache)
+    renamed = check_property({"B1": lambda: H > 0, "B2": lambda: M <= H},
+                             lambda: H - M >= 0, cache=cache)
+    assert first.core == ["A2"]
+    assert (renamed.cached, renamed.core) == (True, ["B2"])
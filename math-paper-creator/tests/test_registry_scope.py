@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from meta_compiler import Parameter, Set
+from meta_compiler.compiler import check_document, execute_blocks, parse_document
+from meta_compiler.compiler.incremental import IncrementalExecutor
+from meta_compiler.compiler.parser import ResultsBlock
+from meta_compiler.registry import Registry, current_registry, registry, use_registry
+
+
+def _doc(n: int) -> str:
+    members = [f"m{i}" for i in range(n)]
+    return f'''# Model
+
+```python:fixture
+W = {members!r}
+cap = {{w: 10 for w in W}}
+```
+
+```python:results
+print(len(W))
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap", index="W", units="hours", description="Capacity")
+Constraint("check", over="W", expr=lambda i: cap[i] <= 100)
+```
+'''
+
+
+def test_use_registry_binds_a_fresh_registry(fresh_registry):
+    with use_registry() as reg:
+        assert current_registry() is reg
+        Set("W", description="Workers")
+        with use_registry() as inner:
+            Set("W", description="Workers")  # no conflict with the outer registry
+            assert set(inner.symbols) == {"W"}
+        assert current_registry() is reg
+    assert set(reg.symbols) == {"W"}
+    assert current_registry() is registry
+    assert not registry.symbols
+
+
+def test_use_registry_accepts_an_instance(fresh_registry):
+    reg = Registry()
+    with use_registry(reg) as bound:
+        Set("W", description="Workers")
+    assert bound is reg and "W" in reg.symbols
+
+
+def test_check_document_under_use_registry_leaves_global_untouched(fresh_registry):
+    with use_registry() as reg:
+        result = check_document(_doc(3))
+    assert result.passed
+    assert result.registry is reg
+    assert not registry.symbols
+
+
+def test_documents_validate_concurrently_in_threads(fresh_registry):
+    def check(n):
+        with use_registry():
+            blocks = parse_document(_doc(n))
+            result = execute_blocks(blocks)
+            output = next(b.output for b in blocks if isinstance(b, ResultsBlock))
+            return result.passed, len(result.registry.data_store["W"]), output
+
+    sizes = [1 + i % 7 for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = list(pool.map(check, sizes))
+    assert outcomes == [(True, n, f"{n}\n") for n in sizes]
+
+
+def test_documents_with_proofs_validate_concurrently_in_threads(fresh_registry):
+    pytest.importorskip("z3")
+    source = '''# Model
+
+```python:validate
+from z3 import Reals
+x, y, z = Reals("x y z")
+Axiom("A1", statement="y exceeds x", z3_expr=lambda: y > x, description="Step")
+Axiom("A2", statement="z exceeds y", z3_expr=lambda: z > y, description="Step")
+Property("P1", claim="z exceeds x", z3_expr=lambda: z > x, given=["A1", "A2"],
+         description="Chain")
+Property("P2", claim="y exceeds x", z3_expr=lambda: y > x, given=["A1"],
+         description="Step")
+```
+'''
+
+    def check(_):
+        with use_registry():
+            result = check_document(source, proof_cache=False)
+        return result.passed, sorted(r.status for r in result.verification.properties.values())
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = list(pool.map(check, range(64)))
+    assert outcomes == [(True, ["verified", "verified"])] * 64
+
+
+def test_threads_with_forked_constraint_workers(fresh_registry):
+    """jobs > 1 pools must evaluate their own thread's registry."""
+    def check(k):
+        source = f'''# Model
+
+```python:fixture
+W = ["a", "b", "c"]
+cap{k} = {{w: {k} for w in W}}
+```
+
+```python:validate
+Set("W", description="Workers")
+Parameter("cap{k}", index="W", units="hours", description="Capacity")
+Constraint("c{k}a", over="W", expr=lambda i: cap{k}[i] == {k})
+Constraint("c{k}b", over="W", expr=lambda i: cap{k}[i] >= 0)
+```
+'''
+        with use_registry():
+            result = execute_blocks(parse_document(source), jobs=2)
+        return result.passed, result.errors
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outcomes = list(pool.map(check, range(24)))
+    assert outcomes == [(True, [])] * 24
+
+
+def test_asyncio_tasks_get_separate_registries(fresh_registry):
+    async def declare(name):
+        with use_registry() as reg:
+            Set("W", description="Workers")
+            await asyncio.sleep(0)  # let the other task register in between
+            Parameter(name, index="W", description="Param")
+            await asyncio.sleep(0)
+            return set(reg.symbols)
+
+    async def main():
+        return await asyncio.gather(declare("a"), declare("b"))
+
+    assert asyncio.run(main()) == [{"W", "a"}, {"W", "b"}]
+
+
+def test_incremental_executor_restarts_under_another_registry(fresh_registry):
+    executor = IncrementalExecutor()
+    blocks = parse_document(_doc(2))
+    assert executor.execute(blocks).passed
+    with use_registry() as reg:
+        result = executor.execute(parse_document(_doc(2)))
+    assert result.passed and result.registry is reg
+    assert executor.reused_blocks == 0
+    assert executor.execute(parse_document(_doc(2))).passed
+    assert executor.reused_blocks == 0  # back on the global registry
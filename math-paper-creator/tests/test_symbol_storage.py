@@ -0,0 +1,54 @@
+"""Tests for slotted symbol records and shared index/unit tables."""
+import dataclasses
+import sys
+
+import pytest
+
+from meta_compiler import Parameter, Set, Variable
+from meta_compiler.symbols import ParameterSymbol, SetSymbol, intern_index, unit_of
+from meta_compiler.units import parse_unit
+
+
+def test_symbols_are_slotted_and_frozen():
+    sym = SetSymbol(name="W", description="Workers")
+    assert not hasattr(sym, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sym.name = "P"
+
+
+def test_names_are_interned():
+    dynamic = "".join(["wor", "kers"])
+    sym = SetSymbol(name=dynamic, description="")
+    assert sym.name is sys.intern("workers")
+
+
+def test_index_tuples_shared_across_symbols(fresh_registry):
+    Set("W", description="Workers")
+    Set("P", description="Projects")
+    Parameter("a", index=["W", "P"], units="hours", description="")
+    Variable("b", index=("W", "P"), units="hours", description="")
+    assert fresh_registry.symbols["a"].index is fresh_registry.symbols["b"].index
+    assert intern_index(("W", "P")) is fresh_registry.symbols["a"].index
+
+
+def test_units_shared_and_parsed_once():
+    a = ParameterSymbol(name="a", index=None, domain="real",
+                        units="".join(["hours/", "headcount"]), description="")
+    b = ParameterSymbol(name="b", index=None, domain="real",
+                        units="hours/headcount", description="")
+    assert a.units is b.units
+    assert unit_of(a.units) is unit_of(b.units)
+    assert unit_of(a.units) == parse_unit("hours/headcount")
+
+
+def test_registration_order_follows_symbols(fresh_registry):
+    Set("W", description="Workers")
+    Parameter("cap", index="W", units="hours", description="")
+    assert fresh_registry._registration_order == ["W", "cap"]
+    assert fresh_registry.access_log == set()
+
+
+def test_equality_and_hash_unchanged():
+    a = SetSymbol(name="W", description="Workers")
+    b = SetSymbol(name="W", description="Workers")
+    assert a == b and hash(a) == hash(b)
@@ -146,3 +146,44 @@ def test_multiply_then_compare_compatible(fresh_registry):
     result = fresh_registry.run_tests()
     unit_errors = [e for e in result.errors if "unit" in e.lower()]
     assert len(unit_errors) == 0, f"Unexpected unit errors: {unit_errors}"
+
+
+def test_power_combines_units(fresh_registry):
+    """length**2 compared to an area parameter: OK; compared to hours: error."""
+    fresh_registry.data_store["W"] = ["alice"]
+    fresh_registry.data_store["side"] = {"alice": 2.0}
+    fresh_registry.data_store["area"] = {"alice": 5.0}
+    fresh_registry.data_store["cap"] = {"alice": 8}
+
+    Set("W", description="Workers")
+    Parameter("side", index="W", units="meters", description="Side")
+    Parameter("area", index="W", units="meters^2", description="Area")
+    Parameter("cap", index="W", units="hours", description="Capacity")
+
+    Constraint("area_ok", expr=lambda i: side[i] ** 2 <= area[i],
+               over="W", description="Square vs area")
+    Constraint("area_bad", expr=lambda i: side[i] ** 2 <= cap[i],
+               over="W", description="Square vs hours")
+
+    result = fresh_registry.run_tests()
+    unit_errors = [e for e in result.errors if "unit" in e.lower()]
+    assert unit_errors == [
+        'Constraint "area_bad": incompatible units in comparison: "meters^2" vs "hours"'
+    ]
+
+
+def test_fractional_power_units_register(fresh_registry):
+    """Fractional exponents are valid units; root * root combines to the base unit."""
+    fresh_registry.data_store["W"] = ["alice"]
+    fresh_registry.data_store["root"] = {"alice": 2.0}
+    fresh_registry.data_store["area"] = {"alice": 5.0}
+
+    Set("W", description="Workers")
+    Parameter("root", index="W", units="meters^0.5", description="Root length")
+    Parameter("area", index="W", units="meters", description="Length")
+
+    Constraint("root_ok", expr=lambda i: root[i] * root[i] <= area[i],
+               over="W", description="Square of root vs length")
+
+    result = fresh_registry.run_tests()
+    assert [e for e in result.errors if "unit" in e.lower()] == []
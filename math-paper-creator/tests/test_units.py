@@ -1,4 +1,4 @@
-from meta_compiler.units import Unit, parse_unit, units_compatible, units_multiply, units_divide
+from meta_compiler.units import Unit, parse_unit, units_compatible, units_multiply, units_divide, units_power
 
 
 def test_base_unit():
@@ -62,3 +62,45 @@ def test_unit_str():
     assert str(parse_unit("hours")) == "hours"
     assert str(parse_unit("dimensionless")) == "dimensionless"
     assert str(parse_unit("hours/headcount")) == "hours/headcount"
+
+
+def test_units_are_interned():
+    assert parse_unit("hours/headcount") is Unit(numer=("hours",), denom=("headcount",))
+    assert units_multiply(parse_unit("hours"), parse_unit("dollars")) is parse_unit("dollars*hours")
+
+
+def test_powers():
+    hours = parse_unit("hours")
+    assert units_multiply(hours, hours) is parse_unit("hours^2")
+    assert parse_unit("hours**2") is parse_unit("hours^2")
+    assert units_power(hours, 2) is parse_unit("hours^2")
+    assert units_power(parse_unit("hours/headcount"), -1) is parse_unit("headcount/hours")
+    assert str(parse_unit("hours*hours/headcount")) == "hours^2/headcount"
+    assert parse_unit("hours^2").numer == ("hours", "hours")
+
+
+def test_unitless_factors():
+    assert str(parse_unit("1/hours")) == "1/hours"
+    assert units_divide(parse_unit("dimensionless"), parse_unit("hours")) is parse_unit("1/hours")
+
+
+def test_fractional_power():
+    root = parse_unit("meters^0.5")
+    assert str(root) == "meters^0.5"
+    assert units_multiply(root, root) is parse_unit("meters")
+    assert units_power(root, 4) is parse_unit("meters^2")
+    assert parse_unit("meters**0.5") is root
+    assert str(parse_unit("1/meters^0.5")) == "1/meters^0.5"
+
+
+def test_non_numeric_power_is_opaque():
+    assert str(parse_unit("hours^x")) == "hours^x"
+    assert not units_compatible(parse_unit("hours^x"), parse_unit("hours"))
+
+
+def test_pickle_keeps_identity():
+    import pickle
+    u = parse_unit("dollars/hours^2")
+    assert pickle.loads(pickle.dumps(u)) is u
+    root = parse_unit("meters^0.5/hours")
+    assert pickle.loads(pickle.dumps(root)) is root
@@ -55,3 +55,159 @@ class TestVerificationResultDataclass:
     def test_failed_result_with_counterexample(self):
         r = VerificationResult(status="failed", counterexample={"H": 1, "M": 2})
         assert r.counterexample == {"H": 1, "M": 2}
+
+
+class TestVerifyModel:
+    def test_groups_share_one_solver(self, monkeypatch):
+        from meta_compiler import verification
+
+        H, M = z3.Reals("H M")
+        axioms = {"A1": lambda: H > 0, "A2": lambda: M >= 0, "A3": lambda: M <= H}
+        properties = {
+            "P1": (("A1", "A2", "A3"), lambda: H - M >= 0),
+            "P2": (("A3", "A1", "A2"), lambda: H > -1),
+            "P3": (("A1",), lambda: H >= 0),
+            "P4": (("A1", "X"), lambda: H > 1),
+            "P5": (("X",), lambda: H > 1),
+        }
+        solvers = []
+        real_solver = z3.Solver
+        monkeypatch.setattr(z3, "Solver", lambda: solvers.append(real_solver()) or solvers[-1])
+        result = verification.verify_model(axioms, properties)
+
+        assert result.consistency.status == "consistent"
+        assert {n: r.status for n, r in result.properties.items()} == {
+            "P1": "verified", "P2": "verified", "P3": "verified", "P4": "failed",
+        }
+        assert result.properties["P4"].counterexample
+        # One solver for all three axioms (shared with consistency), one for {A1}
+        assert len(solvers) == 2
+        assert all(s.num_scopes() == 0 for s in solvers)
+
+    def test_timings_breakdown(self):
+        from meta_compiler.verification import verify_model
+
+        H = z3.Real("H")
+        result = verify_model({"A1": lambda: H > 0}, {"P1": (("A1",), lambda: H > 1)})
+        assert set(result.consistency.timings) == {"build", "assert", "check"}
+        prop = result.properties["P1"]
+        assert set(prop.timings) == {"build", "assert", "check", "model"}
+        assert prop.duration_s == pytest.approx(sum(prop.timings.values()))
+
+    def test_broken_axiom_only_fails_its_properties(self):
+        from meta_compiler.verification import verify_model
+
+        H = z3.Real("H")
+
+        def broken():
+            raise ValueError("bad axiom")
+
+        result = verify_model(
+            {"A1": lambda: H > 0, "A2": broken},
+            {"P1": (("A1",), lambda: H > -1), "P2": (("A2",), lambda: H > -1)},
+        )
+        assert (result.consistency.status, result.consistency.error) == ("error", "bad axiom")
+        assert result.properties["P1"].status == "verified"
+        assert result.properties["P2"].error == "bad axiom"
+
+    def test_timeout_status(self):
+        from meta_compiler.verification import verify_model
+
+        # Nonlinear integer arithmetic that z3 cannot settle within 1 ms
+        x, y, z = z3.Ints("x y z")
+        result = verify_model(
+            {"A1": lambda: z3.And(x > 0, y > 0, z > 0)},
+            {"P1": (("A1",), lambda: x**3 + y**3 != z**3)},
+            timeout_ms=1,
+        )
+        prop = result.properties["P1"]
+        assert prop.status == "timeout"
+        assert "1 ms" in prop.error
+
+
+class TestVerifyModelPool:
+    @pytest.fixture
+    def stalling(self, monkeypatch):
+        """Make checks of claims mentioning ``H > 5`` hang past z3's timeout."""
+        import time
+        from meta_compiler import verification
+
+        real = verification._Prover.implication
+
+        def implication(self, claim, timings):
+            if "H > 5" in str(claim):
+                time.sleep(30)
+            return real(self, claim, timings)
+
+        monkeypatch.setattr(verification._Prover, "implication", implication)
+        monkeypatch.setattr(verification, "_KILL_GRACE_S", 0.1)
+        H = z3.Real("H")
+        axioms = {"A1": lambda: H > 0}
+        properties = {
+            "P0": (("A1",), lambda: H > -1),
+            "P1": (("A1",), lambda: H > 5),
+            "P2": (("A1",), lambda: H > -2),
+        }
+        return axioms, properties
+
+    def test_stalled_check_is_killed_and_group_resumes(self, stalling):
+        from meta_compiler.verification import verify_model
+
+        result = verify_model(*stalling, timeout_ms=100)
+        statuses = {n: r.status for n, r in result.properties.items()}
+        assert statuses == {"P0": "verified", "P1": "timeout", "P2": "verified"}
+        assert result.properties["P1"].error == "no result after 100 ms"
+
+    def test_deadline_times_out_unfinished_checks(self, stalling):
+        import time
+        from meta_compiler.verification import verify_model
+
+        start = time.monotonic()
+        result = verify_model(*stalling, deadline_s=0.5, jobs=2)
+        assert time.monotonic() - start < 5
+        assert result.consistency.status == "consistent"
+        assert result.properties["P0"].status == "verified"
+        for name in ("P1", "P2"):
+            assert result.properties[name].status == "timeout"
+            assert "deadline of 0.5 s" in result.properties[name].error
+
+    def test_jobs_match_serial_results(self):
+        from meta_compiler.verification import verify_model
+
+        H, M = z3.Reals("H M")
+        axioms = {"A1": lambda: H > 0, "A2": lambda: M <= H}
+        properties = {
+            "P1": (("A1", "A2"), lambda: H - M >= 0),
+            "P2": (("A1",), lambda: H > 1),
+        }
+        serial = verify_model(axioms, properties)
+        pooled = verify_model(axioms, properties, jobs=2)
+        assert pooled.consistency.status == serial.consistency.status
+        assert ({n: r.status for n, r in pooled.properties.items()}
+                == {n: r.status for n, r in serial.properties.items()})
+
+
+class TestUnsatCores:
+    def test_contradiction_core_is_minimal(self):
+        H, M = z3.Reals("H M")
+        result = check_axiom_consistency([lambda: H > 0, lambda: M >= 0, lambda: H < 0])
+        assert result.status == "contradictory"
+        assert result.core == ["0", "2"]
+
+    def test_property_core_names_needed_axioms(self):
+        H, M = z3.Reals("H M")
+        axioms = {"A1": lambda: H > 0, "A2": lambda: M >= 0, "A3": lambda: M <= H}
+        result = check_property(axioms, lambda: H - M >= 0)
+        assert (result.status, result.core) == ("verified", ["A3"])
+
+    def test_valid_claim_needs_no_axioms(self):
+        H = z3.Real("H")
+        result = check_property({"A1": lambda: H > 0}, lambda: z3.Or(H > 0, H <= 0))
+        assert result.core == []
+
+    def test_counterexample_omits_assumption_literals(self):
+        H = z3.Real("H")
+        result = check_property({"A1": lambda: H > 0}, lambda: H > 1)
+        assert result.status == "failed"
+        assert list(result.counterexample) == ["H"]
+        assert result.core is None